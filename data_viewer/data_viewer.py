@@ -6,7 +6,9 @@
 import sys
 import os
 import sqlite3
+import numpy as np
 from pathlib import Path  # Import Path to handle filesystem paths
+from ternary_density import TernaryDensity
 
 # Set up logging
 logging.basicConfig(
@@ -52,6 +54,19 @@ def log_table_contents(db_path):
     except Exception as e:
         logger.error(f"Error logging table contents: {e}", exc_info=True)
 
+@st.cache_data(show_spinner="Binning responses...")
+def compute_ternary_density(_df, data_key, versions, sources, resolution, scale):
+    """Density image for one filter set; the DataFrame is identified by data_key instead of being hashed"""
+    filtered_df = _df
+    if versions:
+        filtered_df = filtered_df[filtered_df['version'].isin(versions)]
+    if sources:
+        filtered_df = filtered_df[filtered_df['source'].isin(sources)]
+
+    density = TernaryDensity(resolution=resolution)
+    density.add(filtered_df['n1'].to_numpy(), filtered_df['n2'].to_numpy(), filtered_df['n3'].to_numpy())
+    return density.to_image(scale=scale), density.total
+
 class SurveyDataViewer:
     def __init__(self, db_path: str = None):
         """Initialize viewer with database connection"""
@@ -234,6 +249,49 @@ def show_score_distribution(self):
             plt.tight_layout()
             st.pyplot(fig)
 
+    def show_ternary_density(self):
+        """Show the population density on the ternary triangle"""
+        st.header("Ternary Density")
+
+        if self.responses_df.empty:
+            st.warning("No response data available yet.")
+            return
+
+        with st.expander("Filter Options"):
+            col1, col2 = st.columns(2)
+            with col1:
+                selected_version = st.multiselect("Filter by Version", options=self.responses_df['version'].unique())
+            with col2:
+                selected_source = st.multiselect("Filter by Source", options=self.responses_df['source'].unique())
+            col3, col4 = st.columns(2)
+            with col3:
+                resolution = st.slider("Grid Resolution", min_value=10, max_value=200, value=50, step=10)
+            with col4:
+                scale = st.radio("Color Scale", ["log", "linear"], horizontal=True)
+
+        # Identifies the loaded data so a reload invalidates cached images
+        data_key = (len(self.responses_df), str(self.responses_df['timestamp'].max()))
+        image, total = compute_ternary_density(
+            self.responses_df, data_key, tuple(sorted(selected_version)), tuple(sorted(selected_source)),
+            resolution, scale
+        )
+        st.write(f"Responses plotted: {total}")
+
+        fig, ax = plt.subplots(figsize=(10, 8))
+        height = np.sqrt(3) / 2
+        im = ax.imshow(image, origin='lower', extent=(0, 1, 0, height), cmap='viridis', interpolation='nearest')
+        ax.plot([0, 1, 0.5, 0], [0, 0, height, 0], color='black', linewidth=1.5)
+        ax.text(0.5, height + 0.03, "Modern", ha='center', va='bottom', fontsize=14)
+        ax.text(0, -0.03, "PostModern", ha='center', va='top', fontsize=14)
+        ax.text(1, -0.03, "PreModern", ha='center', va='top', fontsize=14)
+        ax.set_xlim(-0.1, 1.1)
+        ax.set_ylim(-0.1, height + 0.1)
+        ax.set_aspect('equal')
+        ax.axis('off')
+        fig.colorbar(im, ax=ax, shrink=0.7, label='log(1 + responses)' if scale == "log" else 'Responses')
+        plt.tight_layout()
+        st.pyplot(fig)
+
 def main():
     st.title("Survey Data Viewer")
 
@@ -258,12 +316,14 @@ def main():
     try:
         viewer = SurveyDataViewer(db_path=default_db_path)
 
-        page = st.sidebar.radio("Select View", ["Response Analysis", "Score Distribution"])
+        page = st.sidebar.radio("Select View", ["Response Analysis", "Score Distribution", "Ternary Density"])
 
         if page == "Response Analysis":
             viewer.show_response_analysis()
         elif page == "Score Distribution":
             viewer.show_score_distribution()
+        elif page == "Ternary Density":
+            viewer.show_ternary_density()
 
         if st.sidebar.checkbox("Show Debug Info"):
             st.sidebar.json({
@@ -0,0 +1,113 @@
+"""
+Triangular binning and rasterization of survey scores on the ternary simplex.
+
+Points are binned from their (n1, n2, n3) scores rather than the stored
+plot_x/plot_y, since the two apps have written those with different formulas.
+The layout matches TernaryPlotter: PreModern (n1) bottom right, Modern (n2)
+at the top and PostModern (n3) bottom left.
+
+The triangle is divided into resolution**2 small triangles. A point with
+barycentric coordinates (a, b, c) falls in the cell whose corner indices are
+(floor(a*k), floor(b*k), floor(c*k)); "up" cells have indices summing to k-1
+and "down" cells to k-2. Binning is one vectorized pass with np.bincount, and
+rasterization is a lookup into a pixel-to-cell table computed once per size.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+SQRT3_2 = np.sqrt(3) / 2
+SCALES = ("linear", "log")
+
+def _cell_ids(a, b, c, resolution):
+    """Map normalized barycentric coordinates to flat cell ids (vectorized)."""
+    k = resolution
+    scaled = np.stack([a, b, c]) * k
+    idx = np.minimum(np.floor(scaled), k - 1).astype(np.int64)
+
+    # Points on a grid line, or off by rounding, can land one step outside a
+    # valid cell; nudge the coordinate that is closest to its neighbouring line
+    frac = scaled - idx
+    overflow = np.flatnonzero(idx.sum(axis=0) > k - 1)
+    if overflow.size:
+        candidates = np.where(idx[:, overflow] > 0, frac[:, overflow], np.inf)
+        idx[np.argmin(candidates, axis=0), overflow] -= 1
+    underflow = np.flatnonzero(idx.sum(axis=0) < k - 2)
+    if underflow.size:
+        candidates = np.where(idx[:, underflow] < k - 1, frac[:, underflow], -np.inf)
+        idx[np.argmax(candidates, axis=0), underflow] += 1
+
+    down = (idx.sum(axis=0) == k - 2).astype(np.int64)
+    return 2 * (idx[0] * k + idx[1]) + down
+
+@lru_cache(maxsize=8)
+def _pixel_lookup(resolution, width):
+    """Cell id for every pixel of a width-wide raster, or -1 outside the triangle."""
+    height = int(round(width * SQRT3_2))
+    x = (np.arange(width) + 0.5) / width
+    y = (np.arange(height) + 0.5) / height * SQRT3_2
+    px, py = np.meshgrid(x, y)
+
+    b = py / SQRT3_2
+    a = px - b / 2
+    c = 1 - a - b
+    inside = (a >= 0) & (c >= 0)
+
+    ids = np.full(px.shape, -1, dtype=np.int64)
+    ids[inside] = _cell_ids(a[inside], b[inside], c[inside], resolution)
+    ids.setflags(write=False)
+    return ids
+
+class TernaryDensity:
+    """Accumulates point counts per triangular cell of the simplex."""
+
+    def __init__(self, resolution: int = 50):
+        if resolution < 1:
+            raise ValueError("resolution must be at least 1")
+        self.resolution = resolution
+        self.counts = np.zeros(2 * resolution * resolution, dtype=np.int64)
+        self.total = 0
+
+    def add(self, n1, n2, n3):
+        """
+        Bin a batch of points; can be called repeatedly to stream large tables.
+
+        Args:
+            n1, n2, n3: Array-likes of PreModern, Modern and PostModern scores.
+                Rows are normalized to sum to 1; rows summing to zero are skipped.
+        """
+        scores = np.column_stack([n1, n2, n3]).astype(np.float64)
+        totals = scores.sum(axis=1)
+        valid = np.isfinite(totals) & (totals > 0) & (scores >= 0).all(axis=1)
+        if not valid.any():
+            return self
+
+        normalized = scores[valid] / totals[valid, None]
+        ids = _cell_ids(normalized[:, 0], normalized[:, 1], normalized[:, 2], self.resolution)
+        self.counts += np.bincount(ids, minlength=self.counts.size)
+        self.total += int(valid.sum())
+        return self
+
+    def to_image(self, width: int = 600, scale: str = "log") -> np.ndarray:
+        """
+        Rasterize the counts into a (height, width) float image.
+
+        Row 0 is the bottom edge of the triangle, so display with origin='lower'.
+        Pixels outside the triangle are NaN.
+
+        Args:
+            width: Image width in pixels; height follows the triangle's aspect
+            scale: 'linear' for raw counts or 'log' for log(1 + count)
+        """
+        if scale not in SCALES:
+            raise ValueError(f"scale must be one of {SCALES}")
+        values = self.counts.astype(np.float64)
+        if scale == "log":
+            values = np.log1p(values)
+
+        ids = _pixel_lookup(self.resolution, width)
+        image = np.full(ids.shape, np.nan)
+        inside = ids >= 0
+        image[inside] = values[ids[inside]]
+        return image
@@ -1,4 +1,6 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from sqlalchemy.sql import text
@@ -27,7 +29,16 @@ class SurveyResponse(BaseModel):
     region: Optional[str] = None
     source: str = 'test'
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Connect in the background so a slow database does not hold up startup
+    if db_manager is not None:
+        db_manager.start_warm_up()
+    yield
+    if db_manager is not None:
+        db_manager.stop_warm_up()
+
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -50,6 +61,19 @@ class SurveyResponse(BaseModel):
 async def test_endpoint():
     return {"message": "test endpoint working"}
 
+@app.get("/api/live")
+async def liveness():
+    """The process is up and serving; says nothing about the database"""
+    return {"status": "alive"}
+
+@app.get("/api/ready")
+async def readiness():
+    """503 until the database has accepted a connection"""
+    if db_manager is None:
+        return JSONResponse({"ready": False, "last_error": "Database manager failed to initialize"}, status_code=503)
+    status = db_manager.readiness()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
 @app.get("/api/health")
 async def health_check():
     if db_manager is None:
@@ -5,6 +5,8 @@
 import logging
 import urllib.parse
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -23,6 +25,11 @@ def __init__(self):
         
         self._engine = None
         self._SessionLocal = None
+        self.ready_connections = int(os.getenv('DB_READY_CONNECTIONS', '1'))
+        self.last_error = None
+        self._ready = threading.Event()
+        self._stopping = threading.Event()
+        self._warm_up_thread = None
         self._initialize()
 
     def _initialize(self):
@@ -60,16 +67,56 @@ def _initialize(self):
                 autoflush=False,
                 bind=self._engine
             )
-            
-            # Test connection
-            with self._engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-                logger.info("Database connection successful")
+            # No connection is made here; warm_up() opens them in the background
 
         except Exception as e:
             logger.error(f"Database connection error: {str(e)}")
             raise
 
+    @property
+    def is_ready(self) -> bool:
+        """True once `ready_connections` connections are open in the engine's pool"""
+        return self._ready.is_set()
+
+    def readiness(self) -> dict:
+        return {
+            "ready": self.is_ready,
+            "required_connections": self.ready_connections,
+            "last_error": self.last_error
+        }
+
+    def start_warm_up(self) -> threading.Thread:
+        """Start warm_up() on a daemon thread, unless it is already running or done"""
+        if self._warm_up_thread is None:
+            self._warm_up_thread = threading.Thread(target=self.warm_up, name="db-warm-up", daemon=True)
+            self._warm_up_thread.start()
+        return self._warm_up_thread
+
+    def stop_warm_up(self):
+        self._stopping.set()
+
+    def warm_up(self, retry_delay: float = 1.0, max_delay: float = 30.0):
+        """Open `ready_connections` connections, retrying with backoff; they stay in the pool"""
+        delay = retry_delay
+        while not self._ready.is_set() and not self._stopping.is_set():
+            connections = []
+            try:
+                for _ in range(self.ready_connections):
+                    connections.append(self._engine.connect())
+                    connections[-1].execute(text("SELECT 1"))
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning(f"Database warm-up failed, retrying in {delay:.0f}s: {e}")
+                self._stopping.wait(delay)
+                delay = min(delay * 2, max_delay)
+                continue
+            finally:
+                for conn in connections:
+                    conn.close()  # Back to the pool, still open
+            self.last_error = None
+            self._ready.set()
+            logger.info("Database ready")
+
     @contextmanager
     def get_session(self) -> Session:
         if not self._SessionLocal:
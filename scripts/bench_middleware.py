@@ -0,0 +1,147 @@
+# scripts/bench_middleware.py
+"""
+Compare the per-request cost of worldview-fastapi's middleware stacks.
+
+Drives each stack in-process through ASGI (no server, no sockets), so the
+numbers are the framework and middleware overhead alone:
+
+    baseline  @app.middleware("http") security headers + StaticFiles subclass
+              fixing the .jsx content type (the stack this replaced)
+    asgi      the pure ASGI SecurityHeadersMiddleware, with static files served
+              from StaticAssets (which sets the .jsx content type itself)
+    asgi+gz   the same plus CompressionMiddleware, client accepting gzip
+
+    python scripts/bench_middleware.py
+    python scripts/bench_middleware.py --requests 20000
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+APP_DIR = ROOT / "worldview-fastapi"
+sys.path.insert(0, str(APP_DIR))
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.staticfiles import StaticFiles  # noqa: E402
+
+from src.api.asgi_middleware import CompressionMiddleware, SecurityHeadersMiddleware  # noqa: E402
+from src.api.static_assets import StaticAssets  # noqa: E402
+
+HEADERS = {
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Content-Security-Policy": "default-src 'self' https:; img-src 'self' https: data:"
+}
+
+def add_routes(app: FastAPI):
+    @app.get("/api/small")
+    async def small():
+        return {"status": "alive"}
+
+    @app.get("/api/large")
+    async def large():
+        return {"rows": [{"id": i, "text": "Truth is discovered through empirical evidence."} for i in range(40)]}
+
+def baseline_app() -> FastAPI:
+    app = FastAPI()
+    add_routes(app)
+
+    class JSXStaticFiles(StaticFiles):
+        async def get_response(self, path: str, scope):
+            response = await super().get_response(path, scope)
+            if path.endswith('.jsx'):
+                response.headers['content-type'] = 'text/javascript'
+            return response
+
+    app.mount("/static", JSXStaticFiles(directory=APP_DIR / "static"), name="static")
+
+    @app.middleware("http")
+    async def add_security_headers(request, call_next):
+        response = await call_next(request)
+        for name, value in HEADERS.items():
+            response.headers[name] = value
+        return response
+
+    return app
+
+def asgi_app(compress: bool) -> FastAPI:
+    app = FastAPI()
+    add_routes(app)
+    static_assets = StaticAssets(APP_DIR / "static")
+
+    @app.get("/static/{path:path}")
+    async def static_file(path: str, request: Request):
+        return static_assets.response(path, request)
+
+    if compress:
+        app.add_middleware(CompressionMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware, headers=HEADERS)
+    return app
+
+async def call(app, path: str, headers: List) -> int:
+    """One GET through the ASGI app; returns the number of body bytes"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": headers, "client": ("127.0.0.1", 1), "server": ("testserver", 80)
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sum(len(message.get("body", b"")) for message in sent if message["type"] == "http.response.body")
+
+async def bench(app, path: str, headers: List, requests: int) -> Dict:
+    for _ in range(min(200, requests)):  # Warm up routing and caches
+        await call(app, path, headers)
+    timings = []
+    size = 0
+    for _ in range(requests):
+        started = time.perf_counter()
+        size = await call(app, path, headers)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return {
+        "mean_us": statistics.fmean(timings) * 1e6,
+        "p50_us": timings[len(timings) // 2] * 1e6,
+        "p99_us": timings[int(len(timings) * 0.99)] * 1e6,
+        "bytes": size
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="requests per stack and path")
+    args = parser.parse_args()
+
+    stacks: Dict[str, Callable] = {
+        "baseline": lambda: (baseline_app(), []),
+        "asgi": lambda: (asgi_app(compress=False), []),
+        "asgi+gz": lambda: (asgi_app(compress=True), [(b"accept-encoding", b"gzip")]),
+    }
+    paths = ["/api/small", "/api/large", "/static/components/TernaryPlot.jsx"]
+
+    print(f"{'path':<38} {'stack':<9} {'mean':>9} {'p50':>9} {'p99':>9} {'bytes':>7}")
+    for path in paths:
+        baseline = None
+        for name, build in stacks.items():
+            app, headers = build()
+            result = asyncio.run(bench(app, path, headers, args.requests))
+            baseline = baseline or result["mean_us"]
+            print(f"{path:<38} {name:<9} {result['mean_us']:>7.0f}us {result['p50_us']:>7.0f}us "
+                  f"{result['p99_us']:>7.0f}us {result['bytes']:>7}  ({result['mean_us'] / baseline:.2f}x)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,21 @@
+# scripts/build_font_cache.py
+"""
+Build matplotlib's font list ahead of time, so a new instance's first chart
+does not pay for it. Run after installing requirements (and packages.txt):
+
+    python scripts/build_font_cache.py
+
+Uses MPLCONFIGDIR if set, otherwise the directory the app reads at runtime.
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.visualization.plot_fonts import font_cache_dir, warm_up, plot_font
+
+if __name__ == "__main__":
+    started = time.perf_counter()
+    warm_up()
+    print(f"Font cache ready in {font_cache_dir()} ({time.perf_counter() - started:.2f}s); chart font: {plot_font()}")
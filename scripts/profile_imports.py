@@ -0,0 +1,105 @@
+# scripts/profile_imports.py
+"""
+Measure the import cost of each app's entry point, as paid on a cold start.
+
+Runs the top-level import statements of each entry file (not the rest of the
+module, which would connect to the database) in a fresh interpreter with
+`python -X importtime`, reports the most expensive modules and exits with
+status 1 if the total exceeds the app's budget.
+
+    python scripts/profile_imports.py                  # both apps
+    python scripts/profile_imports.py fastapi --top 20
+    python scripts/profile_imports.py streamlit --budget-ms 900
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Entry file, directory it runs from, import budget in milliseconds
+TARGETS = {
+    "streamlit": (ROOT / "src" / "ui" / "streamlit_app.py", ROOT, 800),
+    "fastapi": (ROOT / "worldview-fastapi" / "main.py", ROOT / "worldview-fastapi", 900),
+}
+
+def entry_imports(path: Path) -> str:
+    """The module-level import statements of an entry file"""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+def import_times(code: str, cwd: Path) -> List[Tuple[int, int, int, str]]:
+    """(depth, self us, cumulative us, module) for every import made by code"""
+    env = {**os.environ, "PYTHONPATH": str(cwd)}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=cwd, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Imports failed in {cwd}:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+def profile(name: str, runs: int) -> Tuple[float, List[Tuple[int, int, int, str]]]:
+    """Best total over `runs` fresh interpreters, in ms, and that run's imports"""
+    path, cwd, _ = TARGETS[name]
+    code = entry_imports(path)
+    startup = {module for _, _, _, module in import_times("pass", cwd)}
+
+    best = None
+    for _ in range(runs):
+        rows = [row for row in import_times(code, cwd) if row[3] not in startup]
+        total = sum(cumulative for depth, _, cumulative, _ in rows if depth == 0) / 1000
+        if best is None or total < best[0]:
+            best = (total, rows)
+    return best
+
+def report(name: str, total: float, rows: List[Tuple[int, int, int, str]], budget: float, top: int):
+    print(f"\n{name}: {total:.0f} ms of imports (budget {budget:.0f} ms)")
+    print(f"  {'cumulative':>10}  {'self':>8}  module")
+    direct = sorted((row for row in rows if row[0] == 0), key=lambda row: -row[2])
+    for _, self_us, cumulative_us, module in direct[:top]:
+        print(f"  {cumulative_us / 1000:>8.1f}ms  {self_us / 1000:>6.1f}ms  {module}")
+
+    heaviest: Dict[str, int] = {}
+    for _, self_us, _, module in rows:
+        package = module.split(".")[0]
+        heaviest[package] = heaviest.get(package, 0) + self_us
+    print("  by package: " + ", ".join(
+        f"{package} {us / 1000:.0f}ms" for package, us in sorted(heaviest.items(), key=lambda item: -item[1])[:top]))
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("apps", nargs="*", metavar="app", help=f"any of {', '.join(TARGETS)} (default: all)")
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters per app; the fastest counts")
+    parser.add_argument("--top", type=int, default=12, help="modules to list")
+    parser.add_argument("--budget-ms", type=float, help="override every app's budget")
+    args = parser.parse_args()
+    for name in args.apps:
+        if name not in TARGETS:
+            parser.error(f"unknown app {name!r}")
+
+    over_budget = []
+    for name in args.apps or TARGETS:
+        budget = args.budget_ms or TARGETS[name][2]
+        total, rows = profile(name, args.runs)
+        report(name, total, rows, budget, args.top)
+        if total > budget:
+            over_budget.append(f"{name} ({total:.0f} ms > {budget:.0f} ms)")
+
+    if over_budget:
+        print("\nImport budget exceeded: " + ", ".join(over_budget))
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
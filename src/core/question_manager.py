@@ -1,5 +1,22 @@
 import json
+import math
 import random
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple
+
+@dataclass(frozen=True, slots=True)
+class Response:
+    """One answer option, parsed once when the questions are loaded"""
+    question: str
+    r_value: int
+    text: str
+    scores: Tuple[int, int, int]  # [PreModern, Modern, PostModern]
+
+@dataclass(frozen=True, slots=True)
+class SessionScores:
+    """Scores for a set of answers"""
+    totals: Tuple[int, int, int]
+    individual: List[Tuple[int, int, int]]  # In question order, answered questions only
 
 class QuestionManager:
     def __init__(self, json_file_path):
@@ -7,38 +24,119 @@ def __init__(self, json_file_path):
         with open(json_file_path, "r") as file:
             self.data = json.load(file)["questions"]
 
+        # Parse every response once into immutable records
+        self._keys = list(self.data.keys())
+        self._question_index = {q_key: i for i, q_key in enumerate(self._keys)}
+        self._responses: Dict[str, Tuple[Response, ...]] = {
+            q_key: tuple(
+                Response(
+                    question=q_key,
+                    r_value=int(response["id"].split("R")[1]),  # Extract R-value
+                    text=response["text"],
+                    scores=tuple(response["scores"])
+                )
+                for response in question["responses"]
+            )
+            for q_key, question in self.data.items()
+        }
+        self._by_value: Dict[Tuple[str, int], Response] = {
+            (response.question, response.r_value): response
+            for responses in self._responses.values()
+            for response in responses
+        }
+
+        self._positions = {
+            (response.question, response.r_value): position
+            for responses in self._responses.values()
+            for position, response in enumerate(responses)
+        }
+        self._orders: Dict[Tuple[str, int], Tuple[Response, ...]] = {}
+
+        # Dense [question][r_value] -> scores table (None for unused R-values)
+        max_r = max((r_value for _, r_value in self._by_value), default=0)
+        self.score_table = tuple(
+            tuple(
+                self._by_value[(q_key, r_value)].scores if (q_key, r_value) in self._by_value else None
+                for r_value in range(max_r + 1)
+            )
+            for q_key in self._keys
+        )
+
     def get_all_question_keys(self):
         # Return a list of question keys (Q1, Q2, etc.)
-        return list(self.data.keys())
+        return list(self._keys)
 
     def get_question_text(self, q_key):
         # Get the question text for a given question key
         return self.data[q_key]["text"]
 
-    def get_responses(self, q_key):
+    def get_responses(self, q_key) -> Tuple[Response, ...]:
+        """Returns the response records for a given question key, in file order."""
+        return self._responses[q_key]
+
+    def get_response(self, q_key, r_value) -> Optional[Response]:
+        """The response with this R-value, or None if there is no such response"""
+        return self._by_value.get((q_key, r_value))
+
+    def score_session(self, r_values: Mapping[str, Optional[int]]) -> SessionScores:
         """
-        Returns the list of responses for a given question key.
-        Extracts 'r_value' from the 'id' field.
+        Total and per-question scores for {question key: R-value} answers.
+
+        Unanswered questions (None) and unknown R-values are skipped.
         """
-        return [
-            {
-                "text": response["text"],
-                "r_value": int(response["id"].split("R")[1]),  # Extract R-value
-                "scores": response["scores"]
-            }
-            for response in self.data[q_key]["responses"]
-        ]
+        individual = []
+        for q_index, q_key in enumerate(self._keys):
+            r_value = r_values.get(q_key)
+            if r_value is not None and 0 <= r_value < len(self.score_table[q_index]):
+                scores = self.score_table[q_index][r_value]
+                if scores is not None:
+                    individual.append(scores)
+
+        return SessionScores(
+            totals=tuple(sum(column) for column in zip(*individual)) if individual else (0, 0, 0),
+            individual=individual
+        )
+
+    def random_order(self, q_key) -> int:
+        """A random permutation index for a question's responses"""
+        return random.randrange(math.factorial(len(self._responses[q_key])))
+
+    def get_ordered_responses(self, q_key, order: int) -> Tuple[Response, ...]:
+        """The responses for a question in the order given by a permutation index"""
+        ordered = self._orders.get((q_key, order))
+        if ordered is None:
+            remaining = list(self._responses[q_key])
+            ordered, code = [], order
+            for size in range(len(remaining), 0, -1):  # Decode the factorial number system
+                position, code = divmod(code, math.factorial(size - 1))
+                ordered.append(remaining.pop(position))
+            ordered = self._orders[(q_key, order)] = tuple(ordered)
+        return ordered
+
+    def combination_id(self, r_values: Mapping[str, Optional[int]]) -> Optional[int]:
+        """A single integer for a complete set of answers, or None if any is missing"""
+        combination = 0
+        for q_key in reversed(self._keys):
+            position = self._positions.get((q_key, r_values.get(q_key)))
+            if position is None:
+                return None
+            combination = combination * len(self._responses[q_key]) + position
+        return combination
+
+    def answers_for(self, combination_id: int) -> Dict[str, int]:
+        """The {question key: R-value} answers encoded by combination_id"""
+        answers = {}
+        for q_key in self._keys:
+            combination_id, position = divmod(combination_id, len(self._responses[q_key]))
+            answers[q_key] = self._responses[q_key][position].r_value
+        return answers
 
     def get_randomized_responses(self, q_key, session_state):
         """
         Randomize responses for a given question key, keeping the first response static.
-        Ensure responses include 'r_value' fields.
         """
-        responses = self.get_responses(q_key)  # Get raw responses
         top_option = {"text": "Please select a response", "r_value": None}
-        if f"{q_key}_randomized" not in session_state:
-            randomized_responses = responses.copy()
-            random.shuffle(randomized_responses)
-            session_state[f"{q_key}_randomized"] = [top_option] + randomized_responses
+        if f"{q_key}_order" not in session_state:
+            session_state[f"{q_key}_order"] = self.random_order(q_key)
 
-        return session_state[f"{q_key}_randomized"]
\ No newline at end of file
+        return [top_option] + list(self.get_ordered_responses(q_key, session_state[f"{q_key}_order"]))
@@ -1,12 +1,17 @@
 # src/data/db_manager.py
 import mysql.connector
 from mysql.connector import pooling
-import pandas as pd
 import json
+import threading
+import time
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from contextlib import contextmanager
+from src.data.population_sample import population_sample
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -17,59 +22,160 @@ def __init__(self, db_config: Dict[str, str]):
         Args:
             db_config: Dictionary containing connection settings
         """
+        self.db_config = db_config
         self.pool_config = {
             "pool_name": "survey_pool",
             "pool_size": 5,
-            **db_config
         }
-        self.pool = mysql.connector.pooling.MySQLConnectionPool(**self.pool_config)
         logger.debug(f"Initializing MySQLManager with host: {db_config['host']}")
-        with self.get_connection() as conn:
-            logger.debug("Database connection successful")
+        # The pool starts empty; a background thread opens its connections so
+        # pages that don't need the database render without waiting for it
+        self.pool = mysql.connector.pooling.MySQLConnectionPool(**self.pool_config)
+        self.pool.set_config(**db_config)
+        self.warm_connections = 0
+        self.last_error = None
+        self._ready = threading.Event()
+        self._stopping = threading.Event()
+        self._last_healthy = time.monotonic()
+        self._warm_up_thread = threading.Thread(target=self._warm_up, name="survey-pool-warm-up", daemon=True)
+        self._warm_up_thread.start()
+
+    def _warm_up(self, retry_delay: float = 1.0, max_delay: float = 30.0):
+        """Open the pool's connections one at a time, retrying with backoff"""
+        delay = retry_delay
+        while self.warm_connections < self.pool_config["pool_size"] and not self._stopping.is_set():
+            try:
+                # Connect without the pool's lock, which pool.add_connection()
+                # would hold for the whole handshake, blocking get_connection()
+                conn = mysql.connector.connect(**self.db_config)
+                if self._stopping.is_set():
+                    conn.close()
+                    break
+                # Tag it as the pool does, so its first checkout does not reconnect
+                conn.pool_config_version = self.pool._config_version
+                self.pool.add_connection(conn)
+            except mysql.connector.Error as e:
+                self.last_error = str(e)
+                logger.warning(f"Could not open pooled connection, retrying in {delay:.0f}s: {e}")
+                self._stopping.wait(delay)
+                delay = min(delay * 2, max_delay)
+                continue
+            self.warm_connections += 1
+            self.last_error = None
+            delay = retry_delay
+            if not self._ready.is_set():
+                self._last_healthy = time.monotonic()
+                self._ready.set()
+                logger.debug("Database connection successful")
+        if self._stopping.is_set():
+            # Closed while a connection was being added
+            self.pool._remove_connections()
+
+    def close(self):
+        """
+        Stop the warm-up and close the pooled connections.
+
+        Connections that are checked out are closed as they are returned. The
+        manager cannot be used afterwards.
+        """
+        self._stopping.set()
+        closed = self.pool._remove_connections()
+        logger.debug(f"Closed {closed} pooled connections")
+
+    def is_healthy(self, max_age: float = 30.0) -> bool:
+        """
+        Whether the pool can still reach the database.
+
+        A successful check is trusted for `max_age` seconds, so callers can ask
+        on every Streamlit rerun without a round trip each time. While the pool
+        is still connecting this is True: the warm-up retries on its own.
+        """
+        if not self._ready.is_set() or time.monotonic() - self._last_healthy < max_age:
+            return True
+        try:
+            with self.get_connection() as conn:
+                conn.ping(reconnect=True, attempts=1)
+        except Exception as e:
+            logger.warning(f"Database health check failed: {e}")
+            return False
+        self._last_healthy = time.monotonic()
+        return True
+
+    @property
+    def is_warming_up(self) -> bool:
+        """True while the pool is still opening connections"""
+        return self.warm_connections < self.pool_config["pool_size"] and self._warm_up_thread.is_alive()
 
     @contextmanager
-    def get_connection(self):
-        """Get database connection from pool with context management"""
-        conn = self.pool.get_connection()
+    def get_connection(self, timeout: float = 10.0):
+        """Get database connection from pool with context management.
+
+        Waits up to `timeout` seconds for the first connection, and while the
+        pool is still warming up, for an exhausted pool to gain one.
+        """
+        deadline = time.monotonic() + timeout
+        if not self._ready.wait(timeout):
+            raise mysql.connector.errors.PoolError(f"Database is not ready: {self.last_error or 'still connecting'}")
+        conn = None
+        while conn is None:
+            try:
+                conn = self.pool.get_connection()
+            except mysql.connector.errors.PoolError:
+                # More connections are on the way; a full pool would not recover this soon
+                if not self.is_warming_up or time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.05)
         try:
             yield conn
         finally:
             conn.close()
+            if self._stopping.is_set():
+                self.pool._remove_connections()
 
     def save_response(self, responses, scores, metadata):
         """Save a survey response to the database."""
+        self.save_responses([(responses, scores, metadata)])
+
+    def save_responses(self, submissions: List[tuple]):
+        """Save (responses, scores, metadata) survey responses in one transaction."""
+        rows = [
+            (
+                responses.get("Q1"),
+                responses.get("Q2"),
+                responses.get("Q3"),
+                responses.get("Q4"),
+                responses.get("Q5"),
+                responses.get("Q6"),
+                scores[0],  # n1
+                scores[1],  # n2
+                scores[2],  # n3
+                metadata.get("plot_x"),
+                metadata.get("plot_y"),
+                metadata.get("session_id"),
+                metadata.get("hash_email_session"),
+                metadata.get("browser"),
+                metadata.get("region"),
+                metadata.get("source"),
+            )
+            for responses, scores, metadata in submissions
+        ]
         try:
             # Insert into the database
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute(
+                cursor.executemany(
                     '''
                     INSERT INTO survey_results (
                         q1_response, q2_response, q3_response, q4_response, q5_response, q6_response,
                         n1, n2, n3, plot_x, plot_y, session_id, hash_email_session, browser, region, source
                     ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                     ''',
-                    (
-                        responses.get("Q1"),
-                        responses.get("Q2"),
-                        responses.get("Q3"),
-                        responses.get("Q4"),
-                        responses.get("Q5"),
-                        responses.get("Q6"),
-                        scores[0],  # n1
-                        scores[1],  # n2
-                        scores[2],  # n3
-                        metadata.get("plot_x"),
-                        metadata.get("plot_y"),
-                        metadata.get("session_id"),
-                        metadata.get("hash_email_session"),
-                        metadata.get("browser"),
-                        metadata.get("region"),
-                        metadata.get("source"),
-                    )
+                    rows
                 )
                 conn.commit()
-                logger.debug("Insert into survey_results successful.")
+                logger.debug(f"Inserted {len(rows)} rows into survey_results.")
+            for _, scores, metadata in submissions:
+                population_sample.add(scores[0], scores[1], scores[2], metadata.get("source"))
         except mysql.connector.Error as db_err:
             logger.error(f"MySQL Error: {db_err.msg}")
             raise
@@ -77,6 +183,18 @@ def save_response(self, responses, scores, metadata):
             logger.error(f"General error: {e}", exc_info=True)
             raise
 
+    def get_recent_scores(self, limit: int = 2000) -> List[tuple]:
+        """Get (n1, n2, n3, source) for the most recent responses, oldest first"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT n1, n2, n3, source FROM survey_results ORDER BY id DESC LIMIT %s",
+                (limit,)
+            )
+            rows = cursor.fetchall()
+            cursor.close()
+        return rows[::-1]
+
     def get_responses(self, limit: Optional[int] = 100) -> List[Dict]:
         """Retrieve responses from database"""
         try:
@@ -112,8 +230,10 @@ def get_responses(self, limit: Optional[int] = 100) -> List[Dict]:
             logger.error(f"Error retrieving responses: {e}", exc_info=True)
             return []
 
-    def get_aggregate_scores(self, limit: Optional[int] = 100) -> pd.DataFrame:
+    def get_aggregate_scores(self, limit: Optional[int] = 100) -> "pd.DataFrame":
         """Get aggregate scores for analysis"""
+        import pandas as pd  # Slow to import, and only needed here
+
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor(dictionary=True)
@@ -0,0 +1,107 @@
+# src/data/population_sample.py
+import math
+import random
+import threading
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SQRT3_OVER_2 = math.sqrt(3) / 2
+
+class PopulationReservoir:
+    """
+    In-memory sample of recent submissions for the population overlay.
+
+    Each source ('local', 'server', ...) keeps its own reservoir so a burst from
+    one source cannot crowd out the others; the capacity is split evenly across
+    the sources seen so far. Sampling follows Algorithm R, except the count of
+    items seen is capped at `horizon` times the stratum size, so once a stratum
+    has seen that many submissions older points are replaced at a steady rate
+    and the sample tracks recent responses.
+
+    Points are stored already projected to TernaryPlotter coordinates.
+    """
+
+    def __init__(self, capacity: int = 2000, scale: int = 100, horizon: int = 10, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.scale = scale
+        self.horizon = horizon
+        self.seeded = False
+        self._strata: Dict[str, List[Tuple[float, float]]] = {}
+        self._seen: Dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._seed_lock = threading.Lock()
+        self._points = None
+
+    def project(self, n1: float, n2: float, n3: float) -> Tuple[float, float]:
+        """Project [PreModern, Modern, PostModern] scores the way python-ternary does"""
+        total = n1 + n2 + n3
+        pre = n1 / total * self.scale
+        mod = n2 / total * self.scale
+        return pre + mod / 2, SQRT3_OVER_2 * mod
+
+    def _stratum_capacity(self) -> int:
+        return max(1, self.capacity // max(1, len(self._strata)))
+
+    def add(self, n1: float, n2: float, n3: float, source: Optional[str] = None):
+        """Offer one submission to the sample"""
+        if None in (n1, n2, n3) or min(n1, n2, n3) < 0 or n1 + n2 + n3 <= 0:
+            return
+        point = self.project(n1, n2, n3)
+        source = source or "unknown"
+
+        with self._lock:
+            if source not in self._strata:
+                self._strata[source] = []
+                self._seen[source] = 0
+                # Make room for the new stratum
+                capacity = self._stratum_capacity()
+                for key, stratum in self._strata.items():
+                    if len(stratum) > capacity:
+                        self._strata[key] = self._random.sample(stratum, capacity)
+
+            stratum = self._strata[source]
+            capacity = self._stratum_capacity()
+            self._seen[source] = min(self._seen[source] + 1, capacity * self.horizon)
+            if len(stratum) < capacity:
+                stratum.append(point)
+            else:
+                slot = self._random.randrange(self._seen[source])
+                if slot < capacity:
+                    stratum[slot] = point
+            self._points = None
+
+    def seed(self, rows: Iterable[Sequence]):
+        """Fill the sample from (n1, n2, n3, source) rows, oldest first"""
+        for n1, n2, n3, source in rows:
+            self.add(n1, n2, n3, source)
+        self.seeded = True
+        logger.debug(f"Population sample seeded with {len(self)} points")
+
+    def ensure_seeded(self, load_rows: Callable[[], Iterable[Sequence]]):
+        """Seed from the database once per process, however many sessions ask"""
+        if self.seeded:
+            return
+        with self._seed_lock:
+            if not self.seeded:
+                self.seed(load_rows())
+
+    def points(self) -> Tuple[List[float], List[float]]:
+        """Sampled x and y plot coordinates"""
+        with self._lock:
+            if self._points is None:
+                xs, ys = [], []
+                for stratum in self._strata.values():
+                    for x, y in stratum:
+                        xs.append(x)
+                        ys.append(y)
+                self._points = (xs, ys)
+            return self._points
+
+    def __len__(self):
+        return sum(len(stratum) for stratum in self._strata.values())
+
+# Process-wide sample shared by every Streamlit session
+population_sample = PopulationReservoir()
@@ -0,0 +1,154 @@
+# src/data/submission_writer.py
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from mysql.connector import errors
+
+logger = logging.getLogger(__name__)
+
+# (responses, scores, metadata), as taken by MySQLManager.save_response
+Submission = Tuple[Dict, Sequence, Dict]
+
+# Errors worth retrying: lost connections, timeouts, an exhausted pool
+TRANSIENT_ERRORS = (errors.OperationalError, errors.InterfaceError, errors.PoolError)
+
+class SubmissionWriter:
+    """
+    Writes survey submissions to the database from a background thread.
+
+    Submissions wait in a queue of at most `max_queued` entries and are written
+    in batches of up to `batch_size`; a batch is sent once it is full or
+    `max_wait` seconds after its first submission. Transient failures are
+    retried with exponential backoff, up to `max_retries` times. A batch that
+    fails for any other reason is retried one submission at a time, so one bad
+    row cannot lose the rest.
+
+    `save_batch` is looked up for every batch, so it can be pointed at a new
+    database manager while the writer is running.
+    """
+
+    def __init__(self, save_batch: Optional[Callable[[List[Submission]], None]] = None,
+                 max_queued: int = 1000, batch_size: int = 50, max_wait: float = 0.5,
+                 max_retries: int = 5, retry_backoff: float = 0.5,
+                 transient_errors: tuple = TRANSIENT_ERRORS):
+        self.save_batch = save_batch
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.transient_errors = transient_errors
+        self._queue: "queue.Queue[Optional[Submission]]" = queue.Queue(maxsize=max_queued)
+        self._counters = {"written": 0, "batches": 0, "retries": 0, "failed": 0, "rejected": 0}
+        self._thread = threading.Thread(target=self._run, name="submission-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    @classmethod
+    def from_env(cls, save_batch: Optional[Callable[[List[Submission]], None]] = None) -> "SubmissionWriter":
+        return cls(
+            save_batch,
+            max_queued=int(os.getenv('SUBMISSION_QUEUE_SIZE', '1000')),
+            batch_size=int(os.getenv('SUBMISSION_BATCH_SIZE', '50')),
+            max_retries=int(os.getenv('SUBMISSION_MAX_RETRIES', '5'))
+        )
+
+    def submit(self, responses: Dict, scores: Sequence, metadata: Dict) -> bool:
+        """Queue a submission without blocking; False if the queue is full"""
+        try:
+            self._queue.put_nowait((responses, scores, metadata))
+            return True
+        except queue.Full:
+            self._counters["rejected"] += 1
+            logger.warning("Submission queue is full")
+            return False
+
+    def _next_batch(self) -> Optional[List[Submission]]:
+        """Wait for a submission, then collect more for up to max_wait seconds"""
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # Stop after this batch
+                break
+            batch.append(item)
+        return batch
+
+    def _write(self, batch: List[Submission]) -> bool:
+        """Write a batch, retrying transient failures; True once written"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.save_batch(batch)
+                return True
+            except self.transient_errors as e:
+                if attempt == self.max_retries:
+                    logger.error(f"Giving up on {len(batch)} submissions after {attempt + 1} attempts: {e}")
+                    return False
+                self._counters["retries"] += 1
+                delay = self.retry_backoff * 2 ** attempt
+                logger.warning(f"Retrying {len(batch)} submissions in {delay:.1f}s: {e}")
+                time.sleep(delay)
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} submissions: {e}", exc_info=True)
+                return False
+        return False
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                if self._write(batch):
+                    self._counters["written"] += len(batch)
+                elif len(batch) > 1:
+                    for submission in batch:
+                        if self._write([submission]):
+                            self._counters["written"] += 1
+                        else:
+                            self._counters["failed"] += 1
+                            logger.error(f"Dropped submission: {submission}")
+                else:
+                    self._counters["failed"] += 1
+                    logger.error(f"Dropped submission: {batch[0]}")
+                self._counters["batches"] += 1
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued submission has been handled; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 10.0):
+        """Write what is queued, then stop the thread"""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"Submission writer stopped with {self._queue.qsize()} submissions queued")
+
+    def stats(self) -> Dict:
+        return {**self._counters, "queued": self._queue.qsize()}
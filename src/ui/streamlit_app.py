@@ -3,23 +3,19 @@
 from pathlib import Path  # Add this for better path handling
 import streamlit as st
 import platform 
-import random
 import os
 import uuid
 import json # Add this for JSON logging
-from src.visualization.ternary_plotter import TernaryPlotter
 from src.core.question_manager import QuestionManager
-from src.visualization.worldview_results import display_results_page
 from version import __version__
 from datetime import datetime
 import logging
 import sys
 from src.config.database import DatabaseConfig
 from src.data.db_manager import MySQLManager
-
-# Initialize the database manager
-db_config = DatabaseConfig.get_db_config()
-db = MySQLManager(db_config)
+from src.data.submission_writer import SubmissionWriter
+from src.data.population_sample import population_sample
+from src.visualization.plot_fonts import start_warm_up
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
@@ -59,9 +55,56 @@ def get_region_info():
     except:
         return "Unknown Region"
 
-# Initialize question manager and ternary plotter
-question_manager = QuestionManager("src/data/questions_responses.json")
-plotter = TernaryPlotter(scale=100)
+# Streamlit re-executes this script on every rerun; everything below is built
+# once per process and shared by all sessions
+@st.cache_resource(show_spinner=False)
+def _create_db_manager() -> MySQLManager:
+    return MySQLManager(DatabaseConfig.get_db_config())
+
+def get_db_manager() -> MySQLManager:
+    """Shared database manager, rebuilt if its pool can no longer reach the database"""
+    manager = _create_db_manager()
+    if not manager.is_healthy():
+        logger.warning("Recreating database connection pool")
+        manager.close()
+        _create_db_manager.clear()
+        manager = _create_db_manager()
+    return manager
+
+@st.cache_resource(show_spinner=False)
+def get_question_manager() -> QuestionManager:
+    return QuestionManager("src/data/questions_responses.json")
+
+@st.cache_resource(show_spinner=False)
+def start_chart_warm_up():
+    # Loads matplotlib and its font list in the background while the questions are answered
+    return start_warm_up()
+
+@st.cache_resource(show_spinner=False)
+def get_plotter():
+    # matplotlib and python-ternary are only needed once results are shown
+    from src.visualization.ternary_plotter import TernaryPlotter
+    return TernaryPlotter(scale=100)
+
+# Analysis category covered by each question
+CATEGORY_QUESTIONS = {
+    "Q1": "Source of Truth",
+    "Q2": "Understanding the World",
+    "Q3": "Knowledge Acquisition",
+    "Q4": "World View",
+    "Q5": "Societal Values",
+    "Q6": "Identity",
+}
+
+@st.cache_resource(show_spinner=False)
+def get_submission_writer() -> SubmissionWriter:
+    return SubmissionWriter.from_env()
+
+db = get_db_manager()
+# Point the shared writer at the current (possibly rebuilt) database manager
+submission_writer = get_submission_writer()
+submission_writer.save_batch = db.save_responses
+question_manager = get_question_manager()
 
 def initialize_session():
     """Initialize session state with a unique session ID if not already present"""
@@ -96,20 +139,22 @@ def get_environment_source():
     
     return source
 
+def get_population_points():
+    """Projected sample of other respondents for the chart overlay, or None if unavailable"""
+    try:
+        population_sample.ensure_seeded(lambda: db.get_recent_scores(population_sample.capacity))
+    except Exception as e:
+        logger.error(f"Could not load population sample: {e}")
+        return None
+    return population_sample.points()
+
 def calculate_n_values(session_state):
     """Calculate and normalize N values from response scores."""
-    total_scores = [0, 0, 0]  # [PreModern, Modern, PostModern]
-    question_keys = ['Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'Q6']
-
-    # Aggregate scores
-    for q_key in question_keys:
-        response_r_value = session_state.get(f"{q_key}_r_value")
-        if response_r_value is not None:
-            responses = question_manager.get_responses(q_key)
-            selected_response = next((r for r in responses if r["r_value"] == response_r_value), None)
-            if selected_response:
-                scores = selected_response["scores"]
-                total_scores = [a + b for a, b in zip(total_scores, scores)]
+    # Aggregate scores [PreModern, Modern, PostModern]
+    total_scores = question_manager.score_session({
+        q_key: session_state.get(f"{q_key}_r_value")
+        for q_key in question_manager.get_all_question_keys()
+    }).totals
 
     # Calculate percentages and normalize if the sum exceeds 100
     raw_sum = sum(total_scores)
@@ -138,9 +183,8 @@ def calculate_plot_coordinates(n1, n2, n3):
 
 def save_survey_results(session_state):
     """Save survey results to the database using the response ID numbers."""
-    # Store debug info in the session state
-    if 'debug_info' not in st.session_state:
-        st.session_state.debug_info = {}
+    # Debug info is only shown on this run, so keep it out of the session state
+    debug_info = {}
     
     # Create an expander for debug information
     with st.expander("💾 Database Operation Details", expanded=True):
@@ -154,11 +198,11 @@ def save_survey_results(session_state):
 
         # Add debug logging for database location and make it work cross-platform
         db_path = str(Path(__file__).parent.parent / "data" / "survey_results.db")
-        st.session_state.debug_info['db_path'] = db_path
-        st.session_state.debug_info['db_exists'] = Path(db_path).exists()
+        debug_info['db_path'] = db_path
+        debug_info['db_exists'] = Path(db_path).exists()
         
-        st.info(f"📁 Database Location: {st.session_state.debug_info['db_path']}")
-        st.write(f"Database exists: {'✅' if st.session_state.debug_info['db_exists'] else '❌'}")
+        st.info(f"📁 Database Location: {debug_info['db_path']}")
+        st.write(f"Database exists: {'✅' if debug_info['db_exists'] else '❌'}")
         
         # Log record count before save
         # try:
@@ -166,17 +210,17 @@ def save_survey_results(session_state):
         #         cursor = conn.cursor()
         #         cursor.execute("SELECT COUNT(*) FROM survey_results")
         #         count_before = cursor.fetchone()[0]
-        #         st.session_state.debug_info['count_before'] = count_before
+        #         debug_info['count_before'] = count_before
         #         st.write(f"Records before save: {count_before}")
                 
         #         # Also check if table exists
         #         # cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='survey_results'")
         #         # tables = cursor.fetchall()
-        #         # st.session_state.debug_info['tables'] = tables
+        #         # debug_info['tables'] = tables
         #         # st.write(f"Found tables: {tables}")
         # except Exception as e:
         #     st.error(f"Error checking record count: {e}")
-        #     st.session_state.debug_info['error'] = str(e)
+        #     debug_info['error'] = str(e)
 
         # Calculate N values and plot coordinates
         n1, n2, n3 = calculate_n_values(session_state)
@@ -198,7 +242,7 @@ def save_survey_results(session_state):
         }
         # Call this function where appropriate
         log_table_contents()
-        st.session_state.debug_info['save_details'] = save_details
+        debug_info['save_details'] = save_details
 
         # Display save details
         st.write("### Saving Record Details:")
@@ -250,96 +294,73 @@ def save_survey_results(session_state):
     # Display persistent debug info at the bottom of the page
     st.markdown("---")
     st.subheader("📊 Database Operation Summary")
-    if 'debug_info' in st.session_state:
+    if debug_info:
         with st.expander("View Complete Debug Information", expanded=True):
-            st.json(st.session_state.debug_info)
+            st.json(debug_info)
 
-def display_questions_and_responses():
-    # Debug: Check initial state
-    # print("\n=== Entering display_questions_and_responses() ===")
-    # print("Query params:", st.query_params)
-    # print("Current session state keys:", list(st.session_state.keys()))
-    
-    # Force scroll to top on initialization
-    if 'init' not in st.query_params:
-    #    print("No init param found - adding it")
-        st.query_params['init'] = '1'
-    #    print("Added init param, about to rerun")
-        st.rerun()
-    else:
-        print("Init param present:", st.query_params['init'])
+def submit_questions():
+    """Form callback: store the submitted answers and move on once all are answered.
 
+    Runs before the rerun that the submission triggers, so that rerun already
+    renders the next page (or the highlighted questions).
+    """
+    question_keys = question_manager.get_all_question_keys()
+    for q_key in question_keys:
+        st.session_state[f"{q_key}_r_value"] = st.session_state.get(f"radio_{q_key}")
+    st.session_state.validation_attempted = True
+    if all(st.session_state[f"{q_key}_r_value"] is not None for q_key in question_keys):
+        st.session_state.page = "results"
+
+def display_questions_and_responses():
     st.title("Modernity Worldview Survey")
     question_keys = question_manager.get_all_question_keys()
-    #print("Loaded question keys:", question_keys)
 
     # Initialise validation state if not exists
     if "validation_attempted" not in st.session_state:
-        #print("Initialising validation_attempted state")
         st.session_state.validation_attempted = False
 
-    # Display questions
-    for q_key in question_keys:
-        #print(f"\nProcessing question {q_key}")
-        question_text = question_manager.get_question_text(q_key)
-        responses = question_manager.get_responses(q_key)
-
-        # Initialise shuffled responses
-        if f"shuffled_responses_{q_key}" not in st.session_state:
-            #print(f"Initialising shuffled responses for {q_key}")
-            st.session_state[f"shuffled_responses_{q_key}"] = [
-                {"text": "Select an option", "r_value": None}
-            ] + random.sample(responses, len(responses))
-
-        shuffled_responses = st.session_state[f"shuffled_responses_{q_key}"]
-
-        # Check if question is answered
-        is_answered = st.session_state.get(f"{q_key}_r_value") is not None
-        #print(f"Question {q_key} answered status:", is_answered)
-
-        # Apply highlighting if validation was attempted and question is unanswered
-        if st.session_state.validation_attempted and not is_answered:
-            #print(f"Highlighting unanswered question {q_key}")
-            st.markdown(
-                f'<div style="background-color: yellow; padding: 5px; border-radius: 5px; font-weight: bold; font-size: 26px; font-family: Roboto, sans-serif;">{question_text}</div>',
-                unsafe_allow_html=True
+    # Answers are only sent to the server when the form is submitted, so
+    # selecting a response does not rerun the script
+    with st.form("questions", border=False):
+        for q_key in question_keys:
+            question_text = question_manager.get_question_text(q_key)
+
+            # Initialise the response order; only its permutation index is kept in the session
+            if f"{q_key}_order" not in st.session_state:
+                st.session_state[f"{q_key}_order"] = question_manager.random_order(q_key)
+
+            shuffled_responses = question_manager.get_ordered_responses(q_key, st.session_state[f"{q_key}_order"])
+            selected_r_value = st.session_state.get(f"{q_key}_r_value")
+            options = [None] + [r.r_value for r in shuffled_responses]
+
+            # Apply highlighting if validation was attempted and question is unanswered
+            if st.session_state.validation_attempted and selected_r_value is None:
+                st.markdown(
+                    f'<div style="background-color: yellow; padding: 5px; border-radius: 5px; font-weight: bold; font-size: 26px; font-family: Roboto, sans-serif;">{question_text}</div>',
+                    unsafe_allow_html=True
+                )
+            else:
+                st.subheader(question_text)
+
+            # Render radio buttons
+            st.radio(
+                "",
+                options=options,
+                index=options.index(selected_r_value) if selected_r_value in options else 0,
+                format_func=lambda r_value, q_key=q_key: "Select an option" if r_value is None
+                else question_manager.get_response(q_key, r_value).text,
+                key=f"radio_{q_key}",
             )
-        else:
-            st.subheader(question_text)
-
-        # Render radio buttons
-        response_r_value = st.radio(
-            "",
-            options=[r["text"] for r in shuffled_responses],
-            index=0 if st.session_state.get(f"{q_key}_r_value") is None else
-            [r["text"] for r in shuffled_responses].index(
-                next(r["text"] for r in shuffled_responses if r["r_value"] == st.session_state[f"{q_key}_r_value"])
-            ),
-            key=f"radio_{q_key}",
-        )
-
-        # Update session state with selection
-        selected_response = next((r for r in shuffled_responses if r["text"] == response_r_value), None)
-        st.session_state[f"{q_key}_r_value"] = selected_response["r_value"] if selected_response else None
-        print(f"Updated response value for {q_key}:", st.session_state[f"{q_key}_r_value"])
-
-    # Review Results button and error message at the bottom together
-    if st.button("Review Results"):
-        #print("\n=== Review Results button clicked ===")
-        st.session_state.validation_attempted = True
-        has_unanswered = any(
-            not st.session_state.get(f"{q_key}_r_value") for q_key in question_keys
-        )
-        #print("Has unanswered questions:", has_unanswered)
-        
-        if has_unanswered:
-            #print("Rerunning due to unanswered questions")
-            st.rerun()
-        else:
-            #print("All questions answered, moving to results page")
-            st.session_state.page = "results"
-            st.rerun()
-    
+
+        # Review Results button at the bottom of the form
+        st.form_submit_button("Review Results", on_click=submit_questions)
+
+    # Show error message right after the button if there are unanswered questions
+    if st.session_state.validation_attempted and any(
+        st.session_state.get(f"{q_key}_r_value") is None for q_key in question_keys
+    ):
+        st.error("Some questions are unanswered. Please scroll up and complete them before proceeding.")
+
     # Display version number in footer
     st.markdown("<br>", unsafe_allow_html=True)
     st.markdown("---")  # Single horizontal line
@@ -347,39 +368,33 @@ def display_questions_and_responses():
     f"<span style='font-size:10pt;'>Survey Version: {__version__}</span>", 
     unsafe_allow_html=True
     )
-    
-    # Show error message right after the button if there are unanswered questions
-    if st.session_state.validation_attempted:
-        has_unanswered = any(
-            not st.session_state.get(f"{q_key}_r_value") for q_key in question_keys
-        )
-        if has_unanswered:
-            print("Displaying error message for unanswered questions")
-            st.error("Some questions are unanswered. Please scroll up and complete them before proceeding.")
+
+    # Answers only reach the server on submit, so the questions being on
+    # screen is the earliest sign a chart will be needed; starting here keeps
+    # the matplotlib import out of process start and the first render
+    start_chart_warm_up()
 
 def display_results_and_chart():
     st.title("Modernity Worldview Survey")
     question_keys = question_manager.get_all_question_keys()
 
     responses_summary = {}
-    individual_scores = []  # Store individual scores
-    n1, n2, n3 = 0, 0, 0  # Initialise aggregate scores
+    r_values = {q_key: st.session_state.get(f"{q_key}_r_value", None) for q_key in question_keys}
+
+    # Calculate scores
+    session_scores = question_manager.score_session(r_values)
+    individual_scores = session_scores.individual  # Store individual scores
+    n1, n2, n3 = session_scores.totals  # Aggregate scores
 
-    # Collect responses and calculate scores
+    # Collect responses
     for q_key in question_keys:
         question_text = question_manager.get_question_text(q_key)
-        response_r_value = st.session_state.get(f"{q_key}_r_value", None)
-        responses = question_manager.get_responses(q_key)
+        response_r_value = r_values[q_key]
 
         if response_r_value is not None:
-            selected_response = next((r for r in responses if r["r_value"] == response_r_value), None)
+            selected_response = question_manager.get_response(q_key, response_r_value)
             if selected_response:
-                response_text = selected_response["text"]
-                scores = selected_response["scores"]
-                individual_scores.append(scores)
-                n1 += scores[0]
-                n2 += scores[1]
-                n3 += scores[2]
+                response_text = selected_response.text
             else:
                 response_text = "No valid response found."
         else:
@@ -400,7 +415,10 @@ def display_results_and_chart():
 
     # Display ternary plot if we have valid scores
     if individual_scores and avg_score:
-        chart = plotter.create_plot(user_scores=individual_scores, avg_score=avg_score)
+        show_population = st.checkbox("Show other respondents", key="show_population")
+        population = get_population_points() if show_population else None
+        plotter = get_plotter()
+        chart = plotter.create_plot(user_scores=individual_scores, avg_score=avg_score, population=population)
         plotter.display_plot(chart)
     else:
         st.write("No sufficient data to generate a ternary chart.")
@@ -419,8 +437,8 @@ def display_results_and_chart():
             st.rerun()
     with col2:
         if st.button("View Detailed Analysis"):
-            # Save to database before proceeding to detailed results
-            db.save_response(
+            # Queue the save; the background writer stores it while the next page renders
+            submission = dict(
                 responses={
                     "Q1": st.session_state.get("Q1_r_value"),
                     "Q2": st.session_state.get("Q2_r_value"),
@@ -440,18 +458,12 @@ def display_results_and_chart():
                     "source": get_environment_source(),
                 }
             )
+            if not submission_writer.submit(**submission):
+                # The writer is backed up; save directly rather than lose the response
+                db.save_response(**submission)
 
-            # Store data for detailed results
-            st.session_state.final_scores = avg_score
-            st.session_state.individual_scores = individual_scores
-            st.session_state.category_responses = {
-                "Source of Truth": responses_summary.get("Q1", ("", "No response"))[1],
-                "Understanding the World": responses_summary.get("Q2", ("", "No response"))[1],
-                "Knowledge Acquisition": responses_summary.get("Q3", ("", "No response"))[1],
-                "World View": responses_summary.get("Q4", ("", "No response"))[1],
-                "Societal Values": responses_summary.get("Q5", ("", "No response"))[1],
-                "Identity": responses_summary.get("Q6", ("", "No response"))[1],
-            }
+            # Store data for detailed results; scores and text are rebuilt from it
+            st.session_state.combination_id = question_manager.combination_id(r_values)
             st.session_state.page = "detailed_results"
             st.rerun()
 
@@ -465,17 +477,27 @@ def display_results_and_chart():
 
 def display_detailed_results():
     """Display the detailed results page"""
-    if not hasattr(st.session_state, 'final_scores'):
+    combination_id = st.session_state.get("combination_id")
+    if combination_id is None:
         st.error("No survey data found. Please complete the survey first.")
         if st.button("Return to Survey"):
             st.session_state.page = "questions"
             st.rerun()
         return
 
+    from src.visualization.worldview_results import display_results_page
+
+    answers = question_manager.answers_for(combination_id)
+    session_scores = question_manager.score_session(answers)
+    total = sum(session_scores.totals)
+    category_responses = {
+        category: question_manager.get_response(q_key, answers[q_key]).text
+        for q_key, category in CATEGORY_QUESTIONS.items()
+    }
     display_results_page(
-        st.session_state.final_scores,
-        st.session_state.category_responses,
-        getattr(st.session_state, 'individual_scores', None)
+        [score / total * 100 for score in session_scores.totals],
+        category_responses,
+        session_scores.individual
     )
     
     if st.button("Start New Survey"):
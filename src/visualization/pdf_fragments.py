@@ -0,0 +1,80 @@
+# src/visualization/pdf_fragments.py
+
+"""
+Pre-built PDF pages that can be spliced into any report.
+
+A fragment is laid out once on a scratch FPDF document with the report's page
+settings, and its raw page content is kept. Splicing appends those pages to a
+report, registering the fonts the fragment uses and renumbering its font
+references to match the report. Fragments may only contain text and drawing
+operators: images and links are not carried over.
+"""
+
+import re
+from typing import Callable, List, Tuple
+
+from fpdf import FPDF
+
+FONT_REF = re.compile(r"BT /F(\d+) ([\d.]+) Tf ET")
+
+class PageFragment:
+    """Laid-out page content plus the font and cursor state it ends in"""
+
+    def __init__(self, pages: List[str], fonts: List[Tuple[str, str, int]],
+                 font: Tuple[str, str, float], x: float, y: float):
+        self.pages = pages
+        self.fonts = fonts
+        self.font = font
+        self.x = x
+        self.y = y
+
+def new_report_pdf() -> FPDF:
+    """FPDF document with the page settings every report uses"""
+    pdf = FPDF()
+    pdf.set_compression(True)
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.set_left_margin(15)
+    pdf.set_right_margin(15)
+    return pdf
+
+def build_fragment(draw: Callable[[FPDF], None]) -> PageFragment:
+    """Lay out draw(pdf) on fresh pages and capture the result"""
+    pdf = new_report_pdf()
+    pdf.add_page()
+    draw(pdf)
+
+    fonts = []
+    for fontkey, font in pdf.fonts.items():
+        family = fontkey.rstrip("BI")
+        fonts.append((family, fontkey[len(family):], font['i']))
+
+    pages = [pdf.pages[n] for n in range(1, pdf.page + 1)]
+    return PageFragment(
+        pages=pages,
+        fonts=fonts,
+        font=(pdf.font_family, pdf.font_style + ("U" if pdf.underline else ""), pdf.font_size_pt),
+        x=pdf.x,
+        y=pdf.y
+    )
+
+def splice_fragment(pdf: FPDF, fragment: PageFragment):
+    """Append the fragment's pages to pdf and continue from where it ended"""
+    family, style, size = fragment.font
+    for content in fragment.pages:
+        pdf.add_page()
+
+        # Make sure every font the fragment uses exists in this document
+        font_ids = {}
+        for font_family, font_style, index in fragment.fonts:
+            pdf.set_font(font_family, font_style)
+            font_ids[str(index)] = pdf.fonts[font_family + font_style]['i']
+        if family:
+            # Leave the font state where the fragment left it; the page content
+            # written here is replaced below
+            pdf.set_font(family, style, size)
+
+        pdf.pages[pdf.page] = FONT_REF.sub(
+            lambda m: f"BT /F{font_ids[m.group(1)]} {m.group(2)} Tf ET", content
+        )
+
+    pdf.set_xy(fragment.x, fragment.y)
@@ -1,25 +1,90 @@
 from fpdf import FPDF
 import io
 from .perspective_analyzer import PerspectiveAnalyzer
-from .ternary_plotter import TernaryPlotter
-import tempfile
-import os
-# import logging
+from .pdf_fragments import PageFragment, build_fragment, splice_fragment
+from .report_cache import ReportCache, report_cache
+from .pdf_chart import draw_ternary_chart
+import logging
+from functools import lru_cache
 from typing import List, Dict
 from pathlib import Path
 import json
 from version import __version__
 
-# logger = logging.getLogger(__name__)
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ["Source of Truth", "Understanding the World",
+              "Knowledge Acquisition", "World View",
+              "Societal Values", "Identity"]
+
+@lru_cache(maxsize=1)
+def load_response_templates() -> dict:
+    """Category response templates, read once per process"""
+    template_path = Path(__file__).parent.parent / "data" / "response_templates.json"
+    try:
+        with open(template_path) as f:
+            return json.load(f)["categories"]
+    except Exception as e:
+        logger.error(f"Error loading templates: {e}")
+        return {}
+
+def perspective_type_for(scores: list) -> str:
+    """Template key for the scores, e.g. 'Modern', 'Modern-PostModern' or 'Modern-Balanced'"""
+    analysis = PerspectiveAnalyzer.get_perspective_summary(scores)
+    perspective_type = analysis['primary']
+    if analysis['strength'] != 'Strong' and analysis['secondary']:
+        perspective_type = f"{analysis['primary']}-{analysis['secondary']}"
+    elif analysis['strength'] == 'Mixed':
+        perspective_type = 'Modern-Balanced'
+    return perspective_type
+
+@lru_cache(maxsize=32)
+def category_analysis_fragment(perspective_type: str) -> PageFragment:
+    """
+    The category analysis pages for a perspective type, laid out once.
+
+    The pages depend only on the perspective type, of which there are a handful.
+    """
+    templates = load_response_templates()
+
+    def draw(pdf):
+        pdf.set_font("Arial", style="B", size=18)
+        pdf.cell(0, 12, txt="Worldview Category Analysis", ln=True)
+        pdf.ln(5)
+
+        for category in CATEGORIES:
+            # Add category header
+            pdf.set_font("Arial", style="B", size=13)
+            pdf.cell(0, 10, txt=category, ln=True)
+
+            # Get the detailed template response
+            if category in templates:
+                category_templates = templates[category]
+                if perspective_type in category_templates:
+                    template_response = category_templates[perspective_type]["response"]
+                else:
+                    # Fall back to primary category if blend isn't found
+                    primary = perspective_type.split('-')[0]
+                    template_response = category_templates.get(primary, {}).get("response",
+                        "Template not found for this perspective.")
+            else:
+                template_response = "Category templates not found."
+
+            # Add template response
+            pdf.set_font("Arial", size=11)
+            pdf.multi_cell(0, 8, txt=template_response)
+            pdf.ln(5)
+
+    return build_fragment(draw)
 
 class SurveyPDFReport:
     def __init__(self):
         self.pdf = FPDF()
+        self.pdf.set_compression(True)  # Deflate the page content streams
         self.pdf.set_auto_page_break(auto=True, margin=15)
         self.pdf.add_page()
         self.pdf.set_left_margin(15)
         self.pdf.set_right_margin(15)
-        self.plotter = TernaryPlotter()
         
     def add_first_page_footer(self):
         """Add footer text to the first page"""
@@ -86,26 +151,21 @@ def add_visualization_section(self, scores: list, individual_scores: List[List[f
         self.pdf.ln(5)
 
         try:
-            # Create the plot with individual scores if provided
-            chart = self.plotter.create_plot(
-                user_scores=individual_scores if individual_scores else [], 
-                avg_score=scores
+            # Drawn with PDF vector operators, centred on the page
+            plot_width = 180
+            plot_height = plot_width * 0.85
+            top = self.pdf.get_y()
+            draw_ternary_chart(
+                self.pdf,
+                x=(self.pdf.w - plot_width) / 2,
+                y=top,
+                width=plot_width,
+                height=plot_height,
+                average=scores,
+                points=individual_scores if individual_scores else []
             )
-            
-            # Save to temporary file with reduced DPI for faster generation
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp_file:
-                temp_path = tmp_file.name
-                chart.savefig(temp_path, format='png', dpi=150, bbox_inches='tight')
-                
-                # Add to PDF with consistent dimensions for Letter size
-                plot_width = 180
-                plot_height = plot_width * 0.85
-                x_offset = (215.9 - plot_width) / 2  # Center on Letter page
-                self.pdf.image(temp_path, x=x_offset, w=plot_width, h=plot_height)
-            
-            os.unlink(temp_path)
-            chart.clear()
-            
+            self.pdf.set_y(top + plot_height)
+
         except Exception as e:
             logger.error(f"Error creating visualization: {e}")
             self.pdf.cell(0, 10, txt="Error generating visualization", ln=True)
@@ -117,77 +177,49 @@ def add_visualization_section(self, scores: list, individual_scores: List[List[f
         self.pdf.cell(0, 10, txt=f"Survey Version: {__version__}", ln=True, align="R")
 
     def add_category_analysis(self, scores: list, category_responses: dict):
-        """Add the detailed category analysis section"""
-        # Force new page for Category Analysis
-        self.pdf.add_page()
-        
-        analysis = PerspectiveAnalyzer.get_perspective_summary(scores)
-        perspective_type = analysis['primary']
-        if analysis['strength'] != 'Strong' and analysis['secondary']:
-            perspective_type = f"{analysis['primary']}-{analysis['secondary']}"
-        elif analysis['strength'] == 'Mixed':
-            perspective_type = 'Modern-Balanced'
-
-        self.pdf.set_font("Arial", style="B", size=18)
-        self.pdf.cell(0, 12, txt="Worldview Category Analysis", ln=True)
-        self.pdf.ln(5)
-
-        # Load response templates
-        template_path = Path(__file__).parent.parent / "data" / "response_templates.json"
-        try:
-            with open(template_path) as f:
-                templates = json.load(f)["categories"]
-        except Exception as e:
-            logger.error(f"Error loading templates: {e}")
-            templates = {}
-
-        # Process each category
-        for category in ["Source of Truth", "Understanding the World", 
-                        "Knowledge Acquisition", "World View", 
-                        "Societal Values", "Identity"]:
-            # Add category header
-            self.pdf.set_font("Arial", style="B", size=13)
-            self.pdf.cell(0, 10, txt=category, ln=True)
-            
-            # Get the detailed template response
-            if category in templates:
-                category_templates = templates[category]
-                if perspective_type in category_templates:
-                    template_response = category_templates[perspective_type]["response"]
-                else:
-                    # Fall back to primary category if blend isn't found
-                    primary = perspective_type.split('-')[0]
-                    template_response = category_templates.get(primary, {}).get("response", 
-                        "Template not found for this perspective.")
-            else:
-                template_response = "Category templates not found."
-            
-            # Add template response
-            self.pdf.set_font("Arial", size=11)
-            self.pdf.multi_cell(0, 8, txt=template_response)
-            self.pdf.ln(5)
+        """Add the detailed category analysis section, starting on a new page"""
+        splice_fragment(self.pdf, category_analysis_fragment(perspective_type_for(scores)))
 
     def save_to_buffer(self):
-        """Save PDF to buffer"""
+        """Serialize the PDF once, straight to bytes"""
         try:
-            buffer = io.BytesIO()
-            self.pdf.output(dest="S").encode("latin1")
-            buffer.write(self.pdf.output(dest="S").encode("latin1"))
-            buffer.seek(0)
-            return buffer.getvalue()
+            return self.pdf.output(dest="S").encode("latin1")
         except Exception as e:
             logger.error(f"Error in save_to_buffer: {e}")
             raise RuntimeError(f"Error saving PDF to buffer: {e}")
 
+def survey_report_key(scores: list, individual_scores: List[List[float]] = None) -> str:
+    """
+    Report cache key.
+
+    The category pages come from the templates for the perspective type rather
+    than from the category responses, so the perspective type stands in for them.
+    The chart is identified by the points it plots.
+    """
+    chart = [[round(float(value), 1) for value in point] for point in (individual_scores or [])]
+    return ReportCache.key(
+        perspective=perspective_type_for(scores),
+        scores=[round(float(score), 1) for score in scores],
+        chart=chart,
+        app_version=__version__
+    )
+
+def build_survey_report(scores: list, individual_scores: List[List[float]] = None) -> bytes:
+    """Lay out and serialize the report"""
+    report = SurveyPDFReport()
+    report.add_title()
+    report.add_perspective_summary(scores)
+    report.add_visualization_section(scores, individual_scores)
+    report.add_category_analysis(scores, None)
+    return report.save_to_buffer()
+
 def generate_survey_report(scores: list, category_responses: dict, individual_scores: List[List[float]] = None):
-    """Generate the complete survey report"""
+    """Generate the complete survey report, or return it from the report cache"""
     try:
-        report = SurveyPDFReport()
-        report.add_title()
-        report.add_perspective_summary(scores)
-        report.add_visualization_section(scores, individual_scores)
-        report.add_category_analysis(scores, category_responses)
-        return report.save_to_buffer()
+        return report_cache.get_or_create(
+            survey_report_key(scores, individual_scores),
+            lambda: build_survey_report(scores, individual_scores)
+        )
     except Exception as e:
         logger.error(f"Error in report generation: {e}")
         raise RuntimeError(f"Error generating survey report: {e}")
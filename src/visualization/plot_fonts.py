@@ -0,0 +1,82 @@
+# src/visualization/plot_fonts.py
+"""
+matplotlib font setup, done once per process.
+
+The charts were designed with Arial, which Linux hosts do not have; asking for
+it by name makes matplotlib scan its font list and log a fallback warning for
+every label. Instead the family is resolved once, preferring Arial and then
+its metric-compatible substitutes (Liberation Sans, installed from
+packages.txt, or Arimo), and falling back to DejaVu Sans, which ships inside
+matplotlib and is always present.
+
+matplotlib keeps its font list in MPLCONFIGDIR. Building it is the slow part of
+a new instance's first chart, so it lives in a fixed directory that
+scripts/build_font_cache.py fills ahead of time, and warm_up() loads it in the
+background before the first chart is needed.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PREFERRED_FAMILIES = ["Arial", "Liberation Sans", "Arimo", "Helvetica", "DejaVu Sans"]
+
+# Fonts placed here are registered before the family is resolved
+FONT_DIR = Path(__file__).resolve().parent / "fonts"
+
+def font_cache_dir() -> str:
+    """MPLCONFIGDIR, defaulting to a fixed directory so the font list is built once per machine"""
+    return os.getenv('MPLCONFIGDIR') or os.path.join(tempfile.gettempdir(), 'worldview-matplotlib')
+
+def use_font_cache_dir():
+    """Point matplotlib at the font cache; only effective before matplotlib is imported"""
+    os.environ.setdefault('MPLCONFIGDIR', font_cache_dir())
+    os.makedirs(os.environ['MPLCONFIGDIR'], exist_ok=True)
+
+@lru_cache(maxsize=1)
+def plot_font() -> str:
+    """Configure matplotlib and return the font family all chart text uses"""
+    use_font_cache_dir()
+
+    import matplotlib
+    from matplotlib import font_manager
+
+    for path in sorted(FONT_DIR.glob("*.[ot]tf")):
+        font_manager.fontManager.addfont(str(path))
+
+    available = {font.name for font in font_manager.fontManager.ttflist}
+    family = next((name for name in PREFERRED_FAMILIES if name in available), "DejaVu Sans")
+    matplotlib.rcParams['font.family'] = 'sans-serif'
+    matplotlib.rcParams['font.sans-serif'] = [family]
+    logger.info(f"Chart font: {family}")
+    return family
+
+def warm_up():
+    """Build or load the font list and glyph cache for the chart font"""
+    family = plot_font()
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(1, 1))
+    figure.text(0.5, 0.5, "PreModern Modern PostModern 0123456789.,", fontfamily=family, fontsize=16)
+    FigureCanvasAgg(figure).draw()  # No pyplot state involved
+
+def start_warm_up() -> threading.Thread:
+    """warm_up() on a daemon thread, so startup does not wait for it"""
+    use_font_cache_dir()
+
+    def run():
+        try:
+            warm_up()
+        except Exception as e:
+            logger.warning(f"Chart font warm-up failed: {e}")
+
+    thread = threading.Thread(target=run, name="plot-font-warm-up", daemon=True)
+    thread.start()
+    return thread
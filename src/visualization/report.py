@@ -54,14 +54,8 @@ def save_to_pdf(user_scores, avg_score, text_summary):
         pdf.ln(10)
         pdf.multi_cell(0, 10, txt=text_summary)
 
-        # Save PDF to a buffer
-        buffer = io.BytesIO()
-        pdf.output(dest="S").encode("latin1")  # Generate PDF content
-        buffer.write(pdf.output(dest="S").encode("latin1"))
-        buffer.seek(0)  # Reset the buffer pointer to the beginning
-
-        # Return the buffer contents
-        return buffer.getvalue()
+        # Serialize once, straight to bytes
+        return pdf.output(dest="S").encode("latin1")
     except Exception as e:
         raise RuntimeError(f"Error generating PDF: {e}")
 
@@ -0,0 +1,161 @@
+# src/visualization/report_cache.py
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the report layout changes so stale reports are not served
+REPORT_CACHE_VERSION = "2"
+
+def date_bucket() -> str:
+    """Reports print the generation date, so cached reports are only valid for a day"""
+    return date.today().isoformat()
+
+class ReportCache:
+    """
+    Finished report bytes, keyed by a hash of the report inputs.
+
+    Two tiers: an in-memory LRU of `max_entries` reports, and a directory
+    shared by every process on the instance, trimmed (oldest first) to
+    `disk_max_bytes`. A disk hit is promoted into memory.
+    """
+
+    def __init__(self, max_entries: int = 64, disk_dir: Optional[str] = None,
+                 disk_max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = None
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> "ReportCache":
+        disk_dir = os.getenv('REPORT_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'worldview_report_cache'))
+        return cls(
+            max_entries=int(os.getenv('REPORT_CACHE_MEMORY_ENTRIES', '64')),
+            disk_dir=disk_dir or None,
+            disk_max_bytes=int(float(os.getenv('REPORT_CACHE_DISK_MB', '256')) * 1024 * 1024)
+        )
+
+    @staticmethod
+    def key(**inputs) -> str:
+        canonical = json.dumps(
+            {**inputs, "version": REPORT_CACHE_VERSION, "date": date_bucket()},
+            sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.pdf")
+
+    def _remember(self, key: str, data: bytes):
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return data
+
+        if self.disk_dir:
+            path = self._path(key)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                os.utime(path)  # Keep recently used reports through eviction
+            except OSError:
+                data = None
+            if data:
+                self._counters["disk_hits"] += 1
+                self._remember(key, data)
+                return data
+
+        self._counters["misses"] += 1
+        return None
+
+    def put(self, key: str, data: bytes):
+        self._remember(key, data)
+        if not self.disk_dir:
+            return
+
+        path = self._path(key)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Error writing cached report: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk()[1]
+            else:
+                self._disk_bytes += len(data)
+            if self._disk_bytes > self.disk_max_bytes:
+                self._evict()
+
+    def _scan_disk(self):
+        entries = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith('.pdf'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries, sum(size for _, size, _ in entries)
+
+    def _evict(self):
+        # Other processes share the directory, so rescan rather than trust the running total
+        entries, total = self._scan_disk()
+        target = self.disk_max_bytes * 0.9
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+                self._counters["evictions"] += 1
+            except OSError:
+                pass
+        self._disk_bytes = total
+
+    def get_or_create(self, key: str, build: Callable[[], bytes]) -> bytes:
+        data = self.get(key)
+        if data is None:
+            data = build()
+            self.put(key, data)
+        return data
+
+    def stats(self) -> Dict:
+        lookups = self._counters["memory_hits"] + self._counters["disk_hits"] + self._counters["misses"]
+        hits = lookups - self._counters["misses"]
+        return {
+            **self._counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "memory_entries": len(self._memory),
+            "disk_bytes": self._disk_bytes
+        }
+
+# Process-wide report cache
+report_cache = ReportCache.from_env()
@@ -4,6 +4,7 @@
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
 import numpy as np
 from version import __version__
+from .plot_fonts import plot_font
 
 class TernaryPlotter:
     def __init__(self, scale=100):
@@ -13,17 +14,20 @@ def __init__(self, scale=100):
             'dots': '#0052CC',  # Vibrant blue
             'star': '#DE0000',  # Bright red
             'grid': '#E0E0E0',  # Light gray
+            'population': '#7F7F7F',  # Mid gray
             'border': '#000000' # Black
         }
+        self.font = plot_font()  # Resolved once per process
      
     
-    def create_plot(self, user_scores, avg_score=None):
+    def create_plot(self, user_scores, avg_score=None, population=None):
         """
         Create a ternary plot with user scores and optional average score.
         
         Parameters:
         - user_scores: List of [PreModern, Modern, PostModern] scores for each response
         - avg_score: Optional average score to highlight
+        - population: Optional (xs, ys) of other respondents, already projected to plot coordinates
         """
         # Create figure and tax
         fig, tax = ternary.figure(scale=self.scale)
@@ -44,7 +48,7 @@ def create_plot(self, user_scores, avg_score=None):
         # Configure vertex labels with simple offset
         label_kwargs = {
             'fontsize': 16,
-            'fontfamily': 'Arial',
+            'fontfamily': self.font,
             'offset': 0.3
         }
         
@@ -53,6 +57,21 @@ def create_plot(self, user_scores, avg_score=None):
         tax.right_corner_label("PreModern", **label_kwargs)
         tax.top_corner_label("Modern", **label_kwargs)
         
+        # Faint backdrop of other respondents, drawn straight onto the axes
+        # since the points are already projected
+        if population and population[0]:
+            tax.get_axes().scatter(
+                population[0],
+                population[1],
+                marker='o',
+                color=self.colors['population'],
+                s=12,
+                alpha=0.15,
+                linewidths=0,
+                label="Other Respondents",
+                zorder=2
+            )
+        
         # Plot individual scores with larger markers
         if user_scores:
             tax.scatter(
@@ -108,7 +127,7 @@ def create_plot(self, user_scores, avg_score=None):
                 ha='center',
                 va='center',
                 fontsize=14,
-                fontfamily='Arial',
+                fontfamily=self.font,
                 color=self.colors['star']
             )
         
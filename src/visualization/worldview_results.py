@@ -3,7 +3,8 @@
 import streamlit as st
 from .ternary_plotter import TernaryPlotter
 from .perspective_analyzer import PerspectiveAnalyzer
-from .pdf_generator import generate_survey_report  # Moved import to top
+from .pdf_generator import generate_survey_report, survey_report_key  # Moved import to top
+from .report_cache import report_cache
 from typing import Dict, List
 from version import __version__
 import json
@@ -57,9 +58,18 @@ def get_response_for_category(self, category: str, scores: List[float]) -> str:
         perspective_data = category_templates.get(perspective, {})
         return perspective_data.get("response", "No template available for this perspective.")
 
+@st.cache_resource(show_spinner=False)
+def get_template_manager() -> ResponseTemplateManager:
+    """Templates are read once per process and shared by all sessions"""
+    return ResponseTemplateManager()
+
+@st.cache_resource(show_spinner=False)
+def get_plotter() -> TernaryPlotter:
+    return TernaryPlotter()
+
 def display_results_page(scores: List[float], category_responses: Dict[str, str], individual_scores: List[List[float]] = None):
     """Display the complete results page with template responses"""
-    template_manager = ResponseTemplateManager()
+    template_manager = get_template_manager()
     
     st.title("Modernity Worldview Analysis")
     
@@ -79,7 +89,7 @@ def display_results_page(scores: List[float], category_responses: Dict[str, str]
     
     # Visualization Section
     # st.header("Perspective Visualization")
-    plotter = TernaryPlotter()
+    plotter = get_plotter()
     chart = plotter.create_plot(
         user_scores=individual_scores if individual_scores else [], 
         avg_score=scores
@@ -109,11 +119,23 @@ def display_results_page(scores: List[float], category_responses: Dict[str, str]
         else:
             st.write(user_response)
         
-    # PDF Generation and Download - single button that handles everything
-    st.download_button(
-        label="Download Report",
-        data=generate_survey_report(scores, category_responses, individual_scores),
-        file_name="worldview_analysis.pdf",
-        mime="application/pdf",
-        use_container_width=True
-    )
+    # PDF Generation and Download - the report is only built when asked for.
+    # The session only remembers its key; the bytes live in the shared report cache
+    report_key = survey_report_key(scores, individual_scores)
+    report = report_cache.get(report_key) if st.session_state.get("report_key") == report_key else None
+    if report is None:
+        prepare = st.empty()
+        if prepare.button("Prepare PDF Report", use_container_width=True):
+            with st.spinner("Preparing your report..."):
+                report = generate_survey_report(scores, category_responses, individual_scores)
+            st.session_state["report_key"] = report_key
+            prepare.empty()
+
+    if report:
+        st.download_button(
+            label="Download Report",
+            data=report,
+            file_name="worldview_analysis.pdf",
+            mime="application/pdf",
+            use_container_width=True
+        )
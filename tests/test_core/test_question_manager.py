@@ -0,0 +1,65 @@
+import json
+import pytest
+from src.core.question_manager import QuestionManager
+
+@pytest.fixture
+def manager(tmp_path):
+    """Fixture to create a manager over two small questions."""
+    path = tmp_path / "questions.json"
+    path.write_text(json.dumps({"questions": {
+        "Q1": {"text": "First?", "responses": [
+            {"id": "Q1R1", "text": "A", "scores": [100, 0, 0]},
+            {"id": "Q1R2", "text": "B", "scores": [0, 100, 0]},
+        ]},
+        "Q2": {"text": "Second?", "responses": [
+            {"id": "Q2R1", "text": "C", "scores": [0, 0, 100]},
+            {"id": "Q2R3", "text": "D", "scores": [50, 25, 25]},
+        ]},
+    }}))
+    return QuestionManager(str(path))
+
+def test_responses_are_parsed_once(manager):
+    """Test that repeated calls return the same immutable records."""
+    responses = manager.get_responses("Q2")
+    assert responses is manager.get_responses("Q2")
+    assert [r.r_value for r in responses] == [1, 3]
+    with pytest.raises(AttributeError):
+        responses[0].text = "changed"
+
+def test_response_lookup(manager):
+    """Test lookup by question and R-value."""
+    assert manager.get_response("Q2", 3).scores == (50, 25, 25)
+    assert manager.get_response("Q2", 2) is None
+
+def test_score_session(manager):
+    """Test that totals and individual scores skip missing answers."""
+    scores = manager.score_session({"Q1": 2, "Q2": 3})
+    assert scores.totals == (50, 125, 25)
+    assert scores.individual == [(0, 100, 0), (50, 25, 25)]
+
+    partial = manager.score_session({"Q1": None, "Q2": 9})
+    assert partial.totals == (0, 0, 0)
+    assert partial.individual == []
+
+def test_bundled_questions_match_file():
+    """Test the index against the shipped questions file."""
+    manager = QuestionManager("src/data/questions_responses.json")
+    with open("src/data/questions_responses.json") as f:
+        data = json.load(f)["questions"]
+    for q_key, question in data.items():
+        for response in question["responses"]:
+            r_value = int(response["id"].split("R")[1])
+            assert list(manager.get_response(q_key, r_value).scores) == response["scores"]
+
+def test_every_order_is_a_distinct_permutation(manager):
+    """Test that permutation indexes decode to every ordering exactly once."""
+    orders = {tuple(r.r_value for r in manager.get_ordered_responses("Q2", i)) for i in range(2)}
+    assert orders == {(1, 3), (3, 1)}
+    assert 0 <= manager.random_order("Q2") < 2
+
+def test_combination_id_round_trip(manager):
+    """Test that answers survive encoding as a single id."""
+    ids = {manager.combination_id({"Q1": q1, "Q2": q2}) for q1 in (1, 2) for q2 in (1, 3)}
+    assert ids == {0, 1, 2, 3}
+    assert manager.answers_for(manager.combination_id({"Q1": 2, "Q2": 3})) == {"Q1": 2, "Q2": 3}
+    assert manager.combination_id({"Q1": 2, "Q2": None}) is None
@@ -0,0 +1,43 @@
+import pytest
+from src.data.population_sample import PopulationReservoir
+
+@pytest.fixture
+def reservoir():
+    """Fixture to create a small, deterministic reservoir."""
+    return PopulationReservoir(capacity=90, seed=42)
+
+def test_capacity_is_split_across_sources(reservoir):
+    """Test that a busy source cannot crowd out a quiet one."""
+    for _ in range(5000):
+        reservoir.add(0, 100, 0, "server")
+    for _ in range(10):
+        reservoir.add(100, 0, 0, "local")
+
+    assert len(reservoir) <= reservoir.capacity, "Sample should never exceed its capacity"
+    xs, ys = reservoir.points()
+    assert xs.count(100.0) == 10, "Every point from the quiet source should be kept"
+
+def test_points_are_projected_like_python_ternary(reservoir):
+    """Test that stored points match python-ternary's projection at scale 100."""
+    reservoir.add(20, 30, 50, "local")
+    xs, ys = reservoir.points()
+    assert xs[0] == pytest.approx(35.0)
+    assert ys[0] == pytest.approx(25.980762, rel=1e-6)
+
+def test_invalid_scores_are_ignored(reservoir):
+    """Test that empty or incomplete scores are not sampled."""
+    reservoir.add(0, 0, 0, "local")
+    reservoir.add(None, 10, 10, "local")
+    assert len(reservoir) == 0, "Invalid scores should be skipped"
+
+def test_seeding_runs_once(reservoir):
+    """Test that concurrent sessions only load the seed rows once."""
+    calls = []
+    def load_rows():
+        calls.append(1)
+        return [(50, 50, 0, "server")]
+
+    reservoir.ensure_seeded(load_rows)
+    reservoir.ensure_seeded(load_rows)
+    assert len(calls) == 1, "Seed rows should be loaded once per process"
+    assert len(reservoir) == 1
@@ -0,0 +1,77 @@
+import threading
+import pytest
+from mysql.connector import errors
+from src.data.submission_writer import SubmissionWriter
+
+def submission(n):
+    return {"Q1": n}, [n, 0, 0], {"session_id": str(n)}
+
+@pytest.fixture
+def saved():
+    """Fixture to collect the batches a writer saves."""
+    return []
+
+def test_submissions_are_batched(saved):
+    """Test that queued submissions are written together."""
+    release = threading.Event()
+
+    def save_batch(batch):
+        release.wait(1)
+        saved.append(batch)
+
+    writer = SubmissionWriter(save_batch, batch_size=10, max_wait=0.2)
+    for n in range(5):
+        assert writer.submit(*submission(n))
+    release.set()
+    assert writer.flush(timeout=5)
+    writer.stop()
+
+    assert sum(len(batch) for batch in saved) == 5
+    assert len(saved) < 5, "Submissions should share batches"
+    assert writer.stats()["written"] == 5
+
+def test_transient_failures_are_retried(saved):
+    """Test that a lost connection is retried until the write succeeds."""
+    failures = [errors.OperationalError("lost connection")] * 2
+
+    def save_batch(batch):
+        if failures:
+            raise failures.pop()
+        saved.append(batch)
+
+    writer = SubmissionWriter(save_batch, max_wait=0, retry_backoff=0.01)
+    writer.submit(*submission(1))
+    assert writer.flush(timeout=5)
+    writer.stop()
+
+    assert saved == [[submission(1)]]
+    assert writer.stats()["retries"] == 2
+
+def test_bad_submission_does_not_lose_batch(saved):
+    """Test that a failing row is dropped and the rest of its batch is written."""
+    def save_batch(batch):
+        if any(responses["Q1"] == 2 for responses, _, _ in batch):
+            raise errors.DataError("bad row")
+        saved.extend(batch)
+
+    release = threading.Event()
+    writer = SubmissionWriter(lambda batch: (release.wait(1), save_batch(batch)), batch_size=10, max_wait=0.2)
+    for n in range(4):
+        writer.submit(*submission(n))
+    release.set()
+    assert writer.flush(timeout=5)
+    writer.stop()
+
+    assert sorted(responses["Q1"] for responses, _, _ in saved) == [0, 1, 3]
+    assert writer.stats()["failed"] == 1
+
+def test_full_queue_rejects_without_blocking():
+    """Test that submit returns False once the queue is full."""
+    release = threading.Event()
+    writer = SubmissionWriter(lambda batch: release.wait(5), max_queued=1, batch_size=1, max_wait=0)
+    results = [writer.submit(*submission(n)) for n in range(4)]
+    release.set()
+    writer.stop()
+
+    assert results[-1] is False
+    assert writer.stats()["rejected"] >= 1
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from data_viewer.ternary_density import TernaryDensity
+
+def test_every_point_is_counted_once():
+    """Test that random points, vertices and edge points all land in exactly one cell."""
+    rng = np.random.default_rng(0)
+    scores = rng.integers(0, 101, size=(10000, 3))
+    scores = np.vstack([scores, [[100, 0, 0], [0, 100, 0], [0, 0, 100], [50, 50, 0], [0, 30, 70]]])
+
+    density = TernaryDensity(resolution=10).add(scores[:, 0], scores[:, 1], scores[:, 2])
+
+    valid = (scores.sum(axis=1) > 0).sum()
+    assert density.total == valid, "Only rows with a positive total should be counted"
+    assert density.counts.sum() == valid, "Each point should fall in exactly one cell"
+
+def test_streamed_batches_match_single_pass():
+    """Test that adding in chunks gives the same counts as one batch."""
+    rng = np.random.default_rng(1)
+    scores = rng.random((5000, 3))
+
+    single = TernaryDensity(resolution=20).add(*scores.T)
+    chunked = TernaryDensity(resolution=20)
+    for chunk in np.array_split(scores, 7):
+        chunked.add(*chunk.T)
+
+    assert np.array_equal(single.counts, chunked.counts), "Chunked binning should match single pass"
+
+def test_image_places_vertices_in_the_right_corners():
+    """Test that a pure PreModern score lights up the bottom-right corner of the raster."""
+    density = TernaryDensity(resolution=10).add([100], [0], [0])
+    image = density.to_image(width=100, scale="linear")
+
+    assert image.shape == (87, 100), "Height should follow the triangle's aspect ratio"
+    assert image[0, 95] == 1, "PreModern vertex should be bottom right"
+    assert image[0, 5] == 0, "PostModern corner should be empty"
+    assert np.isnan(image[-1, 0]), "Pixels outside the triangle should be NaN"
+    assert np.nanmax(density.to_image(width=100, scale="log")) == pytest.approx(np.log(2))
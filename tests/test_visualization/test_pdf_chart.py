@@ -0,0 +1,44 @@
+import pytest
+from src.visualization.pdf_chart import GRIDLINES, SQRT3_2, draw_ternary_chart, plottable, project
+from src.visualization.pdf_fragments import new_report_pdf
+
+@pytest.mark.parametrize("scores, expected", [
+    ([100, 0, 0], (1.0, 0.0)),
+    ([0, 100, 0], (0.5, SQRT3_2)),
+    ([0, 0, 100], (0.0, 0.0)),
+    ([2, 1, 1], (0.625, SQRT3_2 / 4)),
+])
+def test_projection_matches_the_plotter_layout(scores, expected):
+    """Test that PreModern is bottom right, Modern top and PostModern bottom left."""
+    assert project(scores) == pytest.approx(expected), "Projection should follow the TernaryPlotter layout"
+
+def test_grid_has_nine_lines_per_edge():
+    """Test the precomputed 10% gridlines."""
+    assert len(GRIDLINES) == 27, "Each of the three edges should have nine gridlines"
+
+def test_chart_is_vector_only_and_leaves_state_alone():
+    """Test that drawing the chart embeds no images and restores the document's drawing state."""
+    pdf = new_report_pdf()
+    pdf.add_page()
+    pdf.set_font("Times", style="B", size=15)
+    before = (pdf.font_family, pdf.font_style, pdf.font_size_pt, pdf.draw_color, pdf.fill_color,
+              pdf.text_color, pdf.line_width, pdf.x, pdf.y)
+
+    draw_ternary_chart(pdf, x=15, y=40, width=180, height=153,
+                       average=[40, 35, 25], points=[[70, 20, 10], [10, 80, 10]], shading=True)
+
+    after = (pdf.font_family, pdf.font_style, pdf.font_size_pt, pdf.draw_color, pdf.fill_color,
+             pdf.text_color, pdf.line_width, pdf.x, pdf.y)
+    assert after == before, "Font, colours, line width and cursor should be restored"
+    assert pdf.pages[1].count("\nq\n") == pdf.pages[1].count("\nQ\n") == 1, "Drawing should be wrapped in q/Q"
+    assert not pdf.images, "The chart should not embed any images"
+
+@pytest.mark.parametrize("scores", [[0, 0, 0], [float("nan"), 20, 70], [1e308, 1e308, 1]])
+def test_unplottable_scores_are_left_off_the_chart(scores):
+    """Test that scores with no position on the triangle are skipped instead of dividing by zero."""
+    assert not plottable(scores), "Zero, NaN and overflowing totals have no position"
+    pdf = new_report_pdf()
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+    draw_ternary_chart(pdf, x=15, y=40, width=180, height=153, average=scores, points=[scores, [40, 35, 25]])
+    assert "nan" not in pdf.pages[1], "No marker should be drawn at a non-finite position"
@@ -0,0 +1,45 @@
+from src.visualization.pdf_fragments import build_fragment, new_report_pdf, splice_fragment
+
+def draw_sections(pdf):
+    pdf.set_font("Arial", style="B", size=18)
+    pdf.cell(0, 12, txt="Heading", ln=True)
+    for i in range(8):
+        pdf.set_font("Arial", style="B", size=13)
+        pdf.cell(0, 10, txt=f"Section {i}", ln=True)
+        pdf.set_font("Arial", size=11)
+        pdf.multi_cell(0, 8, txt="Lorem ipsum dolor sit amet. " * 20)
+
+def report_with_first_page(pdf):
+    pdf.add_page()
+    pdf.set_font("Times", style="I", size=14)
+    pdf.cell(0, 10, txt="Personalised first page", ln=True)
+    return pdf
+
+def test_spliced_pages_match_direct_layout():
+    """Test that splicing a multi-page fragment gives the same pages as laying it out in place."""
+    direct = report_with_first_page(new_report_pdf())
+    direct.add_page()
+    draw_sections(direct)
+
+    spliced = report_with_first_page(new_report_pdf())
+    splice_fragment(spliced, build_fragment(draw_sections))
+
+    assert spliced.page == direct.page > 2, "Fragment should overflow onto the same number of pages"
+    # Laid out in place, the fragment's first page opens by re-selecting the first page's font
+    carried_font = "BT /F1 14.00 Tf ET\n"
+    assert carried_font in direct.pages[2], "Direct layout should carry the first page's font over"
+    assert spliced.pages[2] == direct.pages[2].replace(carried_font, "", 1), "First fragment page should match"
+    for n in range(3, direct.page + 1):
+        assert spliced.pages[n] == direct.pages[n], f"Page {n} content should match, including font ids"
+    assert (spliced.x, spliced.y) == (direct.x, direct.y), "Cursor should continue where the fragment ended"
+    assert spliced.current_font == direct.current_font, "Font state should continue from the fragment"
+
+def test_fragment_is_reusable():
+    """Test that one fragment can be spliced into several documents."""
+    fragment = build_fragment(draw_sections)
+    first = report_with_first_page(new_report_pdf())
+    second = report_with_first_page(new_report_pdf())
+    splice_fragment(first, fragment)
+    splice_fragment(second, fragment)
+
+    assert first.output(dest="S") == second.output(dest="S"), "Both documents should be identical"
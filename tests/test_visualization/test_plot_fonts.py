@@ -0,0 +1,10 @@
+import matplotlib
+from matplotlib import font_manager
+from src.visualization.plot_fonts import PREFERRED_FAMILIES, plot_font
+
+def test_plot_font_is_installed():
+    """Test that the resolved family exists, so matplotlib never falls back per label."""
+    family = plot_font()
+    assert family in PREFERRED_FAMILIES
+    assert family in {font.name for font in font_manager.fontManager.ttflist}
+    assert matplotlib.rcParams['font.sans-serif'][0] == family
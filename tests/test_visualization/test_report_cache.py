@@ -0,0 +1,51 @@
+import os
+import pytest
+from src.visualization.report_cache import ReportCache
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fixture to create a small two-tier cache in a temporary directory."""
+    return ReportCache(max_entries=2, disk_dir=str(tmp_path), disk_max_bytes=1000)
+
+def test_key_depends_on_every_input():
+    """Test that keys are stable for equal inputs and differ otherwise."""
+    key = ReportCache.key(perspective="Modern", scores=[20.0, 60.0, 20.0], chart="abc")
+    assert key == ReportCache.key(chart="abc", scores=[20.0, 60.0, 20.0], perspective="Modern"), \
+        "Argument order should not matter"
+    assert key != ReportCache.key(perspective="Modern", scores=[20.0, 60.1, 19.9], chart="abc"), \
+        "Different scores should give a different key"
+
+def test_memory_eviction_falls_back_to_disk(cache):
+    """Test that a report evicted from memory is still served from disk and promoted."""
+    for name in ("a", "b", "c"):
+        cache.put(name, name.encode() * 10)
+
+    assert cache.get("a") == b"a" * 10, "Evicted entry should come back from disk"
+    assert cache.get("a") == b"a" * 10, "Promoted entry should be served from memory"
+    assert cache.get("missing") is None, "Unknown keys should miss"
+
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 1), \
+        "Counters should record one hit per tier and one miss"
+
+def test_disk_is_trimmed_oldest_first(cache, tmp_path):
+    """Test that the disk tier stays under its size limit by removing the oldest reports."""
+    for i in range(5):
+        cache.put(f"report{i}", b"x" * 300)
+        os.utime(tmp_path / f"report{i}.pdf", (i, i))
+
+    remaining = sorted(path.name for path in tmp_path.glob("*.pdf"))
+    assert sum(path.stat().st_size for path in tmp_path.glob("*.pdf")) <= 1000, "Disk tier should respect its limit"
+    assert "report4.pdf" in remaining and "report0.pdf" not in remaining, "Oldest reports should go first"
+
+def test_get_or_create_builds_once(cache):
+    """Test that a cached report is not rebuilt."""
+    builds = []
+
+    def build():
+        builds.append(1)
+        return b"%PDF"
+
+    assert cache.get_or_create("k", build) == b"%PDF"
+    assert cache.get_or_create("k", build) == b"%PDF"
+    assert len(builds) == 1, "Second request should be served from the cache"
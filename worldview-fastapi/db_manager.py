@@ -1,13 +1,21 @@
+import math
 import os
+import threading
 import time
 import mysql.connector
 from mysql.connector import Error, pooling
+from mysql.connector.constants import DEFAULT_CONFIGURATION
+from mysql.connector.errors import PoolError
 import logging
 from contextlib import contextmanager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# mysql-connector 9.3 added per-operation socket timeouts; before that the
+# pure Python connection applied its connect timeout to every read and write
+SOCKET_TIMEOUT_OPTIONS = tuple(name for name in ('read_timeout', 'write_timeout') if name in DEFAULT_CONFIGURATION)
+
 class DatabaseManager:
     def __init__(self):
         logger.info("Initializing DatabaseManager")
@@ -16,20 +24,83 @@ def __init__(self):
         self._config = self._get_db_config()
         logger.info(f"Database config (sanitized): {self._sanitize_config(self._config)}")
         
-        # Initialize connection pool
+        # The pool is created empty and its connections are opened by warm_up(),
+        # on a background thread, so a slow Cloud SQL handshake never blocks startup
         self.pool_config = {
             'pool_name': 'mypool',
             'pool_size': 5,
             'pool_reset_session': True,
-            **self._config
         }
-        
-        try:
-            self.pool = mysql.connector.pooling.MySQLConnectionPool(**self.pool_config)
-            logger.info("Connection pool created successfully")
-        except Error as e:
-            logger.error(f"Error creating connection pool: {e}")
-            raise
+        self.ready_connections = min(int(os.getenv('DB_READY_CONNECTIONS', '1')), self.pool_config['pool_size'])
+        self.pool = None
+        self.warm_connections = 0
+        self.last_error = None
+        self._ready = threading.Event()
+        self._stopping = threading.Event()
+        self._warm_up_thread = None
+        self._warm_up_lock = threading.Lock()
+        self._probe_connection = None
+
+    @property
+    def is_ready(self) -> bool:
+        """True once `ready_connections` pooled connections are open"""
+        return self._ready.is_set()
+
+    def readiness(self) -> dict:
+        return {
+            "ready": self.is_ready,
+            "warm_connections": self.warm_connections,
+            "required_connections": self.ready_connections,
+            "pool_size": self.pool_config['pool_size'],
+            "last_error": self.last_error
+        }
+
+    def start_warm_up(self) -> threading.Thread:
+        """Start warm_up() on a daemon thread, unless it is already running or done"""
+        with self._warm_up_lock:
+            if self._warm_up_thread is None:
+                self._warm_up_thread = threading.Thread(target=self.warm_up, name="db-warm-up", daemon=True)
+                self._warm_up_thread.start()
+            return self._warm_up_thread
+
+    def stop_warm_up(self):
+        self._stopping.set()
+
+    def warm_up(self, retry_delay: float = 1.0, max_delay: float = 30.0):
+        """
+        Create the pool and open its connections one at a time, retrying with
+        backoff until the pool is full. Readiness flips as soon as
+        `ready_connections` are open.
+        """
+        self.pool = mysql.connector.pooling.MySQLConnectionPool(**self.pool_config)
+        self.pool.set_config(**self._config)
+        delay = retry_delay
+        while self.warm_connections < self.pool_config['pool_size'] and not self._stopping.is_set():
+            started = time.monotonic()
+            try:
+                # Connect without the pool's lock, which pool.add_connection()
+                # would hold for the whole handshake, blocking get_connection()
+                connection = mysql.connector.connect(**self._config)
+                if self._stopping.is_set():
+                    connection.close()
+                    break
+                # Tag it as the pool does, so its first checkout does not reconnect
+                connection.pool_config_version = self.pool._config_version
+                self.pool.add_connection(connection)
+            except Error as e:
+                self.last_error = str(e)
+                logger.warning(f"Could not open pooled connection, retrying in {delay:.0f}s: {e}")
+                self._stopping.wait(delay)
+                delay = min(delay * 2, max_delay)
+                continue
+            self.warm_connections += 1
+            self.last_error = None
+            delay = retry_delay
+            logger.info(f"Opened pooled connection {self.warm_connections}/{self.pool_config['pool_size']} "
+                        f"in {time.monotonic() - started:.2f}s")
+            if self.warm_connections >= self.ready_connections and not self._ready.is_set():
+                self._ready.set()
+                logger.info("Database ready")
 
     def _sanitize_config(self, config):
         """Remove sensitive info for logging"""
@@ -61,21 +132,44 @@ def _get_db_config(self):
                 'connect_timeout': 10
             }
 
+    @property
+    def is_warming_up(self) -> bool:
+        """True while the pool is still opening connections"""
+        return (self.warm_connections < self.pool_config['pool_size']
+                and self._warm_up_thread is not None and self._warm_up_thread.is_alive())
+
     @contextmanager
-    def get_connection(self):
-        """Get a connection from the pool with context management"""
+    def get_connection(self, timeout: float = None):
+        """Get a connection from the pool with context management, waiting up to
+        `timeout` seconds (default: connect_timeout) for the pool to warm up.
+        While it is warming up, an exhausted pool is retried until the timeout."""
         connection = None
         try:
-            connection = self.pool.get_connection()
-            logger.info("Got connection from pool")
+            self.start_warm_up()
+            if timeout is None:
+                timeout = self._config.get('connect_timeout', 10)
+            deadline = time.monotonic() + timeout
+            if not self._ready.wait(timeout):
+                raise PoolError(f"Database is not ready: {self.last_error or 'still connecting'}")
+            while connection is None:
+                try:
+                    connection = self.pool.get_connection()
+                except PoolError:
+                    # More connections are on the way; a full pool would not recover this soon
+                    if not self.is_warming_up or time.monotonic() >= deadline:
+                        raise
+                    time.sleep(0.05)
+            logger.debug("Got connection from pool")
             yield connection
         except Error as e:
-            logger.error(f"Error getting connection from pool: {e}")
+            # Callers that do not wait are polling, and handle the failure themselves
+            log = logger.debug if timeout == 0 else logger.error
+            log("Error getting connection from pool: %s", e)
             raise
         finally:
             if connection:
                 connection.close()
-                logger.info("Connection returned to pool")
+                logger.debug("Connection returned to pool")
 
     def save_response(self, survey_data: dict) -> int:
         """Save survey response with retries"""
@@ -84,7 +178,7 @@ def save_response(self, survey_data: dict) -> int:
         
         for attempt in range(1, max_attempts + 1):
             try:
-                logger.info(f"Save attempt {attempt}/{max_attempts}")
+                logger.debug("Save attempt %s/%s", attempt, max_attempts)
                 
                 with self.get_connection() as connection:
                     cursor = connection.cursor()
@@ -104,7 +198,6 @@ def save_response(self, survey_data: dict) -> int:
                     connection.commit()
                     
                     record_id = cursor.lastrowid
-                    logger.info(f"Successfully saved survey response with ID: {record_id}")
                     cursor.close()
                     return record_id
 
@@ -118,6 +211,54 @@ def save_response(self, survey_data: dict) -> int:
 
         raise RuntimeError(f"Failed to save survey after {max_attempts} attempts: {last_error}")
 
+    def get_score_counts(self) -> list:
+        """Count responses per distinct (n1, n2, n3), used to seed the population histogram"""
+        with self.get_connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute("""SELECT n1, n2, n3, COUNT(*) FROM survey_results
+                WHERE n1 IS NOT NULL AND n2 IS NOT NULL AND n3 IS NOT NULL
+                GROUP BY n1, n2, n3""")
+            rows = cursor.fetchall()
+            cursor.close()
+            return rows
+
+    def health_probe(self, timeout: float = 5.0) -> dict:
+        """
+        Cheap liveness query for the health monitor. The record count is the
+        table statistics estimate, so probing never scans survey_results.
+
+        Runs on a connection of its own, outside the pool, whose socket gives
+        up after `timeout` seconds, so a hung database fails the probe instead
+        of blocking its thread or taking a pooled connection.
+        """
+        try:
+            if self._probe_connection is None:
+                seconds = max(1, math.ceil(timeout))  # Whole seconds, as the connector requires
+                config = {**self._config, 'connect_timeout': seconds, 'use_pure': True}
+                config.update((name, seconds) for name in SOCKET_TIMEOUT_OPTIONS)
+                self._probe_connection = mysql.connector.connect(**config)
+            cursor = self._probe_connection.cursor()
+            cursor.execute("SELECT 1")
+            db_result = cursor.fetchone()[0]
+            cursor.execute("""SELECT TABLE_ROWS FROM information_schema.TABLES
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'survey_results'""")
+            row = cursor.fetchone()
+            cursor.close()
+        except Exception:
+            # Reconnect on the next probe
+            connection, self._probe_connection = self._probe_connection, None
+            if connection is not None:
+                try:
+                    connection.close()
+                except Error:
+                    pass
+            raise
+        return {
+            "db_result": db_result,
+            "record_count_estimate": row[0] if row else None,
+            "connection_type": "unix_socket" if "unix_socket" in self._config else "tcp"
+        }
+
     def test_connection(self):
         """Test database connectivity"""
         try:
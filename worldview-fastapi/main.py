@@ -1,36 +1,47 @@
 # Debugging MySQL connexion
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 
 # main.py
 # Standard library imports
 import os
+import asyncio
 from pathlib import Path
 import logging
 import uuid
-import json
 from decimal import Decimal
 
 # Third-party imports
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBasic
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import FileResponse
-from src.api.routes import pdf_routes
+from fastapi.responses import FileResponse, JSONResponse
+from starlette.concurrency import run_in_threadpool
+from src.api.routes import chart_routes, metrics_routes, pdf_routes, population_routes, report_routes
+from src.api.render_pool import render_pool
+from src.api.report_jobs import report_jobs
+from src.api.health import health_monitor
+from src.api.prepared_json import PreparedBody, PreparedJSON
+from src.api.static_assets import StaticAssets
+from src.api.fast_json import FastJSONResponse
+from src.api.log_pipeline import PAYLOAD_LOGGER, configure_logging
+from src.api.asgi_middleware import CompressionMiddleware, SecurityHeadersMiddleware
 
 # Local application imports
 from models import SurveyResponse, Question
 from db_manager import DatabaseManager
 from src.visualization.perspective_analyzer import PerspectiveAnalyzer
+from src.data.survey_content import calculate_perspective_scores, get_questions, get_templates
+from src.data.ternary_histogram import population_histogram
 
 # Dev environment setup
 from dotenv import load_dotenv
 load_dotenv()  # This loads .env in development
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Log through a queue so requests never wait on stderr; LOG_LEVEL sets the level
+configure_logging()
 logger = logging.getLogger(__name__)
+payload_logger = logging.getLogger(PAYLOAD_LOGGER)
 
 # Create single database manager instance
 logger.info("Creating database manager instance")
@@ -40,43 +51,57 @@
 # Get base directory for data files
 BASE_DIR = Path(__file__).resolve().parent
 
+HISTOGRAM_FLUSH_SECONDS = float(os.getenv('HISTOGRAM_FLUSH_SECONDS', '30'))
+
+async def flush_histogram_periodically():
+    """Merge this worker's submissions into the shared population histogram"""
+    while True:
+        try:
+            await run_in_threadpool(population_histogram.flush, db_manager.get_score_counts)
+        except Exception as e:
+            logger.error(f"Error flushing population histogram: {e}")
+        await asyncio.sleep(HISTOGRAM_FLUSH_SECONDS)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open database connections in the background; requests that don't need
+    # the database are served meanwhile, and /api/ready reports progress
+    db_manager.start_warm_up()
+    health_monitor.start(db_manager.health_probe)
+    histogram_task = asyncio.create_task(flush_histogram_periodically())
+    yield
+    db_manager.stop_warm_up()
+    health_monitor.stop()
+    histogram_task.cancel()
+    try:
+        await run_in_threadpool(population_histogram.flush)
+    except Exception as e:
+        logger.error(f"Error flushing population histogram on shutdown: {e}")
+    report_jobs.cancel_all()
+    render_pool.shutdown()
+
 # Create FastAPI app
 app = FastAPI(
     title="Modernity Worldview Analysis API",
     description="API for the Modernity Worldview Analysis survey",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # Add a context manager for database operations
 @contextmanager
 def get_db():
-    logger.info("Entering database context")
+    """A pooled connection, returned to the pool on exit"""
     try:
-        logger.info("Attempting to connect database")
-        db_manager.connect()
-        logger.info("Database connected successfully")
-        yield db_manager
+        with db_manager.get_connection() as connection:
+            yield connection
     except Exception as e:
         logger.error(f"Database context error: {e}", exc_info=True)
         raise
-    finally:
-        logger.info("Exiting database context")
-        try:
-            if hasattr(db_manager, 'connection') and db_manager.connection:
-                db_manager.connection.close()
-                logger.info("Database connection closed")
-        except Exception as e:
-            logger.error(f"Error closing database connection: {e}")
-
-def decimal_to_float(obj):
-    """Convert Decimal to float for JSON serialization."""
-    if isinstance(obj, Decimal):
-        return float(obj)
-    raise TypeError(f"Type {type(obj)} not serializable")
 
 @app.post("/api/submit")
 async def submit_survey(response: SurveyResponse):
-    logger.info(f"🚀 Received survey submission: {response.dict()}")
     try:
         data = response.dict()
 
@@ -85,11 +110,18 @@ async def submit_survey(response: SurveyResponse):
             if isinstance(data[key], Decimal):
                 data[key] = float(data[key])
 
-        logger.info(f"📥 Received survey data: {json.dumps(data, indent=2, default=decimal_to_float)}")
+        # Formatted on the logging thread, and only for sampled requests
+        payload_logger.info("📥 Received survey data: %s", data)
 
-        # Save the response
-        record_id = db_manager.save_response(data)
-        logger.info(f"✅ Saved survey response with ID: {record_id}")
+        # Save the response off the event loop
+        record_id = await run_in_threadpool(db_manager.save_response, data)
+        logger.info("✅ Saved survey response with ID: %s", record_id)
+
+        if None not in (data["n1"], data["n2"], data["n3"]):
+            try:
+                population_histogram.add(data["n1"], data["n2"], data["n3"])
+            except ValueError as e:
+                logger.warning("Response not added to population histogram: %s", e)
 
         return {
             "status": "success",
@@ -102,19 +134,19 @@ async def submit_survey(response: SurveyResponse):
         logger.error(f"❌ Submission error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
     
-# Setup templates - add this right after app creation
-templates = Jinja2Templates(directory="templates")
-
-# Create a custom StaticFiles instance for JSX files
-class JSXStaticFiles(StaticFiles):
-    async def get_response(self, path: str, scope):
-        response = await super().get_response(path, scope)
-        if path.endswith('.jsx'):
-            response.headers['content-type'] = 'text/javascript'
-        return response
+# Static files are read and compressed once, and served under content-hashed URLs
+static_assets = StaticAssets(BASE_DIR / "static")
+
+# index.html has no per-request context, so it is rendered once, at startup
+templates = Jinja2Templates(directory=BASE_DIR / "templates")
+index_page = PreparedBody(
+    templates.get_template("index.html").render(static_url=static_assets.url).encode("utf-8"),
+    "text/html"
+)
 
-# Mount static files
-app.mount("/static", JSXStaticFiles(directory="static"), name="static")
+@app.api_route("/static/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def static_file(path: str, request: Request):
+    return static_assets.response(path, request)
 
 # Add CORS middleware
 app.add_middleware(
@@ -130,15 +162,17 @@ async def get_response(self, path: str, scope):
 )
 
 app.include_router(pdf_routes.router, prefix="/api")
-
-@app.middleware("http")
-async def add_security_headers(request, call_next):
-    response = await call_next(request)
-    response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Content-Security-Policy"] = (
+app.include_router(report_routes.router, prefix="/api")
+app.include_router(chart_routes.router, prefix="/api")
+app.include_router(population_routes.router, prefix="/api")
+app.include_router(metrics_routes.router, prefix="/api")
+
+SECURITY_HEADERS = {
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Content-Security-Policy": (
         "default-src 'self' https:; "
         "img-src 'self' https: data:; "
         "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net https://unpkg.com; "
@@ -146,77 +180,50 @@ async def add_security_headers(request, call_next):
         "font-src 'self' data: https://fonts.gstatic.com; "
         "connect-src 'self' https://unpkg.com"
     )
-    return response
+}
+
+# Pure ASGI middleware, innermost first: compress, then add the security
+# headers to everything
+app.add_middleware(CompressionMiddleware, minimum_size=int(os.getenv('COMPRESSION_MIN_BYTES', '500')))
+app.add_middleware(SecurityHeadersMiddleware, headers=SECURITY_HEADERS)
 
 @app.get("/")
 async def root(request: Request):
-    logger.info("Handling root request")
-    try:
-        return templates.TemplateResponse("index.html", {"request": request})
-    except Exception as e:
-        logger.error(f"Error rendering template: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    """The pre-rendered index page; repeat visits get a 304"""
+    return index_page.response(request)
 
+# Survey content is read from disk once per process; the questions are also
+# serialized and compressed once, for /api/questions
 def load_questions():
-    try:
-        path = BASE_DIR / "src" / "data" / "questions_responses.json"
-        logger.info(f"Attempting to load questions from: {path}")
-        
-        with open(path) as f:
-            data = json.load(f)
-            logger.info(f"Questions data loaded: {data.keys()}")  # Log the keys
-            if "questions" not in data:
-                logger.error("No 'questions' key in loaded data")
-                return None
-            logger.info(f"Questions loaded successfully: {len(data['questions'])} questions")
-            return data
-            
-    except Exception as e:
-        logger.error(f"Error loading questions: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Error loading questions: {str(e)}")
+    return {"questions": get_questions()}
 
 def load_templates():
-    try:
-        path = BASE_DIR / "src" / "data" / "response_templates.json"
-        logger.info(f"Attempting to load templates from: {path}")
-        
-        with open(path) as f:
-            data = json.load(f)
-            logger.info(f"Templates data loaded: {data.keys()}")  # Log the keys
-            if "categories" not in data:
-                logger.error("No 'categories' key in loaded data")
-                return None
-            logger.info(f"Templates loaded successfully: {len(data['categories'])} categories")
-            return data["categories"]
-            
-    except Exception as e:
-        logger.error(f"Error loading templates: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Error loading templates: {str(e)}")
+    return get_templates()
+
+questions_payload = PreparedJSON(load_questions())
+logger.info(f"Questions loaded successfully: {len(get_questions())} questions, "
+            f"{len(questions_payload.body)} bytes")
 
 @app.post("/api/analyze")
 async def analyze_survey(responses: dict):
     try:
-        logger.info(f"Received responses: {responses}")
+        payload_logger.info("Received responses: %s", responses)
         
         # Load and check questions data
         questions_data = load_questions()
-        logger.info(f"Questions data type: {type(questions_data)}")
         if not questions_data or "questions" not in questions_data:
             raise HTTPException(status_code=500, detail="Invalid questions data format")
             
         questions = questions_data["questions"]
-        logger.info(f"Questions loaded: {len(questions)} questions")
         
         # Load and check templates
         templates = load_templates()
-        logger.info(f"Templates type: {type(templates)}")
         if not templates:
             raise HTTPException(status_code=500, detail="Invalid templates data format")
         
         # Calculate perspective scores
-        logger.info("Calculating perspective scores...")
         total_scores = calculate_perspective_scores(responses, questions)
-        logger.info(f"Calculated scores: {total_scores}")
+        logger.debug("Calculated scores: %s", total_scores)
         
         # Get analysis and description
         analysis = PerspectiveAnalyzer.get_perspective_summary(total_scores)
@@ -225,44 +232,47 @@ async def analyze_survey(responses: dict):
         # Get category responses
         category_responses = get_category_responses(analysis, templates)
         
-        return {
+        response_data = {
             "status": "success",
             "perspective": description,
             "scores": total_scores,
             "analysis": analysis,
             "category_responses": category_responses
         }
+        payload_logger.info("Returning response: %s", response_data)
+        return response_data
         
     except Exception as e:
         logger.error(f"Error in analyze_survey: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
         
+@app.get("/api/live")
+async def liveness():
+    """The process is up and serving; says nothing about the database"""
+    return {"status": "alive"}
+
+@app.get("/api/ready")
+async def readiness():
+    """503 until the database connection pool is warm"""
+    status = db_manager.readiness()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+# The health endpoints report the health monitor's last probe and never touch
+# the database themselves
 @app.get("/api/health")
 async def health_check():
-    try:
-        db_manager.connect()  # This will reconnect if needed
-        return {
-            "status": "healthy",
-            "database": "connected"
-        }
-    except Exception as e:
-        return {
-            "status": "unhealthy",
-            "database": str(e)
-        }
-    
+    status = health_monitor.status()
+    return {
+        "status": status["status"],
+        "database": "connected" if status["status"] == "healthy" else status["error"],
+        "checked_at": status["checked_at"],
+        "age": status.get("age")
+    }
+
 @app.get("/api/db-health")
 async def db_health():
-    """Test database connection from FastAPI."""
-    try:
-        connection = db_manager.get_connection()
-        cursor = connection.cursor()
-        cursor.execute("SELECT 1")
-        result = cursor.fetchone()
-        connection.close()
-        return {"status": "healthy", "db_result": result[0]}
-    except Exception as e:
-        return {"status": "unhealthy", "error": str(e)}
+    """Last database probe, including its latency"""
+    return health_monitor.status()
     
 @app.get("/debug-paths")
 async def debug_paths():
@@ -294,88 +304,10 @@ async def debug():
         return {"error": str(e)}
 
 @app.get("/api/questions")
-async def get_questions():
-    try:
-        questions = load_questions()
-        logger.info(f"Returning questions data: {questions}")
-        return questions
-    except Exception as e:
-        logger.error(f"Error getting questions: {e}")
-        return {"error": str(e)}
+async def serve_questions(request: Request):
+    """The questions, pre-serialized; conditional requests get a 304"""
+    return questions_payload.response(request)
     
-@app.post("/api/analyze")
-async def analyze_survey(responses: dict):
-    try:
-        logger.info(f"Received responses: {responses}")
-        
-        questions_data = load_questions()["questions"]
-        logger.info(f"Loaded questions data")
-        
-        templates = load_templates()
-        logger.info(f"Loaded templates")
-        
-        # Calculate perspective scores
-        logger.info("Calculating perspective scores...")
-        total_scores = calculate_perspective_scores(responses, questions_data)
-        logger.info(f"Calculated scores: {total_scores}")
-        
-        # Get analysis and description
-        logger.info("Getting perspective analysis...")
-        analysis = PerspectiveAnalyzer.get_perspective_summary(total_scores)
-        logger.info(f"Analysis: {analysis}")
-        
-        description = PerspectiveAnalyzer.get_perspective_description(analysis)
-        logger.info(f"Description: {description}")
-        
-        # Get category responses based on analysis
-        logger.info("Getting category responses...")
-        category_responses = get_category_responses(analysis, templates)
-        
-        response_data = {
-            "status": "success",
-            "perspective": description,
-            "scores": total_scores,
-            "analysis": analysis,
-            "category_responses": category_responses
-        }
-        logger.info(f"Returning response: {response_data}")
-        
-        return response_data
-        
-    except Exception as e:
-        logger.error(f"Error analyzing survey: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
-
-def calculate_perspective_scores(responses: dict, questions_data: dict) -> list:
-    """Calculate aggregate perspective scores from survey responses."""
-    total_scores = [0, 0, 0]  # [PreModern, Modern, PostModern]
-    
-    for q_id, response_num in responses.items():
-        if response_num is not None:  # Skip any None responses
-            # Convert 'q4_response' → 'Q4' before lookup
-            question_key = q_id.replace("_response", "").upper()
-
-            if question_key in questions_data:
-                question = questions_data[question_key]
-            else:
-                raise KeyError(f"❌ Question key not found: {question_key}")
-
-            # Response numbers are 1-based, list indices are 0-based
-            response_idx = response_num - 1
-            if 0 <= response_idx < len(question["responses"]):
-                scores = question["responses"][response_idx]["scores"]
-                total_scores = [a + b for a, b in zip(total_scores, scores)]
-    
-    # Convert to percentages
-    total = sum(total_scores)
-    if total > 0:
-        normalized_scores = [round((score / total) * 100, 1) for score in total_scores]
-        # Ensure scores sum to exactly 100
-        adjustment = 100 - sum(normalized_scores)
-        normalized_scores[-1] += adjustment  # Add any rounding difference to last score
-        return normalized_scores
-    return [0, 0, 0]
-
 def get_category_responses(analysis: dict, templates: dict) -> dict:
     """Get appropriate template responses for each category based on analysis."""
     perspective_type = analysis['primary']
@@ -417,18 +349,15 @@ async def test_endpoint():
 async def test_route():
     return {"status": "route exists"}
 
-@app.get("/api/test-db")
 @app.get("/api/test-db")
 async def test_db():
-    """Test database connection."""
-    logger.info("Starting database connection test")
-    try:
-        result = db_manager.test_connection()
-        logger.info(f"Test completed: {result}")
-        return result
-    except Exception as e:
-        logger.error(f"Database test failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    """Last database probe, with the (sanitized) connection config"""
+    status = health_monitor.status()
+    return {
+        **status,
+        "status": "success" if status["status"] == "healthy" else "error",
+        "config": db_manager._sanitize_config(db_manager._config)
+    }
     
 @app.get("/api/connexion-test")
 async def test_connection():
@@ -0,0 +1,180 @@
+# src/api/asgi_middleware.py
+"""
+Pure ASGI middleware: each one wraps `send` and edits the response start
+message in place, instead of going through BaseHTTPMiddleware's per-request
+task and body streaming. Header names and values are encoded once, when the
+app is built.
+"""
+
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.prepared_json import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # Optional; gzip is always available
+    brotli = None
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+def encode_headers(headers: Dict[str, str]) -> RawHeaders:
+    return [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
+
+class SecurityHeadersMiddleware:
+    """Sets a fixed set of headers on every HTTP response, replacing any the app set"""
+
+    def __init__(self, app: ASGIApp, headers: Dict[str, str]):
+        self.app = app
+        self.raw_headers = encode_headers(headers)
+        self.names = {name for name, _ in self.raw_headers}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    header for header in message.get("headers", ()) if header[0] not in self.names
+                ] + self.raw_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "image/svg+xml")
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """A strong ETag for the encoded representation (as PreparedBody does); weak ones already fit"""
+    if etag.startswith("W/") or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+class CompressionMiddleware:
+    """
+    Compresses text responses with brotli (when installed) or gzip, by the
+    client's Accept-Encoding. Responses that are already encoded (such as
+    PreparedJSON variants), partial, or smaller than `minimum_size` pass
+    through untouched.
+
+    A compressed response's strong ETag gets an -<encoding> suffix. That
+    suffix is stripped from If-None-Match before the app sees it, and put
+    back on the app's 304, so routes only ever deal in their own ETags.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, gzip_level: int = 6,
+                 brotli_quality: int = 4, compressible_types: Iterable[str] = COMPRESSIBLE_TYPES):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.compressible_types = tuple(compressible_types)
+
+    def _encoding(self, scope: Scope) -> Optional[str]:
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        if not accept_encoding:
+            return None
+        accepted = accepted_encodings(accept_encoding)
+        for coding in ("br", "gzip") if brotli is not None else ("gzip",):
+            if accepted.get(coding, accepted.get("*", 0)) > 0:
+                return coding
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        encoding = self._encoding(scope) if scope["type"] == "http" else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        suffix = f'-{encoding}"'.encode("latin-1")
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        if suffix in if_none_match.encode("latin-1"):
+            scope = {**scope, "headers": [
+                (name, value.replace(suffix, b'"') if name == b"if-none-match" else value)
+                for name, value in scope["headers"]
+            ]}
+        await self.app(scope, receive, _CompressingSend(self, send, encoding, if_none_match))
+
+class _CompressingSend:
+    """The `send` for one compressed response"""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: str, if_none_match: str = ""):
+        self.middleware = middleware
+        self.send = send
+        self.encoding = encoding
+        self.if_none_match = if_none_match
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.compressor = None
+
+    def _compressor(self):
+        if self.encoding == "br":
+            return brotli.Compressor(quality=self.middleware.brotli_quality)
+        return zlib.compressobj(self.middleware.gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def _compress(self, data: bytes, finish: bool) -> bytes:
+        if self.encoding == "br":
+            output = self.compressor.process(data)
+            return output + (self.compressor.finish() if finish else self.compressor.flush())
+        output = self.compressor.compress(data)
+        return output + self.compressor.flush(zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH)
+
+    async def __call__(self, message: Message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            message.setdefault("headers", [])
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                not 200 <= message["status"] < 300
+                or message["status"] in (204, 206)
+                or "content-encoding" in headers
+                or not content_type.startswith(self.middleware.compressible_types)
+            )
+            if message["status"] == 304 and self.if_none_match:
+                # Answer with the tag the client actually holds
+                etag = headers.get("etag")
+                if etag and encoded_etag(etag, self.encoding) in self.if_none_match:
+                    mutable = MutableHeaders(scope=message)
+                    mutable["ETag"] = encoded_etag(etag, self.encoding)
+                    mutable.add_vary_header("Accept-Encoding")
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start = message  # Sent with the first body chunk
+            return
+
+        if self.passthrough or message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self.send(self.start)
+                await self.send(message)
+                return
+
+            headers = MutableHeaders(scope=self.start)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], self.encoding)
+            self.compressor = self._compressor()
+            body = self._compress(body, finish=not more_body)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(body))
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        await self.send({"type": "http.response.body", "body": self._compress(body, finish=not more_body),
+                         "more_body": more_body})
@@ -0,0 +1,23 @@
+# src/api/fast_json.py
+
+from decimal import Decimal
+
+import orjson
+from starlette.responses import JSONResponse
+
+def _default(obj):
+    """Types orjson does not serialize natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+def dumps(content) -> bytes:
+    """Compact UTF-8 JSON; Decimals become floats and numpy values are supported"""
+    return orjson.dumps(content, default=_default,
+                        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+class FastJSONResponse(JSONResponse):
+    """The app's default response class: JSONResponse rendered with orjson"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
@@ -0,0 +1,117 @@
+# src/api/health.py
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+class HealthMonitor:
+    """
+    Probes the database from one background task and keeps the last result.
+
+    Health endpoints read `status()`, a dict that is replaced whole after each
+    probe, so a load balancer checking every few seconds on every worker costs
+    one probe per `interval` per worker instead of one query per check. A probe
+    that takes longer than `timeout` seconds counts as a failure; the probe is
+    given the timeout too, and no new probe starts until the last one returns.
+    """
+
+    def __init__(self, interval: float = 15.0, timeout: float = 5.0):
+        self.interval = interval
+        self.timeout = timeout
+        self._probe: Optional[Callable[[float], Dict]] = None
+        self._probe_running = threading.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._consecutive_failures = 0
+        self._status: Dict = {"status": "unknown", "checked_at": None, "error": "not probed yet"}
+
+    @classmethod
+    def from_env(cls) -> "HealthMonitor":
+        return cls(
+            interval=float(os.getenv('HEALTH_PROBE_SECONDS', '15')),
+            timeout=float(os.getenv('HEALTH_PROBE_TIMEOUT', '5'))
+        )
+
+    def status(self) -> Dict:
+        """The last probe result, with its age in seconds"""
+        status = self._status
+        if status["checked_at"] is None:
+            return status
+        return {**status, "age": round(time.time() - status["checked_at"], 1)}
+
+    @property
+    def is_healthy(self) -> bool:
+        return self._status["status"] == "healthy"
+
+    def _run_probe(self) -> Dict:
+        try:
+            return self._probe(self.timeout)
+        finally:
+            self._probe_running.clear()
+
+    def _record_failure(self, started: float, error: str):
+        self._consecutive_failures += 1
+        if self._consecutive_failures == 1:
+            logger.warning(f"Database health probe failed: {error}")
+        self._status = {
+            "status": "unhealthy",
+            "checked_at": time.time(),
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            "consecutive_failures": self._consecutive_failures,
+            "error": error
+        }
+
+    async def probe_once(self):
+        """Run the probe in the threadpool and store its outcome"""
+        started = time.perf_counter()
+        if self._probe_running.is_set():
+            # A timed-out probe's thread cannot be cancelled; don't pile more on
+            self._record_failure(started, "previous probe still running")
+            return
+
+        self._probe_running.set()
+        try:
+            details = await asyncio.wait_for(run_in_threadpool(self._run_probe), self.timeout)
+        except Exception as e:
+            self._record_failure(started, str(e) or f"probe timed out after {self.timeout:.0f}s")
+            return
+
+        if self._consecutive_failures:
+            logger.info(f"Database healthy again after {self._consecutive_failures} failed probes")
+        self._consecutive_failures = 0
+        self._status = {
+            "status": "healthy",
+            "checked_at": time.time(),
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            "consecutive_failures": 0,
+            "error": None,
+            **details
+        }
+
+    async def _run(self):
+        while True:
+            await self.probe_once()
+            await asyncio.sleep(self.interval)
+
+    def start(self, probe: Callable[[float], Dict]):
+        """
+        Probe now and then every `interval` seconds; call from the app lifespan.
+        `probe` is called with the timeout in seconds.
+        """
+        self._probe = probe
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+# Shared by the health endpoints and the app lifespan
+health_monitor = HealthMonitor.from_env()
@@ -0,0 +1,83 @@
+# src/api/log_pipeline.py
+
+import atexit
+import logging
+import os
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# Full request and response bodies are logged here, and only for a sample of requests
+PAYLOAD_LOGGER = "worldview.payloads"
+
+# uvicorn gives these their own stream handlers and stops them propagating
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+class DroppingQueueHandler(QueueHandler):
+    """Enqueues records without ever blocking; counts what it drops when the queue is full"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener is in this process, so the record is passed as is and
+        # its message is formatted on the listener thread
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class SamplingFilter(logging.Filter):
+    """Passes a random `rate` fraction of records"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self.rate >= 1 or random.random() < self.rate
+
+def configure_logging(level: Optional[str] = None, payload_sample_rate: Optional[float] = None,
+                      max_queued: Optional[int] = None) -> QueueListener:
+    """
+    Route all logging through a queue to a listener thread that writes stderr.
+
+    Request handlers only pay for creating a record and putting it on the
+    queue; formatting and the write happen on the listener thread. Records are
+    dropped rather than block when the queue is full. uvicorn's loggers,
+    including the per-request access log, are routed through the same queue.
+    Payload logs go to PAYLOAD_LOGGER, which passes `payload_sample_rate` of
+    them.
+    """
+    level = level or os.getenv('LOG_LEVEL', 'INFO')
+    if payload_sample_rate is None:
+        payload_sample_rate = float(os.getenv('LOG_PAYLOAD_SAMPLE_RATE', '0.01'))
+    if max_queued is None:
+        max_queued = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=max_queued)
+    output = logging.StreamHandler()
+    output.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    listener = QueueListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(DroppingQueueHandler(log_queue))
+    root.setLevel(level.upper())
+
+    for name in UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+    payloads = logging.getLogger(PAYLOAD_LOGGER)
+    payloads.filters = [SamplingFilter(payload_sample_rate)]
+    return listener
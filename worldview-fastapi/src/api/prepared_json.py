@@ -0,0 +1,86 @@
+# src/api/prepared_json.py
+
+import gzip
+import hashlib
+from typing import Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.api.fast_json import dumps
+
+try:
+    import brotli
+except ImportError:  # Optional; gzip is always available
+    brotli = None
+
+def accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """{coding: q} from an Accept-Encoding header, lower-cased"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+class PreparedBody:
+    """
+    A response body with gzip (and brotli, when installed) variants compressed
+    once, and a content-hash ETag per variant.
+
+    `response()` picks the variant the client accepts and answers a matching
+    If-None-Match with 304, so serving it costs no rendering or compression
+    work per request.
+    """
+
+    def __init__(self, body: bytes, media_type: str, cache_control: str = "no-cache", compress: bool = True):
+        self.body = body
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.digest = hashlib.sha256(body).hexdigest()[:20]
+        self.variants: Dict[Optional[str], bytes] = {None: body}
+        if compress:
+            if brotli is not None:
+                self.variants["br"] = brotli.compress(body, quality=11)
+            self.variants["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+        self.etags = {
+            encoding: f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+            for encoding in self.variants
+        }
+
+    def _not_modified(self, if_none_match: str) -> bool:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return not tags.isdisjoint(self.etags.values())
+
+    def response(self, request: Request, cache_control: Optional[str] = None) -> Response:
+        accepted = accepted_encodings(request.headers.get("accept-encoding", ""))
+        encoding = next((coding for coding in ("br", "gzip")
+                         if coding in self.variants and accepted.get(coding, accepted.get("*", 0)) > 0), None)
+        headers = {
+            "ETag": self.etags[encoding],
+            "Cache-Control": cache_control or self.cache_control,
+            "Vary": "Accept-Encoding"
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self._not_modified(if_none_match):
+            return Response(status_code=304, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(self.variants[encoding], media_type=self.media_type, headers=headers)
+
+class PreparedJSON(PreparedBody):
+    """A JSON document serialized once and served as a PreparedBody"""
+
+    def __init__(self, content, cache_control: str = "no-cache"):
+        super().__init__(dumps(content), "application/json", cache_control)
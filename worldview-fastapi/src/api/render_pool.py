@@ -0,0 +1,205 @@
+# src/api/render_pool.py
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Optional
+
+from fastapi import HTTPException, Request
+
+logger = logging.getLogger(__name__)
+
+class RenderPoolFull(Exception):
+    """Raised when the render queue is at capacity"""
+
+class RenderTimeout(Exception):
+    """Raised when a render job exceeds its timeout"""
+
+class ClientDisconnected(Exception):
+    """Raised when the client went away before the job finished"""
+
+def render_http_exception(error: Exception) -> HTTPException:
+    """Map render pool errors to HTTP errors; anything else is a 500"""
+    if isinstance(error, RenderPoolFull):
+        return HTTPException(status_code=503, detail=str(error), headers={"Retry-After": "5"})
+    if isinstance(error, RenderTimeout):
+        return HTTPException(status_code=504, detail=str(error))
+    if isinstance(error, ClientDisconnected):
+        return HTTPException(status_code=499, detail=str(error))
+    return HTTPException(status_code=500, detail=str(error))
+
+def _timed_call(fn: Callable, args: tuple):
+    """Run a job in the worker process and report when it started and finished"""
+    started = time.time()
+    result = fn(*args)
+    return started, time.time(), result
+
+class _Timing:
+    """Running count, total and max, plus a window of recent samples for percentiles"""
+
+    def __init__(self, window: int = 500):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+
+    def summary(self) -> Dict:
+        recent = sorted(self.recent)
+
+        def percentile(p):
+            return round(recent[min(len(recent) - 1, int(p * len(recent)))], 4) if recent else None
+
+        return {
+            "count": self.count,
+            "mean_seconds": round(self.total / self.count, 4) if self.count else None,
+            "max_seconds": round(self.max, 4),
+            "p50_seconds": percentile(0.5),
+            "p95_seconds": percentile(0.95)
+        }
+
+class RenderPool:
+    """
+    Dedicated process pool for PDF and chart rendering.
+
+    Keeps CPU-bound rendering off the event loop. At most `max_pending` jobs may
+    be queued or running; further submissions are rejected rather than queued
+    without bound. Each job has a timeout, and a job whose client disconnects is
+    cancelled. A job that has already started cannot be interrupted, so it runs
+    to completion in its worker, still counting towards `max_pending`, and the
+    result is discarded.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 16, timeout: float = 60.0,
+                 disconnect_poll: float = 0.5):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.disconnect_poll = disconnect_poll
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._counters = {"submitted": 0, "completed": 0, "failed": 0,
+                          "timed_out": 0, "cancelled": 0, "rejected": 0}
+        self._queue_wait = _Timing()
+        self._render_time = _Timing()
+
+    @classmethod
+    def from_env(cls) -> "RenderPool":
+        return cls(
+            workers=int(os.getenv('RENDER_WORKERS', '2')),
+            max_pending=int(os.getenv('RENDER_MAX_PENDING', '16')),
+            timeout=float(os.getenv('RENDER_TIMEOUT_SECONDS', '60'))
+        )
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # Spawn rather than fork: the server process already runs threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info(f"Started render pool with {self.workers} workers")
+            return self._executor
+
+    def _job_finished(self, future):
+        # Runs on the executor's thread once the worker is done or the job was cancelled
+        with self._pending_lock:
+            self._pending -= 1
+        if not future.cancelled():
+            future.exception()  # Mark any error as retrieved
+
+    async def _wait_for_disconnect(self, request: Request):
+        while not await request.is_disconnected():
+            await asyncio.sleep(self.disconnect_poll)
+
+    async def run(self, fn: Callable, *args, request: Optional[Request] = None,
+                  timeout: Optional[float] = None):
+        """
+        Run fn(*args) in a worker process.
+
+        Args:
+            fn: Picklable top-level function
+            request: If given, the job is cancelled when this client disconnects
+            timeout: Seconds to wait; defaults to the pool timeout
+
+        Raises:
+            RenderPoolFull, RenderTimeout, ClientDisconnected
+        """
+        with self._pending_lock:
+            if self._pending >= self.max_pending:
+                self._counters["rejected"] += 1
+                raise RenderPoolFull(f"Render queue is full ({self.max_pending} jobs)")
+            self._pending += 1
+
+        self._counters["submitted"] += 1
+        submitted = time.time()
+        try:
+            future = self._get_executor().submit(_timed_call, fn, args)
+        except Exception:
+            with self._pending_lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._job_finished)
+        job = asyncio.wrap_future(future)
+        watcher = asyncio.ensure_future(self._wait_for_disconnect(request)) if request else None
+
+        try:
+            waiting = {job, watcher} if watcher else {job}
+            done, _ = await asyncio.wait(waiting, timeout=timeout or self.timeout,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if job not in done:
+                future.cancel()
+                if watcher in done:
+                    self._counters["cancelled"] += 1
+                    raise ClientDisconnected("Client disconnected before the render finished")
+                self._counters["timed_out"] += 1
+                raise RenderTimeout(f"Render exceeded {timeout or self.timeout:g}s")
+
+            try:
+                started, finished, result = job.result()
+            except Exception:
+                self._counters["failed"] += 1
+                raise
+
+            self._counters["completed"] += 1
+            self._queue_wait.observe(max(0.0, started - submitted))
+            self._render_time.observe(finished - started)
+            return result
+        finally:
+            if watcher:
+                watcher.cancel()
+            if not job.done():
+                # Swallow the eventual result of a job we stopped waiting for
+                job.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    def metrics(self) -> Dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            **self._counters,
+            "queue_wait": self._queue_wait.summary(),
+            "render_time": self._render_time.summary()
+        }
+
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+# Shared by the PDF and chart routes
+render_pool = RenderPool.from_env()
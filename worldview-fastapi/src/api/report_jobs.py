@@ -0,0 +1,160 @@
+# src/api/report_jobs.py
+
+import asyncio
+import logging
+import os
+import string
+import time
+from typing import Dict, Optional
+
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+
+from src.api.render_pool import render_pool
+from src.visualization.render_jobs import pdf_cache_key, render_pdf_job
+from src.visualization.report_cache import report_cache
+
+logger = logging.getLogger(__name__)
+
+def report_key(payload: Dict) -> str:
+    """Report cache key for a report request; also the id of its report job"""
+    return pdf_cache_key(payload["perspective"], payload["scores"],
+                         payload["category_responses"], payload.get("plot_image"))
+
+async def render_report(payload: Dict, request: Optional[Request] = None) -> bytes:
+    """PDF for a report request, from the report cache or rendered in the render pool"""
+    key = report_key(payload)
+    pdf_bytes = await run_in_threadpool(report_cache.get, key)
+    if pdf_bytes is None:
+        pdf_bytes = await render_pool.run(
+            render_pdf_job,
+            payload["perspective"],
+            payload["scores"],
+            payload["category_responses"],
+            payload.get("plot_image"),
+            request=request
+        )
+        await run_in_threadpool(report_cache.put, key, pdf_bytes)
+    return pdf_bytes
+
+class ReportQueueFull(Exception):
+    """Raised when too many report jobs are waiting"""
+
+class ReportJob:
+    """One report render, identified by the hash of its inputs"""
+
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.status = "queued"
+        self.created = time.time()
+        self.finished = None
+        self.result: Optional[bytes] = None
+        self.error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "error": self.error
+        }
+
+class ReportJobStore:
+    """
+    Background report rendering with a TTL cache of finished reports.
+
+    Job ids are the report cache key of the inputs (which includes the date
+    printed on the report), so identical requests share one job and one render.
+    At most `concurrency` jobs are handed to the render pool at once; the rest
+    wait here, up to `max_queued`. Finished jobs are kept for `ttl` seconds,
+    and only the newest `max_entries` of them.
+
+    The store is per gunicorn worker, but the report cache's disk tier is
+    shared by the instance, so a worker that does not know a job can still
+    serve its finished report with `cached_result`. Failing that, a client
+    can simply submit again: ids are deterministic.
+    """
+
+    def __init__(self, ttl: float = 3600, max_entries: int = 256, max_queued: int = 64,
+                 concurrency: int = 2):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_queued = max_queued
+        self.concurrency = concurrency
+        self._jobs: Dict[str, ReportJob] = {}
+        self._tasks = set()
+        self._semaphore = None
+
+    @classmethod
+    def from_env(cls) -> "ReportJobStore":
+        return cls(
+            ttl=float(os.getenv('REPORT_CACHE_TTL_SECONDS', '3600')),
+            max_entries=int(os.getenv('REPORT_CACHE_MAX_ENTRIES', '256')),
+            max_queued=int(os.getenv('REPORT_MAX_QUEUED', '64')),
+            concurrency=int(os.getenv('RENDER_WORKERS', '2'))
+        )
+
+    def _purge_expired(self):
+        now = time.time()
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished is not None),
+            key=lambda job: job.finished
+        )
+        overflow = len(finished) - self.max_entries
+        for i, job in enumerate(finished):
+            if i < overflow or now - job.finished > self.ttl:
+                del self._jobs[job.id]
+
+    def _waiting(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.finished is None)
+
+    def submit(self, payload: Dict) -> ReportJob:
+        """Start rendering a report, or return the existing job for the same inputs"""
+        self._purge_expired()
+        job_id = report_key(payload)
+        job = self._jobs.get(job_id)
+        if job is not None and job.status != "failed":
+            return job
+
+        if self._waiting() >= self.max_queued:
+            raise ReportQueueFull(f"Too many reports in progress ({self.max_queued})")
+
+        job = ReportJob(job_id)
+        self._jobs[job_id] = job
+        task = asyncio.create_task(self._render(job, payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        self._purge_expired()
+        return self._jobs.get(job_id)
+
+    @staticmethod
+    def cached_result(job_id: str) -> Optional[bytes]:
+        """The finished report for a job this worker does not know, from the report cache"""
+        if len(job_id) != 64 or not set(job_id) <= set(string.hexdigits):
+            return None  # Not a cache key; never a path into the cache directory
+        return report_cache.get(job_id)
+
+    async def _render(self, job: ReportJob, payload: Dict):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._semaphore:
+            job.status = "running"
+            try:
+                job.result = await render_report(payload)
+                job.status = "done"
+            except Exception as e:
+                logger.error(f"Report job {job.id[:12]} failed: {e}")
+                job.error = str(e)
+                job.status = "failed"
+            finally:
+                job.finished = time.time()
+
+    def cancel_all(self):
+        for task in list(self._tasks):
+            task.cancel()
+
+# Shared by the report routes and the app lifespan
+report_jobs = ReportJobStore.from_env()
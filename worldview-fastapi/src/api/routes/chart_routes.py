@@ -0,0 +1,63 @@
+# src/api/routes/chart_routes.py
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response
+from typing import List, Optional
+import logging
+from src.api.render_pool import render_http_exception, render_pool
+from src.data.survey_content import scores_for_answers
+from src.visualization.render_jobs import render_chart_job
+from src.visualization.ternary_chart import CHART_FORMATS, chart_etag, normalize_scores
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Charts are addressed by their inputs, so a URL never changes meaning
+CHART_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+def _parse_numbers(value: str, cast, name: str) -> List:
+    try:
+        return [cast(part) for part in value.replace(" ", "").split(",") if part]
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: {value}")
+
+def resolve_chart_scores(answers: Optional[str], scores: Optional[str]):
+    """
+    Turn chart query parameters into normalized scores.
+
+    Either `answers` (the six 1-based response numbers, e.g. "1,3,2,5,4,1")
+    or `scores` (PreModern, Modern, PostModern, e.g. "50,30,20") is required.
+    """
+    try:
+        if answers:
+            return normalize_scores(scores_for_answers(_parse_numbers(answers, int, "answers")))
+        if scores:
+            return normalize_scores(_parse_numbers(scores, float, "scores"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    raise HTTPException(status_code=400, detail="Provide either 'answers' or 'scores'")
+
+async def _chart_response(request: Request, fmt: str, answers: Optional[str], scores: Optional[str]):
+    normalized = resolve_chart_scores(answers, scores)
+    etag = chart_etag(normalized, fmt)
+    headers = {"ETag": etag, "Cache-Control": CHART_CACHE_CONTROL}
+
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        content = await render_pool.run(render_chart_job, normalized, fmt, request=request)
+    except Exception as e:
+        logger.error(f"Error rendering chart: {e}")
+        raise render_http_exception(e)
+    return Response(content=content, media_type=CHART_FORMATS[fmt], headers=headers)
+
+@router.get("/chart.png")
+async def chart_png(request: Request, answers: Optional[str] = None, scores: Optional[str] = None):
+    """Rendered ternary chart as PNG"""
+    return await _chart_response(request, "png", answers, scores)
+
+@router.get("/chart.svg")
+async def chart_svg(request: Request, answers: Optional[str] = None, scores: Optional[str] = None):
+    """Rendered ternary chart as SVG"""
+    return await _chart_response(request, "svg", answers, scores)
@@ -0,0 +1,17 @@
+# src/api/routes/metrics_routes.py
+
+from fastapi import APIRouter
+from src.api.render_pool import render_pool
+from src.visualization.report_cache import report_cache
+
+router = APIRouter()
+
+@router.get("/metrics/render")
+async def render_metrics():
+    """Render pool queue depth, outcomes, queue wait and render time for this worker"""
+    return render_pool.metrics()
+
+@router.get("/metrics/report-cache")
+async def report_cache_metrics():
+    """Report cache hits by tier, misses and evictions for this worker"""
+    return report_cache.stats()
@@ -1,14 +1,13 @@
 # src/api/routes/pdf_routes.py
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Request
 from fastapi.responses import Response
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from typing import Dict, List
-import tempfile
-import base64
-import os
 import logging
-from src.visualization.pdf_generator import ModernityPDFReport, generate_pdf_report
+from src.api.render_pool import render_http_exception
+from src.api.report_jobs import render_report
+from src.visualization.ternary_chart import normalize_scores
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -17,35 +16,20 @@ class PDFGenerationRequest(BaseModel):
     perspective: str
     scores: List[float]
     category_responses: Dict[str, str]
-    plot_image: str = None  # Base64 encoded plot image
+    plot_image: str = None  # Base64 encoded plot image; rendered server-side when omitted
+
+    @field_validator("scores")
+    @classmethod
+    def scores_can_be_plotted(cls, scores: List[float]) -> List[float]:
+        normalize_scores(scores)  # Raises ValueError, answered with a 422
+        return scores
 
 @router.post("/generate-pdf")
-async def generate_pdf_endpoint(request: PDFGenerationRequest):
+async def generate_pdf_endpoint(request: PDFGenerationRequest, http_request: Request):
     """Handle PDF generation request"""
     try:
-        plot_image_path = None
-        
-        # If plot image is provided, save it temporarily
-        if request.plot_image:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp:
-                plot_image_path = tmp.name
-                img_data = base64.b64decode(request.plot_image.split(',')[1])
-                tmp.write(img_data)
-
-        # Generate PDF using our updated generator function
-        pdf_bytes = generate_pdf_report(
-            perspective=request.perspective,
-            scores=request.scores,
-            category_responses=request.category_responses,
-            plot_image_path=plot_image_path
-        )
-
-        # Clean up temporary file if it was created
-        if plot_image_path and os.path.exists(plot_image_path):
-            try:
-                os.unlink(plot_image_path)
-            except Exception as e:
-                logger.error(f"Error cleaning up temporary file: {e}")
+        # Served from the report cache, or decoded, laid out and serialized in the render pool
+        pdf_bytes = await render_report(request.model_dump(), request=http_request)
 
         return Response(
             content=pdf_bytes,
@@ -56,4 +40,4 @@ async def generate_pdf_endpoint(request: PDFGenerationRequest):
         )
     except Exception as e:
         logger.error(f"Error generating PDF: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise render_http_exception(e)
@@ -0,0 +1,18 @@
+# src/api/routes/population_routes.py
+
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+import logging
+from src.data.ternary_histogram import population_histogram
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.get("/population/histogram")
+async def population_histogram_endpoint(request: Request):
+    """Where everyone else landed: sparse counts over the ternary grid"""
+    body, etag = population_histogram.payload()
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
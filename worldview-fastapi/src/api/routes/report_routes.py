@@ -0,0 +1,54 @@
+# src/api/routes/report_routes.py
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+import logging
+from src.api.report_jobs import ReportQueueFull, report_jobs
+from src.api.routes.pdf_routes import PDFGenerationRequest
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+def _status_response(job, status_code: int):
+    return JSONResponse(
+        status_code=status_code,
+        content=job.to_dict(),
+        headers={"Location": f"/api/reports/{job.id}", "Retry-After": "1"}
+    )
+
+@router.post("/reports")
+async def submit_report(request: PDFGenerationRequest):
+    """Queue a PDF report; poll GET /api/reports/{job_id} for the result"""
+    try:
+        job = report_jobs.submit(request.model_dump())
+    except ReportQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    return _status_response(job, 202)
+
+def _pdf_response(pdf_bytes: bytes):
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": "attachment; filename=worldview_analysis.pdf",
+            "Cache-Control": "private, max-age=3600"
+        }
+    )
+
+@router.get("/reports/{job_id}")
+async def get_report(job_id: str):
+    """Job status while rendering, the PDF once done"""
+    job = report_jobs.get(job_id)
+    if job is None:
+        # Rendered by another worker on this instance
+        pdf_bytes = await run_in_threadpool(report_jobs.cached_result, job_id)
+        if pdf_bytes is None:
+            raise HTTPException(status_code=404, detail="Unknown or expired report job")
+        return _pdf_response(pdf_bytes)
+
+    if job.status == "done":
+        return _pdf_response(job.result)
+    if job.status == "failed":
+        return JSONResponse(status_code=500, content=job.to_dict())
+    return _status_response(job, 202)
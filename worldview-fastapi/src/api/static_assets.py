@@ -0,0 +1,57 @@
+# src/api/static_assets.py
+
+import logging
+import mimetypes
+from pathlib import Path
+from typing import Dict, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.api.asgi_middleware import COMPRESSIBLE_TYPES
+from src.api.prepared_json import PreparedBody
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# Types mimetypes does not know, or gets wrong for browsers
+CONTENT_TYPES = {".jsx": "text/javascript"}
+
+class StaticAssets:
+    """
+    Every file under a static directory, read and compressed once at startup.
+
+    Each file is served at its plain path, revalidated by ETag, and at a
+    content-hashed path (components/TernaryPlot.<hash>.jsx) that is cached
+    for a year as immutable. Pages link to the hashed path through `url()`,
+    so a deploy that changes a file changes its URL.
+    """
+
+    def __init__(self, directory: Path, prefix: str = "/static"):
+        self.prefix = prefix
+        self._assets: Dict[str, Tuple[PreparedBody, bool]] = {}  # path -> (asset, immutable)
+        self._urls: Dict[str, str] = {}
+        for path in sorted(Path(directory).rglob("*")):
+            if not path.is_file() or path.suffix == ".py" or "__pycache__" in path.parts:
+                continue
+            name = path.relative_to(directory).as_posix()
+            media_type = CONTENT_TYPES.get(path.suffix) or mimetypes.guess_type(name)[0] or "application/octet-stream"
+            asset = PreparedBody(path.read_bytes(), media_type,
+                                 compress=media_type.startswith(COMPRESSIBLE_TYPES))
+            hashed = f"{name[:-len(path.suffix)] if path.suffix else name}.{asset.digest[:12]}{path.suffix}"
+            self._assets[name] = (asset, False)
+            self._assets[hashed] = (asset, True)
+            self._urls[name] = f"{prefix}/{hashed}"
+        logger.info(f"Prepared {len(self._urls)} static assets")
+
+    def url(self, name: str) -> str:
+        """The content-hashed URL of a file, relative to the static directory"""
+        return self._urls[name]
+
+    def response(self, name: str, request: Request) -> Response:
+        found = self._assets.get(name)
+        if found is None:
+            return Response("Not Found", status_code=404, media_type="text/plain")
+        asset, immutable = found
+        return asset.response(request, cache_control=IMMUTABLE if immutable else None)
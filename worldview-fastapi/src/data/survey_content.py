@@ -0,0 +1,71 @@
+# src/data/survey_content.py
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+DATA_DIR = Path(__file__).resolve().parent
+QUESTION_KEYS = ['Q1', 'Q2', 'Q3', 'Q4', 'Q5', 'Q6']
+
+@lru_cache(maxsize=1)
+def get_questions() -> Dict:
+    """Load the question definitions once per process."""
+    with open(DATA_DIR / "questions_responses.json") as f:
+        return json.load(f)["questions"]
+
+@lru_cache(maxsize=1)
+def get_templates() -> Dict:
+    """Load the response templates, by category, once per process."""
+    with open(DATA_DIR / "response_templates.json") as f:
+        return json.load(f)["categories"]
+
+def calculate_perspective_scores(responses: dict, questions_data: dict) -> list:
+    """Calculate aggregate perspective scores from survey responses."""
+    total_scores = [0, 0, 0]  # [PreModern, Modern, PostModern]
+
+    for q_id, response_num in responses.items():
+        if response_num is not None:  # Skip any None responses
+            # Convert 'q4_response' → 'Q4' before lookup
+            question_key = q_id.replace("_response", "").upper()
+
+            if question_key in questions_data:
+                question = questions_data[question_key]
+            else:
+                raise KeyError(f"❌ Question key not found: {question_key}")
+
+            # Response numbers are 1-based, list indices are 0-based
+            response_idx = response_num - 1
+            if 0 <= response_idx < len(question["responses"]):
+                scores = question["responses"][response_idx]["scores"]
+                total_scores = [a + b for a, b in zip(total_scores, scores)]
+
+    # Convert to percentages
+    total = sum(total_scores)
+    if total > 0:
+        normalized_scores = [round((score / total) * 100, 1) for score in total_scores]
+        # Ensure scores sum to exactly 100
+        adjustment = 100 - sum(normalized_scores)
+        normalized_scores[-1] += adjustment  # Add any rounding difference to last score
+        return normalized_scores
+    return [0, 0, 0]
+
+def scores_for_answers(answers: Sequence[int]) -> List[float]:
+    """
+    Score a full answer combination.
+
+    Args:
+        answers: One 1-based response number per question, in question order
+
+    Raises:
+        ValueError: If the combination is incomplete or out of range
+    """
+    questions = get_questions()
+    if len(answers) != len(QUESTION_KEYS):
+        raise ValueError(f"Expected {len(QUESTION_KEYS)} answers, got {len(answers)}")
+    for q_key, answer in zip(QUESTION_KEYS, answers):
+        if not 1 <= answer <= len(questions[q_key]["responses"]):
+            raise ValueError(f"Answer {answer} is out of range for {q_key}")
+
+    responses = {f"{q_key.lower()}_response": answer for q_key, answer in zip(QUESTION_KEYS, answers)}
+    return calculate_perspective_scores(responses, questions)
@@ -0,0 +1,186 @@
+# src/data/ternary_histogram.py
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows development machines
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTOGRAM_PATH = "/tmp/ternary_histogram.json"
+
+class TernaryHistogram:
+    """
+    Fixed-resolution histogram of respondents' (n1, n2, n3) over the ternary simplex.
+
+    Scores are snapped to a lattice of `steps` divisions per axis, giving
+    (steps + 1) * (steps + 2) / 2 cells (5,151 at 1% steps). Submissions are
+    counted in memory and periodically merged into a shared JSON file, so
+    every gunicorn worker converges on the same population counts.
+    """
+
+    def __init__(self, steps: int = 100, path: Optional[str] = None):
+        self.steps = steps
+        self.path = path
+        self.size = (steps + 1) * (steps + 2) // 2
+        self._counts = [0] * self.size
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._payload = None
+
+    @classmethod
+    def from_env(cls) -> "TernaryHistogram":
+        return cls(
+            steps=int(os.getenv('HISTOGRAM_STEPS', '100')),
+            path=os.getenv('HISTOGRAM_PATH', DEFAULT_HISTOGRAM_PATH)
+        )
+
+    def snap(self, n1: float, n2: float, n3: float) -> Tuple[int, int, int]:
+        """Snap scores to the nearest lattice point, keeping the sum at exactly `steps`"""
+        scores = (n1, n2, n3)
+        total = sum(scores)
+        if total <= 0 or min(scores) < 0:
+            raise ValueError(f"Cannot place scores on the simplex: {scores}")
+
+        scaled = [score / total * self.steps for score in scores]
+        cell = [int(value) for value in scaled]
+        # Hand the rounding remainder to the largest fractional parts
+        by_remainder = sorted(range(3), key=lambda i: scaled[i] - cell[i], reverse=True)
+        for i in by_remainder[:self.steps - sum(cell)]:
+            cell[i] += 1
+        return tuple(cell)
+
+    def _index(self, i: int, j: int) -> int:
+        # Row i holds steps + 1 - i cells, one per j
+        return i * (self.steps + 1) - i * (i - 1) // 2 + j
+
+    def add(self, n1: float, n2: float, n3: float):
+        """Count one submission"""
+        i, j, _ = self.snap(n1, n2, n3)
+        index = self._index(i, j)
+        with self._lock:
+            self._counts[index] += 1
+            self._pending[index] = self._pending.get(index, 0) + 1
+            self._payload = None
+
+    def _read_file(self) -> Optional[list]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        if data.get("steps") != self.steps or len(data.get("counts", [])) != self.size:
+            logger.warning(f"Ignoring histogram file with a different resolution: {self.path}")
+            return None
+        return data["counts"]
+
+    def _seed_counts(self, rows: Iterable[Sequence]) -> list:
+        counts = [0] * self.size
+        for n1, n2, n3, count in rows:
+            try:
+                i, j, _ = self.snap(float(n1), float(n2), float(n3))
+            except (TypeError, ValueError):
+                continue
+            counts[self._index(i, j)] += int(count)
+        return counts
+
+    def _restore(self, pending: dict):
+        """Put submissions taken for a flush back in the pending counts"""
+        with self._lock:
+            for index, count in pending.items():
+                self._pending[index] = self._pending.get(index, 0) + count
+
+    def flush(self, seed: Optional[Callable[[], Iterable[Sequence]]] = None) -> bool:
+        """
+        Merge pending submissions into the shared file and reload the merged counts.
+
+        Args:
+            seed: Optional callable returning (n1, n2, n3, count) rows, used once
+                to build the file from the database when it does not exist yet
+
+        Returns:
+            True if the file was written; False if there is no file yet and no
+            seed to build it from, in which case submissions stay pending
+        """
+        if not self.path:
+            return False
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        try:
+            with open(self.path + ".lock", "w") as lock_file:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+                counts = self._read_file()
+                if counts is None:
+                    if seed is None:
+                        # A file of only this worker's counts would stop the
+                        # next flush from seeding the full population
+                        self._restore(pending)
+                        return False
+                    counts = self._seed_counts(seed())
+                    logger.info("Seeded ternary histogram with %s responses", sum(counts))
+                    # Submissions are saved before they are counted, so the
+                    # seed already includes everything pending so far
+                    pending = {}
+                    with self._lock:
+                        self._pending = {}
+
+                for index, count in pending.items():
+                    counts[index] += count
+
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump({"steps": self.steps, "counts": counts}, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+        except Exception:
+            # Keep the submissions for the next attempt
+            self._restore(pending)
+            raise
+
+        with self._lock:
+            # Submissions that arrived during the write are still pending
+            for index, count in self._pending.items():
+                counts[index] += count
+            self._counts = counts
+            self._payload = None
+        return True
+
+    def payload(self) -> Tuple[bytes, str]:
+        """
+        Serialized sparse histogram and its ETag, rebuilt only after changes.
+
+        The body lists non-empty cells as [n1, n2, n3, count] with scores in percent.
+        """
+        with self._lock:
+            if self._payload is None:
+                unit = 100 / self.steps
+                cells = []
+                index = 0
+                for i in range(self.steps + 1):
+                    for j in range(self.steps + 1 - i):
+                        count = self._counts[index]
+                        if count:
+                            k = self.steps - i - j
+                            cells.append([round(i * unit, 2), round(j * unit, 2), round(k * unit, 2), count])
+                        index += 1
+                body = json.dumps({
+                    "steps": self.steps,
+                    "total": sum(self._counts),
+                    "cells": cells
+                }, separators=(",", ":")).encode()
+                etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+                self._payload = (body, etag)
+            return self._payload
+
+# Shared by the submit handler, the flush task and the population routes
+population_histogram = TernaryHistogram.from_env()
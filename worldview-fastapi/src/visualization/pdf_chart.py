@@ -0,0 +1,217 @@
+# src/visualization/pdf_chart.py
+
+"""
+The ternary chart drawn with PDF vector operators.
+
+Geometry is computed once, in unit-triangle coordinates (PostModern at the
+bottom left, PreModern at the bottom right, Modern at the top, as in
+the browser TernaryPlot), and only scaled into place for each report. PDF has no
+opacity in FPDF 1.7, so translucent colours are pre-blended with white.
+"""
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+from fpdf import FPDF
+
+from src.visualization.ternary_chart import normalize_scores
+
+Point = Tuple[float, float]
+
+SQRT3_2 = math.sqrt(3) / 2
+LEFT = (0.0, 0.0)       # PostModern
+RIGHT = (1.0, 0.0)      # PreModern
+TOP = (0.5, SQRT3_2)    # Modern
+
+def _on_edge(start: Point, end: Point, ratio: float) -> Point:
+    return (start[0] + (end[0] - start[0]) * ratio, start[1] + (end[1] - start[1]) * ratio)
+
+def _tint(color: Tuple[int, int, int], alpha: float) -> Tuple[int, int, int]:
+    """Colour drawn at `alpha` opacity over white"""
+    return tuple(round(255 - (255 - c) * alpha) for c in color)
+
+OUTLINE = [LEFT, RIGHT, TOP]
+
+# 10% gridlines parallel to each edge
+GRIDLINES = [
+    segment
+    for i in range(1, 10)
+    for segment in (
+        (_on_edge(LEFT, TOP, i / 10), _on_edge(RIGHT, TOP, i / 10)),
+        (_on_edge(LEFT, RIGHT, i / 10), _on_edge(TOP, RIGHT, i / 10)),
+        (_on_edge(RIGHT, LEFT, i / 10), _on_edge(TOP, LEFT, i / 10)),
+    )
+]
+
+# Strong (>70%) and moderate (50-70%) regions around each vertex
+SHADING = []
+for _vertex, _edge1, _edge2 in ((TOP, LEFT, RIGHT), (RIGHT, TOP, LEFT), (LEFT, TOP, RIGHT)):
+    _p70 = (_on_edge(_vertex, _edge1, 0.3), _on_edge(_vertex, _edge2, 0.3))
+    _p50 = (_on_edge(_vertex, _edge1, 0.5), _on_edge(_vertex, _edge2, 0.5))
+    SHADING.append(("strong", [_vertex, _p70[0], _p70[1]]))
+    SHADING.append(("moderate", [_p70[0], _p50[0], _p50[1], _p70[1]]))
+
+# Category boundaries: the triangle joining the edge midpoints
+MIX_TRIANGLE = [_on_edge(LEFT, RIGHT, 0.5), _on_edge(LEFT, TOP, 0.5), _on_edge(RIGHT, TOP, 0.5)]
+
+# Five-pointed star of unit outer radius, pointing up
+STAR = [
+    (math.cos(math.pi / 2 + i * math.pi / 5) * (1 if i % 2 == 0 else 0.4),
+     math.sin(math.pi / 2 + i * math.pi / 5) * (1 if i % 2 == 0 else 0.4))
+    for i in range(10)
+]
+
+STYLES = {
+    "grid": _tint((128, 128, 128), 0.4),
+    "border": (0, 0, 0),
+    "dots": (0, 82, 204),
+    "star": (222, 0, 0),
+    "strong": _tint((144, 238, 144), 0.2),
+    "moderate": _tint((232, 235, 16), 0.2),
+    "boundary": (255, 0, 0),
+}
+
+def plottable(scores: Optional[Sequence[float]]) -> bool:
+    """Whether scores can be placed on the chart: three finite, non-negative, not all zero"""
+    if scores is None:
+        return False
+    try:
+        normalize_scores(scores)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+def project(scores: Sequence[float]) -> Point:
+    """[PreModern, Modern, PostModern] scores to unit-triangle coordinates; see `plottable`"""
+    pre, mod, post = scores
+    total = pre + mod + post
+    return ((pre + mod / 2) / total, SQRT3_2 * mod / total)
+
+class _Frame:
+    """Maps unit-triangle coordinates onto the page"""
+
+    def __init__(self, pdf: FPDF, x: float, y: float, side: float):
+        self.pdf = pdf
+        self.x = x
+        self.y = y
+        self.side = side
+
+    def mm(self, point: Point) -> Point:
+        return self.x + point[0] * self.side, self.y + (SQRT3_2 - point[1]) * self.side
+
+    def pt(self, point: Point) -> str:
+        x, y = self.mm(point)
+        return f"{x * self.pdf.k:.2f} {(self.pdf.h - y) * self.pdf.k:.2f}"
+
+    def polygon(self, points: List[Point], op: str):
+        """op is 'S' (stroke), 'f' (fill) or 'B' (both)"""
+        path = [f"{self.pt(points[0])} m"] + [f"{self.pt(p)} l" for p in points[1:]]
+        self.pdf._out(" ".join(path) + f" h {op}")
+
+    def lines(self, segments):
+        self.pdf._out(" ".join(f"{self.pt(a)} m {self.pt(b)} l" for a, b in segments) + " S")
+
+    def star(self, center_mm: Point, radius: float):
+        x, y = center_mm
+        points = [f"{(x + dx * radius) * self.pdf.k:.2f} {(self.pdf.h - y + dy * radius) * self.pdf.k:.2f}"
+                  for dx, dy in STAR]
+        self.pdf._out(f"{points[0]} m " + " ".join(f"{p} l" for p in points[1:]) + " h f")
+
+def _centered_text(pdf: FPDF, x: float, y: float, text: str):
+    pdf.text(x - pdf.get_string_width(text) / 2, y, text)
+
+def draw_ternary_chart(pdf: FPDF, x: float, y: float, width: float, height: float,
+                       average: Optional[Sequence[float]] = None,
+                       points: Sequence[Sequence[float]] = (),
+                       shading: bool = False, marker: str = "star", legend: bool = True) -> None:
+    """
+    Draw the chart into the box (x, y, width, height), in mm.
+
+    Args:
+        average: [PreModern, Modern, PostModern] score to highlight; left out
+            when it cannot be plotted (such as all zeros)
+        points: Individual [PreModern, Modern, PostModern] scores, drawn as dots;
+            any that cannot be plotted are skipped
+        shading: Shade the strong and moderate regions and outline the mix triangle
+        marker: 'star' or 'dot' for the average
+        legend: Label the dots and the average marker
+    """
+    points = [score for score in points if plottable(score)] if points is not None else []
+    if not plottable(average):
+        average = None
+    label_size = 12
+    side = min(width * 0.8, (height - 30) / SQRT3_2)
+    frame = _Frame(pdf, x + (width - side) / 2, y + 12, side)
+
+    # Remember the state FPDF tracks; the q/Q pair restores it on the page
+    saved = {name: getattr(pdf, name) for name in (
+        "font_family", "font_style", "underline", "font_size_pt", "font_size", "current_font",
+        "draw_color", "fill_color", "text_color", "color_flag", "line_width")}
+    pdf._out("q")
+    try:
+        if shading:
+            for kind, polygon in SHADING:
+                pdf.set_fill_color(*STYLES[kind])
+                frame.polygon(polygon, "f")
+
+        pdf.set_line_width(0.2)
+        pdf.set_draw_color(*STYLES["grid"])
+        frame.lines(GRIDLINES)
+
+        if shading:
+            pdf.set_line_width(0.5)
+            pdf.set_draw_color(*STYLES["boundary"])
+            frame.polygon(MIX_TRIANGLE, "S")
+
+        pdf.set_line_width(0.5)
+        pdf.set_draw_color(*STYLES["border"])
+        frame.polygon(OUTLINE, "S")
+
+        pdf.set_font("Arial", size=label_size)
+        pdf.set_text_color(0, 0, 0)
+        top_x, top_y = frame.mm(TOP)
+        _centered_text(pdf, top_x, top_y - 3, "Modern")
+        left_x, left_y = frame.mm(LEFT)
+        _centered_text(pdf, left_x, left_y + 7, "PostModern")
+        right_x, right_y = frame.mm(RIGHT)
+        _centered_text(pdf, right_x, right_y + 7, "PreModern")
+
+        dot = side * 0.012
+        if points:
+            pdf.set_fill_color(*STYLES["dots"])
+            for score in points:
+                px, py = frame.mm(project(score))
+                pdf.ellipse(px - dot, py - dot, 2 * dot, 2 * dot, "F")
+
+        if average is not None:
+            ax, ay = frame.mm(project(average))
+            pdf.set_fill_color(*STYLES["star"])
+            if marker == "star":
+                frame.star((ax, ay), side * 0.025)
+            else:
+                pdf.set_draw_color(255, 255, 255)
+                pdf.set_line_width(0.6)
+                pdf.ellipse(ax - dot * 1.3, ay - dot * 1.3, 2.6 * dot, 2.6 * dot, "DF")
+
+            pdf.set_text_color(*STYLES["star"])
+            _centered_text(pdf, x + width / 2, left_y + 16,
+                           f"{average[0]:.1f}, {average[1]:.1f}, {average[2]:.1f}")
+
+        if legend and (points or average is not None):
+            pdf.set_font("Arial", size=9)
+            pdf.set_text_color(0, 0, 0)
+            legend_x = x + width - 38
+            legend_y = y + 4
+            if points:
+                pdf.set_fill_color(*STYLES["dots"])
+                pdf.ellipse(legend_x, legend_y - 1.8, 2.2, 2.2, "F")
+                pdf.text(legend_x + 4, legend_y, "Individual Scores")
+                legend_y += 5
+            if average is not None and marker == "star":
+                pdf.set_fill_color(*STYLES["star"])
+                frame.star((legend_x + 1.1, legend_y - 0.7), 1.6)
+                pdf.text(legend_x + 4, legend_y, "Aggregated Score")
+    finally:
+        pdf._out("Q")
+        for name, value in saved.items():
+            setattr(pdf, name, value)
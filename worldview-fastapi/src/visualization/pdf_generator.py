@@ -2,26 +2,59 @@
 
 from fpdf import FPDF
 import io
-from typing import List, Dict
-import tempfile
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import os
 import logging
 from datetime import datetime
+from src.visualization.pdf_fragments import PageFragment, build_fragment, splice_fragment
+from src.visualization.pdf_chart import draw_ternary_chart
+from src.visualization.pdf_images import embed_png
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=32)
+def category_analysis_fragment(category_responses: Tuple[Tuple[str, str], ...]) -> PageFragment:
+    """
+    The category analysis pages, laid out once per set of responses.
+
+    The responses come from the templates for the resolved perspective type, so
+    only a handful of distinct fragments exist in practice.
+    """
+    def draw(pdf):
+        pdf.set_font("Arial", style="B", size=18)
+        pdf.cell(0, 12, txt="Worldview Category Analysis", ln=True)
+        pdf.ln(5)
+
+        for category, response in category_responses:
+            pdf.set_font("Arial", style="B", size=13)
+            pdf.cell(0, 10, txt=category, ln=True)
+
+            pdf.set_font("Arial", size=11)
+            pdf.multi_cell(0, 8, txt=response)
+            pdf.ln(5)
+
+    return build_fragment(draw)
+
 class ModernityPDFReport:
     def __init__(self):
         """Initialize PDF with standard settings"""
         self.pdf = FPDF()
+        self.pdf.set_compression(True)  # Deflate the page content streams
         self.pdf.set_auto_page_break(auto=True, margin=15)
         self.pdf.add_page()
         self.pdf.set_left_margin(15)
         self.pdf.set_right_margin(15)
 
-    def create_first_page(self, perspective: str, scores: List[float], plot_image_path: str = None):
-        """Create the complete first page in the correct sequence"""
+    def create_first_page(self, perspective: str, scores: List[float], plot_image_path: str = None,
+                          plot_image: Optional[bytes] = None):
+        """
+        Create the complete first page in the correct sequence.
+
+        An uploaded plot (PNG bytes or a path) is embedded; otherwise the chart
+        is drawn with PDF vector operators.
+        """
         # Title and date
         self.pdf.set_font("Arial", style="B", size=24)
         self.pdf.cell(0, 15, txt="Modernity Worldview Analysis", ln=True, align='C')
@@ -33,9 +66,18 @@ def create_first_page(self, perspective: str, scores: List[float], plot_image_pa
         self.pdf.ln(5)
         
         # Visualisation
-        if plot_image_path and os.path.exists(plot_image_path):
+        if plot_image:
+            embed_png(self.pdf, plot_image, x=25, w=160)
+            self.pdf.ln(10)
+        elif plot_image_path and os.path.exists(plot_image_path):
             self.pdf.image(plot_image_path, x=25, w=160)
             self.pdf.ln(10)
+        else:
+            top = self.pdf.get_y()
+            draw_ternary_chart(self.pdf, x=25, y=top, width=160, height=140, average=scores,
+                               shading=True, marker="dot", legend=False)
+            self.pdf.set_y(top + 140)
+            self.pdf.ln(10)
             
         # Perspective title
         self.pdf.set_font("Arial", size=14)
@@ -79,27 +121,17 @@ def create_first_page(self, perspective: str, scores: List[float], plot_image_pa
 
     def add_category_analysis(self, category_responses: Dict[str, str]):
         """Add the category analysis on a new page"""
-        self.pdf.add_page()
-        self.pdf.set_font("Arial", style="B", size=18)
-        self.pdf.cell(0, 12, txt="Worldview Category Analysis", ln=True)
-        self.pdf.ln(5)
-
-        for category, response in category_responses.items():
-            self.pdf.set_font("Arial", style="B", size=13)
-            self.pdf.cell(0, 10, txt=category, ln=True)
-            
-            self.pdf.set_font("Arial", size=11)
-            self.pdf.multi_cell(0, 8, txt=response)
-            self.pdf.ln(5)
+        splice_fragment(self.pdf, category_analysis_fragment(tuple(category_responses.items())))
 
 def generate_pdf_report(perspective: str, scores: List[float], 
-                       category_responses: Dict[str, str], plot_image_path: str = None) -> bytes:
+                       category_responses: Dict[str, str], plot_image_path: str = None,
+                       plot_image: Optional[bytes] = None) -> bytes:
     """Generate the complete PDF report"""
     try:
         report = ModernityPDFReport()
         
         # Create first page with all elements in sequence
-        report.create_first_page(perspective, scores, plot_image_path)
+        report.create_first_page(perspective, scores, plot_image_path, plot_image)
         
         # Add category analysis on the second page
         report.add_category_analysis(category_responses)
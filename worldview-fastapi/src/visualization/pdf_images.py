@@ -0,0 +1,103 @@
+# src/visualization/pdf_images.py
+
+"""
+Embed images in FPDF documents straight from memory.
+
+FPDF 1.7 only reads images from files, but skips parsing for any name already
+in `pdf.images`. Registering a decoded image under a content-hash name lets a
+chart go from matplotlib to the PDF without touching the filesystem, and
+avoids FPDF's slow per-row handling of PNGs with an alpha channel.
+
+Images are stored according to an output profile: the default 'screen'
+profile downsamples to the displayed size and quantizes to a small palette,
+which is most of the size of a report.
+"""
+
+import hashlib
+import io
+import os
+import zlib
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from fpdf import FPDF
+
+class ImageProfile(NamedTuple):
+    """How embedded images are stored"""
+    dpi: int  # Pixels per inch at the size the image is displayed
+    colors: int = 0  # Palette size; 0 keeps full RGB
+
+OUTPUT_PROFILES = {
+    # Served for download: plenty for a screen or an office printer
+    "screen": ImageProfile(dpi=120, colors=64),
+    # Full colour at print resolution
+    "print": ImageProfile(dpi=200),
+    # Images exactly as rendered
+    "original": ImageProfile(dpi=0),
+}
+
+def output_profile(name: Optional[str] = None) -> ImageProfile:
+    """Named profile, defaulting to PDF_OUTPUT_PROFILE (or 'screen')"""
+    name = name or os.getenv('PDF_OUTPUT_PROFILE', 'screen')
+    return OUTPUT_PROFILES.get(name, OUTPUT_PROFILES["screen"])
+
+def figure_png(figure, dpi: int = 150) -> bytes:
+    """Render a matplotlib figure to PNG bytes in memory"""
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+def image_info(png_bytes: bytes, display_width: float = 0, profile: Optional[ImageProfile] = None) -> dict:
+    """
+    FPDF image record for PNG bytes, flattened onto white.
+
+    With a display width (mm) the image is downsampled to the profile's dpi at
+    that width, and with a palette size it is quantized to an indexed image.
+    """
+    from PIL import Image
+
+    profile = profile or output_profile()
+    image = Image.open(io.BytesIO(png_bytes))
+    if image.mode != 'RGB':
+        rgba = image.convert('RGBA')
+        image = Image.new('RGB', rgba.size, (255, 255, 255))
+        image.paste(rgba, mask=rgba.getchannel('A'))
+
+    if display_width and profile.dpi:
+        width = round(display_width / 25.4 * profile.dpi)
+        if width < image.width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+
+    info = {
+        'w': image.width,
+        'h': image.height,
+        'bpc': 8,
+        'f': 'FlateDecode'
+    }
+    if profile.colors:
+        image = image.quantize(profile.colors, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+        used = image.getextrema()[1] + 1
+        info['cs'] = 'Indexed'
+        info['pal'] = bytes(image.getpalette()[:3 * used])
+    else:
+        info['cs'] = 'DeviceRGB'
+    info['data'] = zlib.compress(image.tobytes(), 9)
+    return info
+
+def embed_png(pdf: "FPDF", png_bytes: bytes, x=None, y=None, w=0, h=0,
+              profile: Optional[ImageProfile] = None):
+    """
+    Place PNG bytes on the current page, sized for the profile.
+
+    Images are named by content and profile, so an image placed more than once
+    is stored once.
+    """
+    profile = profile or output_profile()
+    digest = hashlib.sha1(png_bytes + repr((w, profile)).encode()).hexdigest()
+    name = f"{digest}.png"
+    if name not in pdf.images:
+        info = image_info(png_bytes, display_width=w, profile=profile)
+        info['i'] = len(pdf.images) + 1
+        pdf.images[name] = info
+    pdf.image(name, x=x, y=y, w=w, h=h)
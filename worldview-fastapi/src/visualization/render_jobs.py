@@ -0,0 +1,50 @@
+# src/visualization/render_jobs.py
+
+"""
+CPU-bound rendering jobs run in the render pool's worker processes.
+
+Everything here must be a picklable top-level function taking plain data.
+The renderers (fpdf, matplotlib) are imported inside the jobs, so the web
+process never loads them.
+"""
+
+import base64
+import hashlib
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from src.visualization.pdf_images import output_profile
+from src.visualization.report_cache import ReportCache
+
+logger = logging.getLogger(__name__)
+
+def render_chart_job(scores: Tuple[float, float, float], fmt: str) -> bytes:
+    """Render a chart from normalized scores"""
+    from src.visualization.ternary_chart import render_chart
+    return render_chart(scores, fmt)
+
+def pdf_cache_key(perspective: str, scores: List[float], category_responses: Dict[str, str],
+                  plot_image: Optional[str] = None) -> str:
+    """Report cache key; cheap enough to compute before deciding to render"""
+    if plot_image:
+        chart = [hashlib.sha256(plot_image.encode()).hexdigest(), output_profile()]
+    else:
+        chart = "vector"  # Drawn from the scores
+    return ReportCache.key(
+        perspective=perspective,
+        scores=[round(score, 1) for score in scores],
+        category_responses=category_responses,
+        chart=chart
+    )
+
+def render_pdf_job(perspective: str, scores: List[float], category_responses: Dict[str, str],
+                   plot_image: Optional[str] = None) -> bytes:
+    """Build the PDF report, embedding the uploaded plot image or drawing the chart as vectors"""
+    from src.visualization.pdf_generator import generate_pdf_report
+    img_data = base64.b64decode(plot_image.split(',')[1]) if plot_image else None
+    return generate_pdf_report(
+        perspective=perspective,
+        scores=scores,
+        category_responses=category_responses,
+        plot_image=img_data
+    )
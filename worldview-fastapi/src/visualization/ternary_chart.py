@@ -0,0 +1,131 @@
+# src/visualization/ternary_chart.py
+
+import hashlib
+import io
+import math
+from functools import lru_cache
+from importlib.metadata import version
+from typing import Sequence, Tuple
+
+# matplotlib itself is only imported to render, which happens in the render pool
+MATPLOTLIB_VERSION = version("matplotlib")
+
+# Bump when the drawing changes so cached charts and ETags are invalidated
+CHART_VERSION = "1"
+CHART_FORMATS = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+}
+
+# Triangle vertices in chart units (same layout as the browser TernaryPlot)
+TOP = (0.5, math.sqrt(3) / 2)  # Modern
+LEFT = (0.0, 0.0)              # PostModern
+RIGHT = (1.0, 0.0)             # PreModern
+
+COLORS = {
+    'point': '#FF0000',
+    'grid': '#FF0000',
+    'boundary': '#FF0000',
+    'strong': '#90EE90',
+    'moderate': '#E8EB10',
+    'border': '#000000'
+}
+
+def normalize_scores(scores: Sequence[float]) -> Tuple[float, float, float]:
+    """
+    Validate [PreModern, Modern, PostModern] scores and round them to one decimal,
+    the precision used everywhere else, so equivalent inputs share one cache entry.
+    """
+    if len(scores) != 3:
+        raise ValueError("Expected three scores: PreModern, Modern, PostModern")
+    if not all(math.isfinite(score) for score in scores):
+        raise ValueError("Scores must be finite numbers")
+    if any(score < 0 for score in scores):
+        raise ValueError("Scores must not be negative")
+    total = sum(scores)
+    if not math.isfinite(total):
+        raise ValueError("Scores are too large")
+    if total <= 0:
+        raise ValueError("Scores must not all be zero")
+    return tuple(round(score / total * 100, 1) for score in scores)
+
+def chart_etag(scores: Tuple[float, float, float], fmt: str) -> str:
+    """Strong ETag for a rendered chart, derived from its inputs so no rendering is needed to answer a 304"""
+    key = f"{CHART_VERSION}|{MATPLOTLIB_VERSION}|{fmt}|{scores[0]:.1f},{scores[1]:.1f},{scores[2]:.1f}"
+    return '"' + hashlib.sha256(key.encode()).hexdigest()[:32] + '"'
+
+def ternary_to_cartesian(pre: float, mod: float, post: float) -> Tuple[float, float]:
+    """Project [PreModern, Modern, PostModern] onto the chart triangle."""
+    total = pre + mod + post
+    x = (LEFT[0] * post + TOP[0] * mod + RIGHT[0] * pre) / total
+    y = (LEFT[1] * post + TOP[1] * mod + RIGHT[1] * pre) / total
+    return x, y
+
+def _point_on_edge(start, end, ratio):
+    return (start[0] + (end[0] - start[0]) * ratio, start[1] + (end[1] - start[1]) * ratio)
+
+def _draw_chart(ax, scores: Tuple[float, float, float]):
+    """Draw shading, grid, labels and the score point onto an axes."""
+    # Shading: strong (>70%) and moderate (50-70%) regions around each vertex
+    for vertex, edge1, edge2 in ((TOP, LEFT, RIGHT), (RIGHT, TOP, LEFT), (LEFT, TOP, RIGHT)):
+        p70_1, p70_2 = _point_on_edge(vertex, edge1, 0.3), _point_on_edge(vertex, edge2, 0.3)
+        p50_1, p50_2 = _point_on_edge(vertex, edge1, 0.5), _point_on_edge(vertex, edge2, 0.5)
+        ax.fill(*zip(vertex, p70_1, p70_2), color=COLORS['strong'], alpha=0.2, linewidth=0)
+        ax.fill(*zip(p70_1, p50_1, p50_2, p70_2), color=COLORS['moderate'], alpha=0.2, linewidth=0)
+
+    # 10% gridlines parallel to each edge
+    for i in range(1, 10):
+        ratio = i / 10
+        for start, end in (
+            (_point_on_edge(LEFT, TOP, ratio), _point_on_edge(RIGHT, TOP, ratio)),
+            (_point_on_edge(LEFT, RIGHT, ratio), _point_on_edge(TOP, RIGHT, ratio)),
+            (_point_on_edge(RIGHT, LEFT, ratio), _point_on_edge(TOP, LEFT, ratio)),
+        ):
+            ax.plot([start[0], end[0]], [start[1], end[1]], color=COLORS['grid'], linewidth=0.8, alpha=0.4)
+
+    # Category boundaries (the 50% mix triangle)
+    mix = [_point_on_edge(LEFT, RIGHT, 0.5), _point_on_edge(LEFT, TOP, 0.5), _point_on_edge(RIGHT, TOP, 0.5)]
+    ax.fill(*zip(*mix), fill=False, edgecolor=COLORS['boundary'], linewidth=1.5)
+
+    # Outline and vertex labels
+    ax.fill(*zip(LEFT, TOP, RIGHT), fill=False, edgecolor=COLORS['border'], linewidth=1.5)
+    ax.text(TOP[0], TOP[1] + 0.04, "Modern", ha='center', va='bottom', fontsize=14)
+    ax.text(LEFT[0] - 0.02, LEFT[1] - 0.04, "PostModern", ha='center', va='top', fontsize=14)
+    ax.text(RIGHT[0] + 0.02, RIGHT[1] - 0.04, "PreModern", ha='center', va='top', fontsize=14)
+
+    # The respondent's aggregate score
+    x, y = ternary_to_cartesian(*scores)
+    ax.scatter([x], [y], s=90, color=COLORS['point'], edgecolors='white', linewidths=2, zorder=4)
+    ax.text(0.5, -0.12, f"{scores[0]:.1f}, {scores[1]:.1f}, {scores[2]:.1f}",
+            ha='center', va='top', fontsize=12, color=COLORS['point'])
+
+@lru_cache(maxsize=256)
+def render_chart(scores: Tuple[float, float, float], fmt: str = "png") -> bytes:
+    """
+    Render the ternary chart for normalized scores.
+
+    Output is deterministic for a given matplotlib version, so the bytes can be
+    served with a strong ETag and shared between the chart and PDF routes.
+    """
+    if fmt not in CHART_FORMATS:
+        raise ValueError(f"Unsupported chart format: {fmt}")
+
+    import matplotlib
+    from matplotlib.figure import Figure
+
+    # The Figure API keeps rendering off pyplot's global state
+    fig = Figure(figsize=(8, 7))
+    ax = fig.add_axes([0.05, 0.1, 0.9, 0.85])
+    ax.set_xlim(-0.12, 1.12)
+    ax.set_ylim(-0.2, TOP[1] + 0.12)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    _draw_chart(ax, scores)
+
+    buffer = io.BytesIO()
+    with matplotlib.rc_context({'svg.hashsalt': CHART_VERSION, 'svg.fonttype': 'none'}):
+        if fmt == "svg":
+            fig.savefig(buffer, format="svg", metadata={'Date': None})
+        else:
+            fig.savefig(buffer, format="png", dpi=150, metadata={'Software': None})
+    return buffer.getvalue()
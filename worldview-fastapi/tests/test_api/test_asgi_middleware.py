@@ -0,0 +1,40 @@
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from src.api.asgi_middleware import CompressionMiddleware
+
+ETAG = '"chart-v1"'
+SVG = b"<svg>" + b"<path d='M0 0 L1 1'/>" * 100 + b"</svg>"
+
+def make_client():
+    """An app whose route matches If-None-Match by substring, like the chart routes."""
+    app = FastAPI()
+
+    @app.get("/chart.svg")
+    async def chart(request: Request):
+        if ETAG in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers={"ETag": ETAG})
+        return Response(SVG, media_type="image/svg+xml", headers={"ETag": ETAG})
+
+    app.add_middleware(CompressionMiddleware)
+    return TestClient(app)
+
+def test_compressed_response_has_its_own_etag():
+    """Test that a compressed body is not served under the identity body's strong ETag."""
+    response = make_client().get("/chart.svg", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip", "Large SVG should be compressed"
+    assert response.headers["etag"] == '"chart-v1-gzip"', "ETag should name the gzip representation"
+    assert "Accept-Encoding" in response.headers["vary"], "Response should vary on Accept-Encoding"
+    assert response.content == SVG, "Body should decompress to the original"
+
+def test_identity_response_keeps_the_route_etag():
+    """Test that uncompressed responses are left alone."""
+    response = make_client().get("/chart.svg", headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in response.headers, "Identity response should not be encoded"
+    assert response.headers["etag"] == ETAG, "Identity ETag should be unchanged"
+
+def test_revalidating_the_gzip_etag_gives_304():
+    """Test that the suffixed ETag still revalidates against a route that only knows its own ETag."""
+    response = make_client().get("/chart.svg", headers={"accept-encoding": "gzip",
+                                                        "if-none-match": '"chart-v1-gzip"'})
+    assert response.status_code == 304, "Client's gzip ETag should match"
+    assert response.headers["etag"] == '"chart-v1-gzip"', "304 should carry the tag the client holds"
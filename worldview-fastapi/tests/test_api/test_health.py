@@ -0,0 +1,41 @@
+import asyncio
+import threading
+
+from src.api.health import HealthMonitor
+
+def test_probe_is_not_restarted_while_a_timed_out_one_is_still_running():
+    """Test that a hung probe counts as failing without piling up more threadpool threads."""
+    release = threading.Event()
+    calls = []
+
+    def hanging_probe(timeout):
+        calls.append(timeout)
+        release.wait(5)
+        return {}
+
+    async def probe_twice():
+        monitor = HealthMonitor(interval=60, timeout=0.05)
+        monitor._probe = hanging_probe
+        await monitor.probe_once()
+        await monitor.probe_once()
+        release.set()
+        return monitor.status()
+
+    status = asyncio.run(probe_twice())
+    assert calls == [0.05], "The probe should be started once, with the monitor's timeout"
+    assert status["status"] == "unhealthy"
+    assert status["consecutive_failures"] == 2
+    assert status["error"] == "previous probe still running"
+
+def test_probe_runs_again_once_the_previous_one_returns():
+    """Test that a successful probe clears the way for the next one."""
+    async def probe_twice():
+        monitor = HealthMonitor(interval=60, timeout=1)
+        monitor._probe = lambda timeout: {"db_result": 1}
+        await monitor.probe_once()
+        await monitor.probe_once()
+        return monitor.status()
+
+    status = asyncio.run(probe_twice())
+    assert status["status"] == "healthy"
+    assert status["db_result"] == 1
@@ -0,0 +1,34 @@
+import atexit
+import logging
+import pytest
+from src.api.log_pipeline import UVICORN_LOGGERS, DroppingQueueHandler, configure_logging
+
+@pytest.fixture
+def restore_logging():
+    """Fixture to put the root and uvicorn loggers back as they were."""
+    loggers = [logging.getLogger()] + [logging.getLogger(name) for name in UVICORN_LOGGERS]
+    saved = [(logger, logger.handlers[:], logger.propagate, logger.level) for logger in loggers]
+    yield
+    for logger, handlers, propagate, level in saved:
+        logger.handlers[:] = handlers
+        logger.propagate = propagate
+        logger.setLevel(level)
+
+def test_uvicorn_logs_go_through_the_queue(restore_logging):
+    """Test that uvicorn's own stream handlers are replaced by propagation to the queue handler."""
+    access = logging.getLogger("uvicorn.access")
+    access.addHandler(logging.StreamHandler())
+    access.propagate = False
+
+    listener = configure_logging(level="INFO", payload_sample_rate=0)
+    try:
+        for name in UVICORN_LOGGERS:
+            logger = logging.getLogger(name)
+            assert logger.handlers == [], f"{name} should have no handlers of its own"
+            assert logger.propagate, f"{name} should propagate to the root logger"
+        root_handlers = logging.getLogger().handlers
+        assert len(root_handlers) == 1 and isinstance(root_handlers[0], DroppingQueueHandler), \
+            "The root logger should only enqueue records"
+    finally:
+        atexit.unregister(listener.stop)  # QueueListener.stop() may only run once
+        listener.stop()
@@ -0,0 +1,41 @@
+import gzip
+
+from starlette.requests import Request
+from src.api.prepared_json import PreparedJSON, accepted_encodings
+
+QUESTIONS = PreparedJSON({"questions": [{"id": i, "text": "Truth is discovered through evidence."} for i in range(40)]})
+
+def make_request(**headers) -> Request:
+    """A request with the given headers; underscores in names become dashes."""
+    return Request({"type": "http", "method": "GET", "path": "/api/questions",
+                    "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]})
+
+def test_gzip_variant_is_served_to_gzip_clients():
+    """Test that the precompressed gzip body is chosen and carries its own ETag."""
+    response = QUESTIONS.response(make_request(accept_encoding="gzip"))
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == QUESTIONS.etags["gzip"], "Each variant should have its own strong ETag"
+    assert gzip.decompress(response.body) == QUESTIONS.body
+
+def test_encodings_refused_with_q_zero_are_not_used():
+    """Test that q=0 rules an encoding out, including through a wildcard."""
+    assert accepted_encodings("gzip;q=0, br;q=0.5") == {"gzip": 0.0, "br": 0.5}
+    for header in ("gzip;q=0", "*;q=0", "gzip;q=0, br;q=0"):
+        response = QUESTIONS.response(make_request(accept_encoding=header))
+        assert "content-encoding" not in response.headers, f"{header} should get the identity body"
+        assert response.body == QUESTIONS.body
+        assert response.headers["etag"] == QUESTIONS.etags[None]
+
+def test_matching_etag_gives_304():
+    """Test that any of the body's ETags, weak or strong, revalidates without a body."""
+    for if_none_match in (QUESTIONS.etags[None], f'W/{QUESTIONS.etags["gzip"]}', f'"stale", {QUESTIONS.etags[None]}', "*"):
+        response = QUESTIONS.response(make_request(accept_encoding="gzip", if_none_match=if_none_match))
+        assert response.status_code == 304, f"{if_none_match} should match"
+        assert response.body == b""
+        assert "content-encoding" not in response.headers, "A 304 has no body to be encoded"
+
+def test_other_etag_gives_the_body():
+    """Test that a stale ETag is answered with the full response."""
+    response = QUESTIONS.response(make_request(if_none_match='"stale"'))
+    assert response.status_code == 200
+    assert response.body == QUESTIONS.body
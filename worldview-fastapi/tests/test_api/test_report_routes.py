@@ -0,0 +1,38 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api import report_jobs as report_jobs_module
+from src.api.report_jobs import report_key
+from src.api.routes import report_routes
+from src.visualization.report_cache import ReportCache
+
+PAYLOAD = {
+    "perspective": "Modern",
+    "scores": [20.0, 60.0, 20.0],
+    "category_responses": {},
+    "plot_image": None
+}
+
+def make_client(tmp_path, monkeypatch):
+    """An app with only the report routes, and a report cache of its own."""
+    monkeypatch.setattr(report_jobs_module, "report_cache", ReportCache(disk_dir=str(tmp_path)))
+    app = FastAPI()
+    app.include_router(report_routes.router, prefix="/api")
+    return TestClient(app)
+
+def test_report_rendered_by_another_worker_is_served_from_the_cache(tmp_path, monkeypatch):
+    """Test that polling a worker that never saw the job returns the PDF another worker cached."""
+    client = make_client(tmp_path, monkeypatch)
+    job_id = report_key(PAYLOAD)
+    # Written to the shared disk tier by another worker's render
+    ReportCache(disk_dir=str(tmp_path)).put(job_id, b"%PDF-1.4 report")
+
+    response = client.get(f"/api/reports/{job_id}")
+    assert response.status_code == 200, "Finished report should be found by its job id"
+    assert response.content == b"%PDF-1.4 report"
+    assert response.headers["content-type"] == "application/pdf"
+
+def test_unknown_report_job_is_404(tmp_path, monkeypatch):
+    """Test that ids that are not cached, or are not cache keys at all, are not found."""
+    client = make_client(tmp_path, monkeypatch)
+    assert client.get(f"/api/reports/{report_key(PAYLOAD)}").status_code == 404
+    assert client.get("/api/reports/..%2F..%2Fetc").status_code == 404
@@ -0,0 +1,49 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from src.api.static_assets import IMMUTABLE, StaticAssets
+
+SCRIPT = b"export const TernaryPlot = () => null;\n" * 40
+
+def make_client(tmp_path):
+    """An app serving a small static directory the way main.py does."""
+    (tmp_path / "components").mkdir()
+    (tmp_path / "components" / "TernaryPlot.jsx").write_bytes(SCRIPT)
+    (tmp_path / "__init__.py").write_text("")
+    assets = StaticAssets(tmp_path)
+    app = FastAPI()
+
+    @app.get("/static/{path:path}")
+    async def static_file(path: str, request: Request):
+        return assets.response(path, request)
+
+    return assets, TestClient(app)
+
+def test_hashed_path_is_immutable(tmp_path):
+    """Test that the content-hashed URL is cached for a year and the plain path is revalidated."""
+    assets, client = make_client(tmp_path)
+    url = assets.url("components/TernaryPlot.jsx")
+    assert url != "/static/components/TernaryPlot.jsx", "url() should point at the hashed path"
+
+    hashed = client.get(url)
+    assert hashed.status_code == 200
+    assert hashed.headers["cache-control"] == IMMUTABLE
+    assert hashed.headers["content-type"].startswith("text/javascript"), ".jsx should be served as JavaScript"
+    assert hashed.content == SCRIPT
+
+    plain = client.get("/static/components/TernaryPlot.jsx")
+    assert plain.status_code == 200
+    assert plain.headers["cache-control"] == "no-cache", "Plain paths change on deploy and must not be immutable"
+
+def test_plain_path_revalidates_with_304(tmp_path):
+    """Test that a matching ETag on the plain path gives 304."""
+    _, client = make_client(tmp_path)
+    first = client.get("/static/components/TernaryPlot.jsx")
+    second = client.get("/static/components/TernaryPlot.jsx", headers={"if-none-match": first.headers["etag"]})
+    assert second.status_code == 304
+
+def test_unknown_paths_are_404(tmp_path):
+    """Test that missing files, source files and directory escapes are not found."""
+    _, client = make_client(tmp_path)
+    for path in ("/static/missing.js", "/static/__init__.py", "/static/components", "/static/../main.py"):
+        response = client.get(path)
+        assert response.status_code == 404, f"{path} should not be served"
@@ -0,0 +1,27 @@
+import json
+
+from src.data.ternary_histogram import TernaryHistogram
+
+def test_flush_without_file_or_seed_keeps_submissions_pending(tmp_path):
+    """Test that a seedless flush does not create a file that would block seeding from the database."""
+    path = tmp_path / "histogram.json"
+    histogram = TernaryHistogram(steps=10, path=str(path))
+    histogram.add(50, 30, 20)
+
+    assert histogram.flush() is False, "Nothing should be written without a file or a seed"
+    assert not path.exists(), "A histogram of only this worker's counts should not be written"
+
+    assert histogram.flush(seed=lambda: [(20, 30, 50, 4)]) is True
+    counts = json.loads(path.read_text())["counts"]
+    assert sum(counts) == 4, "Pending submissions are already in the seed and should not be counted again"
+
+def test_flush_merges_pending_into_existing_file(tmp_path):
+    """Test that submissions are added to the counts already in the shared file."""
+    path = tmp_path / "histogram.json"
+    TernaryHistogram(steps=10, path=str(path)).flush(seed=lambda: [(20, 30, 50, 4)])
+
+    histogram = TernaryHistogram(steps=10, path=str(path))
+    histogram.add(50, 30, 20)
+    histogram.add(50, 30, 20)
+    assert histogram.flush() is True
+    assert sum(json.loads(path.read_text())["counts"]) == 6, "Both submissions should be merged into the file"
@@ -0,0 +1,31 @@
+import pytest
+from fpdf import FPDF
+from pydantic import ValidationError
+from src.api.routes.pdf_routes import PDFGenerationRequest
+from src.visualization.pdf_chart import draw_ternary_chart, plottable
+from src.visualization.pdf_generator import generate_pdf_report
+
+@pytest.mark.parametrize("scores", [
+    [0, 0, 0],
+    [float("nan"), 20, 70],
+    [1e308, 1e308, 1],
+])
+def test_unplottable_average_is_left_off_the_chart(scores):
+    """Test that scores with no position on the triangle draw the chart without a marker instead of failing."""
+    assert not plottable(scores)
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+    draw_ternary_chart(pdf, x=25, y=20, width=160, height=140, average=scores, points=[scores, [40, 35, 25]])
+    assert "nan" not in pdf.pages[1], "No marker should be drawn at a non-finite position"
+
+def test_all_zero_scores_still_produce_a_report():
+    """Test that the PDF report no longer divides by zero for all-zero scores."""
+    pdf_bytes = generate_pdf_report(perspective="Undefined", scores=[0, 0, 0], category_responses={})
+    assert pdf_bytes.startswith(b"%PDF"), "Report should render without the chart marker"
+
+def test_report_request_rejects_unplottable_scores():
+    """Test that /api/generate-pdf and /api/reports answer 422 rather than rendering all-zero scores."""
+    with pytest.raises(ValidationError):
+        PDFGenerationRequest(perspective="Modern", scores=[0, 0, 0], category_responses={})
+    assert PDFGenerationRequest(perspective="Modern", scores=[20, 60, 20], category_responses={}).scores == [20, 60, 20]
@@ -0,0 +1,16 @@
+import pytest
+from src.visualization.ternary_chart import normalize_scores
+
+def test_scores_are_normalized_to_percentages():
+    """Test that scores are scaled to sum to 100 and rounded to one decimal."""
+    assert normalize_scores([2, 1, 1]) == (50.0, 25.0, 25.0), "Scores should be percentages of their total"
+
+@pytest.mark.parametrize("scores", [
+    [float("nan"), 20, 70],
+    [float("inf"), 20, 70],
+    [1e308, 1e308, 1],
+])
+def test_non_finite_scores_are_rejected(scores):
+    """Test that NaN, infinite and overflowing scores raise ValueError rather than reaching the renderer."""
+    with pytest.raises(ValueError):
+        normalize_scores(scores)